@@ -0,0 +1,199 @@
+import csv
+import logging
+import os
+import time
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+
+# Standard column order
+STANDARD_FIELDS = [
+    "id",
+    "url",
+    "phone",
+    "title",
+    "price",
+    "year",
+    "make",
+    "model",
+    "mileage",
+    "fuel_type",
+    "transmission",
+    "engine_size",
+    "body_type",
+    "colour",
+    "nct_expiry",
+    "county",
+    "seller_type",
+    "doors",
+    "seats",
+    "horsepower",
+    "engine_description",
+    "trim",
+]
+
+# DoneDeal labels -> standard columns
+FIELD_MAPPING = {
+    "Make": "make",
+    "Model": "model",
+    "Year": "year",
+    "Mileage": "mileage",
+    "Fuel Type": "fuel_type",
+    "Transmission": "transmission",
+    "Engine Size": "engine_size",
+    "Body Type": "body_type",
+    "Colour": "colour",
+    "Doors": "doors",
+    "Seats": "seats",
+    "NCT Expiry": "nct_expiry",
+    "County": "county",
+    "Seller Type": "seller_type",
+    "Power": "horsepower",
+    "Trim Level": "trim",
+}
+
+
+def normalize_ad(ad):
+    """Map a scraped ad to standard column names"""
+    normalized = {
+        "id": ad.get("id", ""),
+        "url": ad.get("url", ""),
+        "phone": ad.get("phone", "Hidden"),
+        "title": ad.get("title", ""),
+        "price": ad.get("price", ""),
+    }
+
+    for donedeal_key, standard_key in FIELD_MAPPING.items():
+        if donedeal_key in ad:
+            normalized[standard_key] = ad[donedeal_key]
+
+    for key, value in ad.items():
+        if key not in ["id", "url", "phone", "title", "price"] and key not in FIELD_MAPPING:
+            clean_key = key.lower().replace(" ", "_").replace("/", "_")
+            normalized[clean_key] = value
+
+    return normalized
+
+
+def order_fields(keys):
+    """Standard columns first, then extras alphabetically"""
+    extra_fields = sorted(k for k in keys if k not in STANDARD_FIELDS)
+    return [f for f in STANDARD_FIELDS if f in keys] + extra_fields
+
+
+class AdWriter:
+    """Long-lived CSV writer with a stable, growing column set"""
+
+    def __init__(self, filename, batch_size=50, flush_interval=10.0, parquet=False, append=True):
+        self.filename = filename
+        self.append = append
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.parquet = parquet
+
+        if parquet and pa is None:
+            logging.warning("pyarrow not installed. Parquet output disabled.")
+            self.parquet = False
+
+        self.fieldnames = []
+        self.rows_written = 0
+        self._buffer = []
+        self._last_flush = time.monotonic()
+        self._file = None
+        self._writer = None
+        self._open()
+
+    def _open(self):
+        """Open for append, picking up the header of an existing file"""
+        if not self.append and os.path.exists(self.filename):
+            os.remove(self.filename)
+
+        if os.path.exists(self.filename) and os.path.getsize(self.filename) > 0:
+            with open(self.filename, newline='', encoding='utf-8') as f:
+                header = next(csv.reader(f), [])
+            if header[:1] == ["id"]:
+                self.fieldnames = header
+            else:
+                # Headerless files from older runs can't be extended safely
+                legacy_path = self.filename + ".legacy"
+                os.replace(self.filename, legacy_path)
+                logging.warning(f"{self.filename} has no header. Moved it to {legacy_path}.")
+
+        self._file = open(self.filename, 'a', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+
+    def write(self, ad):
+        """Buffer one ad, flushing on batch size or interval"""
+        self._buffer.append(normalize_ad(ad))
+        if len(self._buffer) >= self.batch_size or time.monotonic() - self._last_flush >= self.flush_interval:
+            self.flush()
+
+    def flush(self):
+        """Write buffered rows, widening the header if new columns appeared"""
+        self._last_flush = time.monotonic()
+        if not self._buffer:
+            return
+
+        keys = set(self.fieldnames)
+        for row in self._buffer:
+            keys.update(row.keys())
+
+        if len(keys) > len(self.fieldnames):
+            self._rewrite(order_fields(keys))
+
+        self._writer.writerows(self._buffer)
+        self._file.flush()
+        self.rows_written += len(self._buffer)
+        self._buffer = []
+
+    def _rewrite(self, fieldnames):
+        """Rewrite the file under a wider header"""
+        self._file.close()
+
+        rows = []
+        if self.fieldnames:
+            with open(self.filename, newline='', encoding='utf-8') as f:
+                rows = list(csv.DictReader(f))
+
+        tmp_path = self.filename + ".tmp"
+        with open(tmp_path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=fieldnames, extrasaction='ignore')
+            writer.writeheader()
+            writer.writerows(rows)
+        os.replace(tmp_path, self.filename)
+
+        if self.fieldnames:
+            logging.info(f"Added {len(fieldnames) - len(self.fieldnames)} column(s) to {self.filename}")
+        self.fieldnames = fieldnames
+        self._file = open(self.filename, 'a', newline='', encoding='utf-8')
+        self._writer = csv.DictWriter(self._file, fieldnames=self.fieldnames, extrasaction='ignore')
+
+    def close(self):
+        """Flush, close, and write Parquet if enabled"""
+        if self._file is None:
+            return
+        self.flush()
+        self._file.close()
+        self._file = None
+
+        if self.parquet and self.fieldnames:
+            parquet_path = os.path.splitext(self.filename)[0] + ".parquet"
+            # Every column as string, the CSV has no typed schema
+            table = pa_csv.read_csv(
+                self.filename,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in self.fieldnames}
+                ),
+            )
+            pq.write_table(table, parquet_path)
+            logging.info(f"Wrote {table.num_rows} rows to {parquet_path}")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -1,18 +1,180 @@
+import asyncio
 import logging
 import os
 import time
 import re
+from collections import Counter
+from contextlib import asynccontextmanager
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 from playwright.async_api import async_playwright, Browser, BrowserContext, Page
 
 load_dotenv()
 
+BASE_URL = "https://www.donedeal.ie"
+
+PHONE_BUTTON = 'button[data-testid="view-phone-number"]'
+PHONE_PATTERN = r'(08[35679]\s?\d{7})|(\+?353\s?8[35679]\s?\d{7})'
+
+# Page-type readiness conditions
+READY_SELECTORS = {
+    "next_data": "script#__NEXT_DATA__",
+    "card_list": 'ul[data-testid="card-list"]',
+    "phone_button": PHONE_BUTTON,
+}
+
+# Bot-wall fingerprints; a context that hits one is recycled
+BLOCK_MARKERS = ("captcha-delivery.com", "cf-chl-", "Access Denied", "Pardon Our Interruption")
+
+
+# Resource types never needed for DOM, __NEXT_DATA__ or phone reveal
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+
+# Ad-tech and tracker hosts (suffix match)
+BLOCKED_HOSTS = (
+    "doubleclick.net", "googlesyndication.com", "googletagservices.com", "googletagmanager.com",
+    "google-analytics.com", "adservice.google.com", "amazon-adsystem.com", "adnxs.com",
+    "criteo.com", "criteo.net", "pubmatic.com", "rubiconproject.com", "casalemedia.com",
+    "openx.net", "taboola.com", "outbrain.com", "scorecardresearch.com", "facebook.net",
+    "facebook.com", "hotjar.com", "clarity.ms", "bing.com", "tiktok.com", "nr-data.net",
+    "newrelic.com", "sentry.io", "segment.io", "segment.com", "mixpanel.com", "optimizely.com",
+)
+
+# Hosts phone reveal depends on: the site, consent SDK and reCAPTCHA
+ALLOWED_HOSTS = (
+    "donedeal.ie", "privacy-center.org", "didomi.io", "recaptcha.net", "gstatic.com", "www.google.com",
+)
+
+
+def phone_from_payload(data):
+    """First phone-looking value in a reveal/contact JSON payload"""
+    if isinstance(data, dict):
+        for key in ("phoneNumber", "phone", "number", "mobile"):
+            value = data.get(key)
+            if isinstance(value, str) and re.search(r'\d{6,}', value.replace(" ", "")):
+                return value
+        data = list(data.values())
+    if isinstance(data, list):
+        for item in data:
+            found = phone_from_payload(item)
+            if found:
+                return found
+    return None
+
+
+def _host_matches(host, suffixes):
+    return any(host == s or host.endswith("." + s) for s in suffixes)
+
+
+class ResourceProfile:
+    """Route-interception rules with blocked/allowed traffic counters"""
+    
+    def __init__(self, blocked_types=BLOCKED_RESOURCE_TYPES, blocked_hosts=BLOCKED_HOSTS, allowed_hosts=ALLOWED_HOSTS):
+        self.blocked_types = set(blocked_types)
+        self.blocked_hosts = tuple(blocked_hosts)
+        self.allowed_hosts = tuple(allowed_hosts)
+        
+        # Aborted requests never download, so only their count is known
+        self.blocked_requests = Counter()
+        self.allowed_requests = 0
+        self.allowed_bytes = 0
+    
+    def should_block(self, resource_type, url):
+        """Block heavy resource types anywhere, and third-party trackers unless allowlisted"""
+        if resource_type in self.blocked_types:
+            return True
+        host = urlparse(url).hostname or ""
+        if _host_matches(host, self.allowed_hosts):
+            return False
+        return _host_matches(host, self.blocked_hosts)
+    
+    async def handle_route(self, route):
+        """Playwright route handler"""
+        request = route.request
+        if self.should_block(request.resource_type, request.url):
+            self.blocked_requests[request.resource_type] += 1
+            await route.abort()
+        else:
+            await route.continue_()
+    
+    async def on_request_finished(self, request):
+        """Count bytes that actually went over the proxy"""
+        try:
+            sizes = await request.sizes()
+            self.allowed_requests += 1
+            self.allowed_bytes += sizes["responseBodySize"] + sizes["responseHeadersSize"]
+        except Exception:
+            pass
+    
+    def report(self):
+        """Traffic summary"""
+        return {
+            "allowed_requests": self.allowed_requests,
+            "allowed_bytes": self.allowed_bytes,
+            "blocked_requests": sum(self.blocked_requests.values()),
+            "blocked_by_type": dict(self.blocked_requests),
+        }
+
+
+def to_playwright_cookies(cookies):
+    """Browser-extension cookie export -> Playwright add_cookies format"""
+    same_site = {"lax": "Lax", "strict": "Strict", "none": "None", "no_restriction": "None"}
+    result = []
+    for c in cookies or []:
+        cookie = {
+            "name": c["name"],
+            "value": c["value"],
+            "domain": c.get("domain", ".donedeal.ie"),
+            "path": c.get("path", "/"),
+            "secure": c.get("secure", True),
+            "httpOnly": c.get("httpOnly", False),
+        }
+        expires = c.get("expirationDate") or c.get("expires")
+        if expires and expires > 0:
+            cookie["expires"] = float(expires)
+        if str(c.get("sameSite", "")).lower() in same_site:
+            cookie["sameSite"] = same_site[str(c["sameSite"]).lower()]
+        result.append(cookie)
+    return result
+
+
+class PooledContext:
+    """Browser context with usage and health counters"""
+    
+    def __init__(self, context: BrowserContext):
+        self.context = context
+        self.pages_served = 0
+        self.in_use = 0
+        self.errors = 0
+        self.blocked = False
+        self.retired = False
+
+
 class BrowserClient:
     """Playwright browser client"""
     
-    def __init__(self, headless=True, user_data_dir="browser_data"):
+    def __init__(self, headless=True, user_data_dir="browser_data", ready_timeout=10000,
+                 cookies=None, storage_state_path="browser_state.json", pool_size=2,
+                 max_pages_per_context=50, max_errors_per_context=3, block_resources=True,
+                 resource_profile=None, reveal_timeout=10000):
         self.headless = headless
         self.user_data_dir = user_data_dir
+        # Cap (ms) on waiting for a readiness condition
+        self.ready_timeout = ready_timeout
+        # Cap (ms) on waiting for the phone reveal
+        self.reveal_timeout = reveal_timeout
+        
+        # Session warm-up: saved storage state wins over seed cookies
+        self.cookies = to_playwright_cookies(cookies)
+        self.storage_state_path = storage_state_path
+        
+        # Context pool
+        self.pool_size = pool_size
+        self.max_pages_per_context = max_pages_per_context
+        self.max_errors_per_context = max_errors_per_context
+        
+        # Lightweight page profile; None loads everything
+        self.resource_profile = (resource_profile or ResourceProfile()) if block_resources else None
         
         # Proxy config
         self.decodo_host = os.getenv("DECODO_PROXY_HOST")
@@ -26,14 +188,26 @@ class BrowserClient:
         # Browser state
         self._playwright = None
         self._browser: Browser = None
-        self._context: BrowserContext = None
+        self._pool: list[PooledContext] = []
+        self._launch_lock = asyncio.Lock()
+        # Signalled when a replacement context joins the pool
+        self._pool_changed = asyncio.Condition()
+        self._replacements: set[asyncio.Task] = set()
         self._session_start_time = None
+        self.contexts_recycled = 0
         
     async def _ensure_browser(self):
-        """Init browser if needed"""
-        if self._browser and self._context:
-            return
-            
+        """Init browser and context pool if needed"""
+        async with self._launch_lock:
+            if self._browser:
+                if self._browser.is_connected():
+                    return
+                logging.warning("Browser disconnected. Relaunching...")
+                await self.close()
+            await self._launch()
+    
+    async def _launch(self):
+        """Start Chromium and warm the context pool"""
         host_clean = self.decodo_host.replace("http://", "").replace("https://", "")
         proxy_config = {
             "server": f"http://{host_clean}:{self.decodo_port}",
@@ -56,61 +230,200 @@ class BrowserClient:
             ]
         )
         
-        # Stealth context
-        self._context = await self._browser.new_context(
+        self._pool = [await self._new_context() for _ in range(self.pool_size)]
+        
+        self._session_start_time = time.time()
+        logging.info(f"Browser session initialized with {len(self._pool)} warm context(s)")
+    
+    async def _new_context(self) -> PooledContext:
+        """Stealth context seeded with the stored session and past the consent banner"""
+        storage_state = None
+        if self.storage_state_path and os.path.exists(self.storage_state_path):
+            storage_state = self.storage_state_path
+        
+        context = await self._browser.new_context(
             viewport={"width": 1920, "height": 1080},
             user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36",
             locale="en-IE",
             timezone_id="Europe/Dublin",
             permissions=["geolocation"],
-            geolocation={"latitude": 53.3498, "longitude": -6.2603}
+            geolocation={"latitude": 53.3498, "longitude": -6.2603},
+            storage_state=storage_state
         )
         
         # Hide webdriver
-        await self._context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
+        await context.add_init_script("Object.defineProperty(navigator, 'webdriver', {get: () => undefined})")
         
-        self._session_start_time = time.time()
-        logging.info("Browser session initialized successfully")
+        if self.resource_profile:
+            await context.route("**/*", self.resource_profile.handle_route)
+            context.on("requestfinished", self.resource_profile.on_request_finished)
+        
+        if not storage_state and self.cookies:
+            try:
+                await context.add_cookies(self.cookies)
+            except Exception as e:
+                logging.warning(f"Could not apply stored cookies: {e}")
+        
+        await self._warm_up(context)
+        return PooledContext(context)
     
-    async def fetch_html_and_phone(self, url: str, reveal_phone: bool = True) -> tuple[str, str]:
-        """Fetch page and reveal phone"""
+    async def _warm_up(self, context: BrowserContext):
+        """Open the home page once and accept consent"""
+        page = await context.new_page()
+        try:
+            await page.goto(BASE_URL, timeout=60000, wait_until="domcontentloaded")
+            await self._accept_consent(page)
+        except Exception as e:
+            logging.warning(f"Context warm-up failed: {e}")
+        finally:
+            await page.close()
+    
+    async def _accept_consent(self, page: Page):
+        """Click the consent banner if it is showing"""
+        try:
+            cookie_btn = page.locator("#didomi-notice-agree-button")
+            await cookie_btn.wait_for(state="visible", timeout=2000)
+            await cookie_btn.click()
+            logging.info("Clicked cookie consent button")
+        except Exception:
+            pass
+    
+    @asynccontextmanager
+    async def _lease(self, counts_as_page=True):
+        """Borrow the least-loaded live context, recycling it when worn out"""
         await self._ensure_browser()
+        async with self._pool_changed:
+            # Every context may be retired at once (a block hits them all); wait for a replacement
+            await self._pool_changed.wait_for(lambda: self._live_contexts() or not self._replacements)
+            live = self._live_contexts()
+            if not live:
+                # Replacements failed; warm one here rather than fail the lease
+                self._pool.append(await self._new_context())
+                live = self._live_contexts()
+            # Prefer contexts with page budget left, then the least busy
+            pooled = min(
+                live,
+                key=lambda p: (p.pages_served + p.in_use >= self.max_pages_per_context, p.in_use),
+            )
+            pooled.in_use += 1
+        try:
+            yield pooled
+        finally:
+            pooled.in_use -= 1
+            if counts_as_page:
+                pooled.pages_served += 1
+            
+            if not pooled.retired:
+                if pooled.blocked:
+                    await self._recycle(pooled, "block detected")
+                elif pooled.errors >= self.max_errors_per_context:
+                    await self._recycle(pooled, f"{pooled.errors} consecutive errors")
+                elif pooled.pages_served >= self.max_pages_per_context:
+                    await self._recycle(pooled, f"{pooled.pages_served} pages served")
+            elif pooled.in_use == 0:
+                await self._close_context(pooled)
+    
+    def _live_contexts(self) -> list[PooledContext]:
+        return [p for p in self._pool if not p.retired]
+    
+    async def _recycle(self, pooled: PooledContext, reason: str):
+        """Retire a context and warm its replacement in the background"""
+        pooled.retired = True
+        logging.info(f"Recycling browser context ({reason})")
+        if not pooled.blocked:
+            # Carry the session forward; a blocked one is discarded
+            await self._save_storage_state(pooled)
+        self._pool.remove(pooled)
+        self.contexts_recycled += 1
+        if pooled.in_use == 0:
+            await self._close_context(pooled)
         
-        page: Page = await self._context.new_page()
+        task = asyncio.create_task(self._add_replacement(self._browser))
+        self._replacements.add(task)
+        task.add_done_callback(self._replacements.discard)
+    
+    async def _add_replacement(self, browser: Browser):
+        """Warm a new context and hand it to waiting leases"""
+        replacement = None
+        try:
+            replacement = await self._new_context()
+        except Exception as e:
+            logging.warning(f"Could not warm a replacement context: {e}")
+        finally:
+            async with self._pool_changed:
+                # Drop the task first so waiters see it finished
+                self._replacements.discard(asyncio.current_task())
+                if replacement and self._browser is browser:
+                    self._pool.append(replacement)
+                elif replacement:
+                    # The browser was closed or relaunched meanwhile
+                    await self._close_context(replacement)
+                self._pool_changed.notify_all()
+    
+    async def _close_context(self, pooled: PooledContext):
+        """Close a context, ignoring one that is already gone"""
+        try:
+            await pooled.context.close()
+        except Exception:
+            pass
+    
+    async def _save_storage_state(self, pooled: PooledContext):
+        """Persist cookies and local storage for the next run"""
+        if not self.storage_state_path:
+            return
+        try:
+            await pooled.context.storage_state(path=self.storage_state_path)
+        except Exception as e:
+            logging.warning(f"Could not save storage state: {e}")
+    
+    def _is_blocked(self, status, html_content):
+        """Bot wall by status code or page fingerprint"""
+        if status in (403, 429):
+            return True
+        return any(marker in html_content[:20000] for marker in BLOCK_MARKERS)
+    
+    async def fetch_html_and_phone(self, url: str, reveal_phone: bool = True, ready=None) -> tuple[str, str]:
+        """Fetch page and reveal phone"""
+        if ready is None:
+            ready = "phone_button" if reveal_phone else ("card_list", "next_data")
+        
+        async with self._lease() as pooled:
+            return await self._fetch_in_context(pooled, url, reveal_phone, ready)
+    
+    async def _fetch_in_context(self, pooled: PooledContext, url: str, reveal_phone: bool, ready) -> tuple[str, str]:
+        """Load one page in a leased context"""
+        page: Page = await pooled.context.new_page()
         phone_number = "Hidden"
         
         try:
             logging.info(f"Fetching HTML from: {url}")
-            await page.goto(url, timeout=90000, wait_until="domcontentloaded")
-            await page.wait_for_timeout(3000)
+            response = await page.goto(url, timeout=90000, wait_until="domcontentloaded")
+            await self._wait_until_ready(page, ready)
             
-            # 10s pause
-            logging.info("10s pause")
-            await page.wait_for_timeout(10000)
-            
-            # Handle cookies
-            try:
-                cookie_btn = page.locator("#didomi-notice-agree-button")
-                if await cookie_btn.is_visible(timeout=2000):
-                    await cookie_btn.click()
-                    await page.wait_for_timeout(1000)
-                    logging.info("Clicked cookie consent button")
-            except Exception:
-                pass
+            # Warm contexts have consented already; this catches expired consent
+            if await page.locator("#didomi-notice-agree-button").count():
+                await self._accept_consent(page)
             
             # Grab HTML
             html_content = await page.content()
             logging.info(f"fetched HTML ({len(html_content)} chars)")
             
+            if self._is_blocked(response.status if response else None, html_content):
+                logging.warning(f"Blocked on {url}")
+                pooled.blocked = True
+                return None, "Error"
+            
             # Reveal phone
             if reveal_phone:
                 logging.info("phone reveal start")
                 phone_number = await self._extract_phone_from_page(page, url)
             
+            pooled.errors = 0
             return html_content, phone_number
             
         except Exception as e:
             logging.error(f"Failed to fetch from {url}: {e}")
+            pooled.errors += 1
             
             # Screenshot on error
             try:
@@ -126,22 +439,88 @@ class BrowserClient:
         finally:
             await page.close()
     
-    async def fetch_html(self, url: str, wait_time: int = 3000) -> str:
+    async def fetch_html(self, url: str, ready=("card_list", "next_data")) -> str:
         """Fetch HTML without phone reveal"""
-        html, _ = await self.fetch_html_and_phone(url, reveal_phone=False)
+        html, _ = await self.fetch_html_and_phone(url, reveal_phone=False, ready=ready)
         return html
     
+    async def fetch_text(self, url: str) -> str:
+        """Fetch a URL through the context's HTTP client, without rendering"""
+        async with self._lease(counts_as_page=False) as pooled:
+            try:
+                response = await pooled.context.request.get(url, timeout=30000)
+                text = await response.text()
+                if self._is_blocked(response.status, text):
+                    logging.warning(f"Blocked on {url}")
+                    pooled.blocked = True
+                    return None
+                if not response.ok:
+                    logging.warning(f"HTTP {response.status} for {url}")
+                    return None
+                return text
+            except Exception as e:
+                logging.error(f"Failed to fetch from {url}: {e}")
+                pooled.errors += 1
+                return None
+    
+    async def _wait_until_ready(self, page: Page, ready):
+        """Wait until any readiness condition holds, capped by ready_timeout"""
+        conditions = [ready] if isinstance(ready, str) else list(ready)
+        selector = ", ".join(READY_SELECTORS[c] for c in conditions)
+        label = "/".join(conditions)
+        start = time.monotonic()
+        
+        try:
+            await page.wait_for_selector(selector, state="attached", timeout=self.ready_timeout)
+            logging.info(f"Page ready ({label}) after {time.monotonic() - start:.1f}s")
+        except Exception:
+            logging.warning(f"Page not ready ({label}) within {self.ready_timeout / 1000:.0f}s, continuing")
+    
     async def _extract_phone_from_page(self, page: Page, url: str) -> str:
         """Extract phone from loaded page"""
+        phone = await self._reveal_via_network(page)
+        if phone:
+            return phone
+        logging.info("No phone from reveal XHR, falling back to DOM")
+        return await self._reveal_via_dom(page, url)
+    
+    async def _reveal_via_network(self, page: Page) -> str:
+        """Click reveal once and read the phone from the phonereveal XHR"""
+        button = page.locator(f"{PHONE_BUTTON}:visible").first
         try:
-            # Click phone button
-            buttons = page.locator('button[data-testid="view-phone-number"]')
+            if not await button.count():
+                return None
+            async with page.expect_response(
+                lambda r: "phonereveal" in r.url.lower(), timeout=self.reveal_timeout
+            ) as response_info:
+                await button.scroll_into_view_if_needed()
+                await button.click(timeout=5000)
+            response = await response_info.value
+            
+            try:
+                phone = phone_from_payload(await response.json())
+            except Exception:
+                match = re.search(PHONE_PATTERN, await response.text())
+                phone = match.group(0) if match else None
+            
+            if phone:
+                logging.info(f"✓ Phone found via reveal XHR: {phone}")
+            return phone
+        except Exception as e:
+            logging.warning(f"Reveal XHR not captured: {e}")
+            return None
+    
+    async def _reveal_via_dom(self, page: Page, url: str) -> str:
+        """Click reveal and read the phone from the page"""
+        try:
+            buttons = page.locator(PHONE_BUTTON)
             count = await buttons.count()
-            clicked = False
+            # The network attempt may already have revealed it
+            clicked = await page.locator('a[href^="tel:"]').count() > 0
             
             logging.info(f"Found {count} phone button(s)")
             
-            for i in range(count):
+            for i in range(0 if clicked else count):
                 btn = buttons.nth(i)
                 try:
                     if await btn.is_visible(timeout=2000):
@@ -156,11 +535,10 @@ class BrowserClient:
                         
                         # Try tel: link
                         try:
-                            await page.wait_for_selector('a[href^="tel:"]', timeout=30000)
+                            await page.wait_for_selector('a[href^="tel:"]', timeout=self.reveal_timeout)
                             logging.info("✓ Phone number element appeared!")
                         except Exception:
                             logging.warning("No tel: link appeared, checking button text instead...")
-                            await page.wait_for_timeout(5000)  # Give it extra time
                         
                         break
                 except Exception as e:
@@ -185,7 +563,7 @@ class BrowserClient:
                 try:
                     if await btn.is_visible(timeout=1000):
                         text = await btn.inner_text()
-                        match = re.search(r'(08[35679]\s?\d{7})|(\+?353\s?8[35679]\s?\d{7})', text)
+                        match = re.search(PHONE_PATTERN, text)
                         if match:
                             phone = match.group(0)
                             logging.info(f"✓ Phone found in button text: {phone}")
@@ -217,15 +595,27 @@ class BrowserClient:
         return phone
     
     async def close(self):
-        """Close browser"""
-        if self._context:
-            await self._context.close()
+        """Save session, close contexts and browser"""
+        for task in list(self._replacements):
+            task.cancel()
+        await asyncio.gather(*self._replacements, return_exceptions=True)
+        self._replacements.clear()
+        live = [p for p in self._pool if not p.retired and not p.blocked]
+        if live:
+            await self._save_storage_state(live[0])
+        for pooled in self._pool:
+            await self._close_context(pooled)
+        self._pool = []
         if self._browser:
             await self._browser.close()
+            self._browser = None
         if self._playwright:
             await self._playwright.stop()
+            self._playwright = None
         
-        logging.info("Browser session closed")
+        logging.info(f"Browser session closed ({self.contexts_recycled} context(s) recycled)")
+        if self.resource_profile:
+            logging.info(f"Traffic: {self.resource_profile.report()}")
     
     def get_session_duration(self) -> float:
         """Session duration in minutes"""
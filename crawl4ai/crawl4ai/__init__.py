@@ -44,6 +44,7 @@ from .content_filter_strategy import (
 from .models import CrawlResult, MarkdownGenerationResult, DisplayMode
 from .components.crawler_monitor import CrawlerMonitor
 from .link_preview import LinkPreview
+from .process_pool import HTMLProcessPool
 from .async_dispatcher import (
     MemoryAdaptiveDispatcher,
     SemaphoreDispatcher,
@@ -172,6 +173,7 @@ __all__ = [
     "LLMContentFilter",
     "BaseDispatcher",
     "MemoryAdaptiveDispatcher",
+    "HTMLProcessPool",
     "SemaphoreDispatcher",
     "RateLimiter",
     "CrawlerMonitor",
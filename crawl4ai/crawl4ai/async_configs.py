@@ -413,6 +413,16 @@ class BrowserConfig:
                            Default: [].
         enable_stealth (bool): If True, applies playwright-stealth to bypass basic bot detection.
                               Cannot be used with use_undetected browser mode. Default: False.
+        max_contexts (int): Most browser contexts kept for reuse across run configs; the least
+                            recently used one is closed beyond that. Default: 16.
+        context_ttl (float): Seconds an unused context is kept before it is closed. 0 keeps
+                             contexts until evicted. Default: 600.
+        max_pages_per_context (int): Pages a context serves before it is replaced by a fresh
+                                     one. 0 never recycles. Default: 0.
+        page_pool_size (int): Warm pages kept per context for crawls without a session_id. Pages
+                              are pre-created in the background and reset and reused after a
+                              crawl instead of being closed. 0 disables the pool. Default: 0.
+        page_max_reuse (int): Crawls a pooled page serves before it is closed. Default: 50.
     """
 
     def __init__(
@@ -454,6 +464,11 @@ class BrowserConfig:
         debugging_port: int = 9222,
         host: str = "localhost",
         enable_stealth: bool = False,
+        max_contexts: int = 16,
+        context_ttl: float = 600,
+        max_pages_per_context: int = 0,
+        page_pool_size: int = 0,
+        page_max_reuse: int = 50,
     ):
         
         self.browser_type = browser_type
@@ -509,6 +524,11 @@ class BrowserConfig:
         self.debugging_port = debugging_port
         self.host = host
         self.enable_stealth = enable_stealth
+        self.max_contexts = max_contexts
+        self.context_ttl = context_ttl
+        self.max_pages_per_context = max_pages_per_context
+        self.page_pool_size = page_pool_size
+        self.page_max_reuse = page_max_reuse
 
         fa_user_agenr_generator = ValidUAGenerator()
         if self.user_agent_mode == "random":
@@ -584,6 +604,11 @@ class BrowserConfig:
             debugging_port=kwargs.get("debugging_port", 9222),
             host=kwargs.get("host", "localhost"),
             enable_stealth=kwargs.get("enable_stealth", False),
+            max_contexts=kwargs.get("max_contexts", 16),
+            context_ttl=kwargs.get("context_ttl", 600),
+            max_pages_per_context=kwargs.get("max_pages_per_context", 0),
+            page_pool_size=kwargs.get("page_pool_size", 0),
+            page_max_reuse=kwargs.get("page_max_reuse", 50),
         )
 
     def to_dict(self):
@@ -619,6 +644,11 @@ class BrowserConfig:
             "debugging_port": self.debugging_port,
             "host": self.host,
             "enable_stealth": self.enable_stealth,
+            "max_contexts": self.max_contexts,
+            "context_ttl": self.context_ttl,
+            "max_pages_per_context": self.max_pages_per_context,
+            "page_pool_size": self.page_pool_size,
+            "page_max_reuse": self.page_max_reuse,
         }
 
                 
@@ -501,6 +501,21 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                 "URL must start with 'http://', 'https://', 'file://', or 'raw:'"
             )
 
+    def _page_reusable(self, config: CrawlerRunConfig) -> bool:
+        """
+        Whether a page can go back to the page pool after crawling with config.
+        User hooks may leave anything on a page, and device metric or header
+        overrides survive a reset, as do the per-page init scripts the
+        undetected adapter uses for console capture. Listeners the crawl adds
+        are removed before the page is released.
+        """
+        return not (
+            any(self.hooks.values())
+            or config.adjust_viewport_to_content
+            or config.experimental.get("use_csp_nonce", False)
+            or (config.capture_console_messages and isinstance(self.adapter, UndetectedAdapter))
+        )
+
     async def _crawl_web(
         self, url: str, config: CrawlerRunConfig
     ) -> AsyncCrawlResponse:
@@ -647,6 +662,9 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
         # Note: For undetected browsers, console logging won't work directly
         # but captured messages can still be logged after retrieval
 
+        def handle_download(download):
+            asyncio.create_task(self._handle_download(download))
+
         try:
             # Get SSL certificate information if requested and URL is HTTPS
             ssl_cert = None
@@ -655,12 +673,7 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
 
             # Set up download handling
             if self.browser_config.accept_downloads:
-                page.on(
-                    "download",
-                    lambda download: asyncio.create_task(
-                        self._handle_download(download)
-                    ),
-                )
+                page.on("download", handle_download)
 
             # Handle page navigation and content loading
             if not config.js_only:
@@ -1068,9 +1081,13 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                     
                     # Clean up console capture
                     await self.adapter.cleanup_console_capture(page, handle_console, handle_error)
-                
-                # Close the page
-                await page.close()
+                if self.browser_config.accept_downloads:
+                    page.remove_listener("download", handle_download)
+
+                # Close the page, or reset it for reuse when pages are pooled
+                await self.browser_manager.release_page(
+                    page, reusable=self._page_reusable(config)
+                )
 
     # async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1):
     async def _handle_full_page_scan(self, page: Page, scroll_delay: float = 0.1, max_scroll_steps: Optional[int] = None):
@@ -1514,8 +1531,10 @@ class AsyncPlaywrightCrawlerStrategy(AsyncCrawlerStrategy):
                     )
 
         page.on("console", handle_console_message)
-        
-        await page.goto(file_path)
+        try:
+            await page.goto(file_path)
+        finally:
+            page.remove_listener("console", handle_console_message)
 
         return captured_console
         
@@ -2,12 +2,13 @@ import os
 from pathlib import Path
 import aiosqlite
 import asyncio
-from typing import Optional, Dict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 from contextlib import asynccontextmanager
 import json  
-from .models import CrawlResult, MarkdownGenerationResult, StringCompatibleMarkdown
-import aiofiles
+from urllib.parse import urlparse
+from .models import CrawlResult, MarkdownGenerationResult
 from .async_logger import AsyncLogger
+from .content_store import ContentStore, FileContentStore, PackedContentStore
 
 from .utils import ensure_content_dirs, generate_content_hash
 from .utils import VersionManager
@@ -19,9 +20,50 @@ base_directory = DB_PATH = os.path.join(
 os.makedirs(DB_PATH, exist_ok=True)
 DB_PATH = os.path.join(base_directory, "crawl4ai.db")
 
+# Cached CrawlResult fields, as named in the crawled_data table
+CACHE_FIELDS = (
+    "html",
+    "cleaned_html",
+    "markdown",
+    "extracted_content",
+    "success",
+    "media",
+    "links",
+    "metadata",
+    "screenshot",
+    "response_headers",
+    "downloaded_files",
+)
+# Columns holding a content hash, and the content directory of each
+CONTENT_FIELDS = {
+    "html": "html",
+    "cleaned_html": "cleaned",
+    "markdown": "markdown",
+    "extracted_content": "extracted",
+    "screenshot": "screenshots",
+}
+# Columns holding JSON, and the value used when they are empty
+JSON_FIELDS = {
+    "media": {},
+    "links": {},
+    "metadata": {},
+    "response_headers": {},
+    "downloaded_files": [],
+}
+# URLs per SELECT, below SQLite's default limit of 999 bound parameters
+SQL_BATCH_SIZE = 500
+
 
 class AsyncDatabaseManager:
-    def __init__(self, pool_size: int = 10, max_retries: int = 3):
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_retries: int = 3,
+        write_behind: bool = False,
+        write_batch_size: int = 64,
+        write_queue_size: int = 1000,
+        content_store: Optional[ContentStore] = None,
+    ):
         self.db_path = DB_PATH
         self.content_paths = ensure_content_dirs(os.path.dirname(DB_PATH))
         self.pool_size = pool_size
@@ -32,6 +74,16 @@ class AsyncDatabaseManager:
         self.connection_semaphore = asyncio.Semaphore(pool_size)
         self._initialized = False
         self.version_manager = VersionManager()
+        self._content_store = content_store
+        # acache_url only queues the result when write_behind is on; a
+        # background task writes queued results in batches
+        self.write_behind = write_behind
+        self.write_batch_size = write_batch_size
+        self.write_queue_size = write_queue_size
+        self._write_queue: Optional[asyncio.Queue] = None
+        self._writer_task: Optional[asyncio.Task] = None
+        # Queued results by URL, so reads see writes that are still queued
+        self._pending: Dict[str, CrawlResult] = {}
         self.logger = AsyncLogger(
             log_file=os.path.join(base_directory, ".crawl4ai", "crawler_db.log"),
             verbose=False,
@@ -92,6 +144,7 @@ class AsyncDatabaseManager:
 
     async def cleanup(self):
         """Cleanup connections when shutting down"""
+        await self.aflush_writes()
         async with self.pool_lock:
             for conn in self.connection_pool.values():
                 await conn.close()
@@ -285,148 +338,197 @@ class AsyncDatabaseManager:
             params={"column": new_column},
         )
 
-    async def aget_cached_url(self, url: str) -> Optional[CrawlResult]:
-        """Retrieve cached URL data as CrawlResult"""
-
-        async def _get(db):
-            async with db.execute(
-                "SELECT * FROM crawled_data WHERE url = ?", (url,)
-            ) as cursor:
-                row = await cursor.fetchone()
-                if not row:
-                    return None
-
-                # Get column names
-                columns = [description[0] for description in cursor.description]
-                # Create dict from row data
-                row_dict = dict(zip(columns, row))
-
-                # Load content from files using stored hashes
-                content_fields = {
-                    "html": row_dict["html"],
-                    "cleaned_html": row_dict["cleaned_html"],
-                    "markdown": row_dict["markdown"],
-                    "extracted_content": row_dict["extracted_content"],
-                    "screenshot": row_dict["screenshot"],
-                    "screenshots": row_dict["screenshot"],
-                }
-
-                for field, hash_value in content_fields.items():
-                    if hash_value:
-                        content = await self._load_content(
-                            hash_value,
-                            field.split("_")[0],  # Get content type from field name
-                        )
-                        row_dict[field] = content or ""
-                    else:
-                        row_dict[field] = ""
-
-                # Parse JSON fields
-                json_fields = [
-                    "media",
-                    "links",
-                    "metadata",
-                    "response_headers",
-                    "markdown",
-                ]
-                for field in json_fields:
-                    try:
-                        row_dict[field] = (
-                            json.loads(row_dict[field]) if row_dict[field] else {}
-                        )
-                    except json.JSONDecodeError:
-                        # Very UGLY, never mention it to me please
-                        if field == "markdown" and isinstance(row_dict[field], str):
-                            row_dict[field] = MarkdownGenerationResult(
-                                raw_markdown=row_dict[field] or "",
-                                markdown_with_citations="",
-                                references_markdown="",
-                                fit_markdown="",
-                                fit_html="",
-                            )
-                        else:
-                            row_dict[field] = {}
-
-                if isinstance(row_dict["markdown"], Dict):
-                    if row_dict["markdown"].get("raw_markdown"):
-                        row_dict["markdown"] = row_dict["markdown"]["raw_markdown"]
-
-                # Parse downloaded_files
+    def _select_fields(self, fields: Optional[Iterable[str]]) -> List[str]:
+        """Validate a field selection, url and success are always read"""
+        if fields is None:
+            return list(CACHE_FIELDS)
+        fields = set(fields)
+        unknown = fields - set(CACHE_FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown cache fields: {sorted(unknown)}")
+        return [f for f in CACHE_FIELDS if f in fields or f == "success"]
+
+    def _project(self, result: CrawlResult, columns: List[str]) -> CrawlResult:
+        """Copy of a queued result with only the selected fields, as if read from a row"""
+        if len(columns) == len(CACHE_FIELDS):
+            return result.model_copy()
+        data = {"url": result.url, "html": ""}
+        for field in columns:
+            data[field] = result._markdown if field == "markdown" else getattr(result, field)
+        return CrawlResult(**data)
+
+    def _row_to_result(self, row: Dict[str, Any]) -> CrawlResult:
+        """Build a CrawlResult from a row whose content hashes were replaced by content"""
+        for field, default in JSON_FIELDS.items():
+            if field in row:
                 try:
-                    row_dict["downloaded_files"] = (
-                        json.loads(row_dict["downloaded_files"])
-                        if row_dict["downloaded_files"]
-                        else []
-                    )
+                    row[field] = json.loads(row[field]) if row[field] else default.copy()
                 except json.JSONDecodeError:
-                    row_dict["downloaded_files"] = []
+                    row[field] = default.copy()
+
+        if "markdown" in row:
+            markdown = row.pop("markdown")
+            try:
+                markdown = json.loads(markdown) if markdown else None
+            except json.JSONDecodeError:
+                # Entries written before markdown was stored as JSON
+                markdown = {"raw_markdown": markdown}
+            if markdown is not None and not isinstance(markdown, dict):
+                markdown = {"raw_markdown": str(markdown)}
+            if markdown is not None:
+                row["markdown"] = MarkdownGenerationResult(
+                    raw_markdown=markdown.get("raw_markdown") or "",
+                    markdown_with_citations=markdown.get("markdown_with_citations") or "",
+                    references_markdown=markdown.get("references_markdown") or "",
+                    fit_markdown=markdown.get("fit_markdown"),
+                    fit_html=markdown.get("fit_html"),
+                )
+
+        row.setdefault("html", "")
+        row["success"] = bool(row["success"])
+        return CrawlResult(**row)
+
+    async def aget_cached_urls(
+        self, urls: Iterable[str], fields: Optional[Iterable[str]] = None
+    ) -> Dict[str, CrawlResult]:
+        """
+        Retrieve many cached URLs in one query.
+
+        Args:
+            urls: URLs to look up.
+            fields: CrawlResult fields to load, e.g. ``["links", "metadata"]``.
+                Only those columns are read and only their content files are
+                opened; the rest keep their CrawlResult defaults. None loads
+                everything.
+
+        Returns:
+            Dict mapping each cached URL to its CrawlResult. URLs that are not
+            cached are left out.
+        """
+        columns = self._select_fields(fields)
+        urls = list(dict.fromkeys(urls))
+        found: Dict[str, CrawlResult] = {}
+
+        # Writes still queued behind the crawl are the freshest copy
+        for url in urls:
+            if url in self._pending:
+                found[url] = self._project(self._pending[url], columns)
+        missing = [url for url in urls if url not in found]
+        if not missing:
+            return found
 
-                # Remove any fields not in CrawlResult model
-                valid_fields = CrawlResult.__annotations__.keys()
-                filtered_dict = {k: v for k, v in row_dict.items() if k in valid_fields}
-                filtered_dict["markdown"] = row_dict["markdown"]
-                return CrawlResult(**filtered_dict)
+        async def _get(db):
+            rows = []
+            for i in range(0, len(missing), SQL_BATCH_SIZE):
+                chunk = missing[i : i + SQL_BATCH_SIZE]
+                async with db.execute(
+                    f"SELECT url, {', '.join(columns)} FROM crawled_data "
+                    f"WHERE url IN ({', '.join('?' * len(chunk))})",
+                    chunk,
+                ) as cursor:
+                    rows.extend(await cursor.fetchall())
+            return rows
 
         try:
-            return await self.execute_with_retry(_get)
+            rows = await self.execute_with_retry(_get)
         except Exception as e:
             self.logger.error(
-                message="Error retrieving cached URL: {error}",
+                message="Error retrieving cached URLs: {error}",
                 tag="ERROR",
                 force_verbose=True,
                 params={"error": str(e)},
             )
-            return None
+            return found
+
+        rows = [dict(zip(["url", *columns], row)) for row in rows]
+
+        # Load every requested content file in one thread hop
+        wanted = [
+            (row, field, content_type)
+            for row in rows
+            for field, content_type in CONTENT_FIELDS.items()
+            if field in row
+        ]
+        contents = await asyncio.to_thread(
+            self.content_store.get_many,
+            [(row[field], content_type) for row, field, content_type in wanted],
+        )
+        for (row, field, _), content in zip(wanted, contents):
+            row[field] = content or ""
 
-    async def acache_url(self, result: CrawlResult):
-        """Cache CrawlResult data"""
-        # Store content files and get hashes
-        content_map = {
+        for row in rows:
+            try:
+                found[row["url"]] = self._row_to_result(row)
+            except Exception as e:
+                self.logger.error(
+                    message="Error loading cached URL {url}: {error}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"url": row["url"], "error": str(e)},
+                )
+        return found
+
+    async def aget_cached_url(
+        self, url: str, fields: Optional[Iterable[str]] = None
+    ) -> Optional[CrawlResult]:
+        """Retrieve cached URL data as CrawlResult"""
+        return (await self.aget_cached_urls([url], fields)).get(url)
+
+    def _content_map(self, result: CrawlResult) -> Dict[str, Tuple[str, str]]:
+        """Content stored in files for a result, keyed by column"""
+        # result.markdown is a string view, store the full result behind it
+        markdown = result._markdown
+        if isinstance(markdown, str):
+            markdown = MarkdownGenerationResult(
+                raw_markdown=markdown,
+                markdown_with_citations="",
+                references_markdown="",
+            )
+        markdown = markdown.model_dump_json() if markdown is not None else ""
+
+        return {
             "html": (result.html, "html"),
             "cleaned_html": (result.cleaned_html or "", "cleaned"),
-            "markdown": None,
+            "markdown": (markdown, "markdown"),
             "extracted_content": (result.extracted_content or "", "extracted"),
             "screenshot": (result.screenshot or "", "screenshots"),
         }
 
-        try:
-            if isinstance(result.markdown, StringCompatibleMarkdown):
-                content_map["markdown"] = (
-                    result.markdown,
-                    "markdown",
-                )
-            elif isinstance(result.markdown, MarkdownGenerationResult):
-                content_map["markdown"] = (
-                    result.markdown.model_dump_json(),
-                    "markdown",
-                )
-            elif isinstance(result.markdown, str):
-                markdown_result = MarkdownGenerationResult(raw_markdown=result.markdown)
-                content_map["markdown"] = (
-                    markdown_result.model_dump_json(),
-                    "markdown",
-                )
-            else:
-                content_map["markdown"] = (
-                    MarkdownGenerationResult().model_dump_json(),
-                    "markdown",
+    async def acache_urls(self, results: Iterable[CrawlResult]):
+        """Cache many CrawlResults in one transaction"""
+        results = list(results)
+        if not results:
+            return
+
+        content_maps = [self._content_map(result) for result in results]
+        items = [
+            (content, content_type, urlparse(result.url).netloc)
+            for result, content_map in zip(results, content_maps)
+            for content, content_type in content_map.values()
+        ]
+        hashes = iter(await asyncio.to_thread(self.content_store.put_many, items))
+        rows = []
+        for result, content_map in zip(results, content_maps):
+            content_hashes = {field: next(hashes) for field in content_map}
+            rows.append(
+                (
+                    result.url,
+                    content_hashes["html"],
+                    content_hashes["cleaned_html"],
+                    content_hashes["markdown"],
+                    content_hashes["extracted_content"],
+                    result.success,
+                    json.dumps(result.media),
+                    json.dumps(result.links),
+                    json.dumps(result.metadata or {}),
+                    content_hashes["screenshot"],
+                    json.dumps(result.response_headers or {}),
+                    json.dumps(result.downloaded_files or []),
                 )
-        except Exception as e:
-            self.logger.warning(
-                message=f"Error processing markdown content: {str(e)}", tag="WARNING"
-            )
-            # Fallback to empty markdown result
-            content_map["markdown"] = (
-                MarkdownGenerationResult().model_dump_json(),
-                "markdown",
             )
 
-        content_hashes = {}
-        for field, (content, content_type) in content_map.items():
-            content_hashes[field] = await self._store_content(content, content_type)
-
         async def _cache(db):
-            await db.execute(
+            await db.executemany(
                 """
                 INSERT INTO crawled_data (
                     url, html, cleaned_html, markdown,
@@ -447,20 +549,7 @@ class AsyncDatabaseManager:
                     response_headers = excluded.response_headers,
                     downloaded_files = excluded.downloaded_files
             """,
-                (
-                    result.url,
-                    content_hashes["html"],
-                    content_hashes["cleaned_html"],
-                    content_hashes["markdown"],
-                    content_hashes["extracted_content"],
-                    result.success,
-                    json.dumps(result.media),
-                    json.dumps(result.links),
-                    json.dumps(result.metadata or {}),
-                    content_hashes["screenshot"],
-                    json.dumps(result.response_headers or {}),
-                    json.dumps(result.downloaded_files or []),
-                ),
+                rows,
             )
 
         try:
@@ -473,6 +562,66 @@ class AsyncDatabaseManager:
                 params={"error": str(e)},
             )
 
+    async def acache_url(self, result: CrawlResult):
+        """Cache CrawlResult data, in the background when write_behind is on"""
+        if self.write_behind:
+            await self._enqueue_write(result)
+        else:
+            await self.acache_urls([result])
+
+    async def _enqueue_write(self, result: CrawlResult):
+        loop = asyncio.get_running_loop()
+        if (
+            self._writer_task is None
+            or self._writer_task.done()
+            or self._writer_task.get_loop() is not loop
+        ):
+            self._write_queue = asyncio.Queue(maxsize=self.write_queue_size)
+            self._writer_task = asyncio.create_task(self._write_behind_worker())
+            # Writes left behind by a writer on a closed loop
+            for stale in list(self._pending.values()):
+                await self._write_queue.put(stale)
+
+        self._pending[result.url] = result
+        await self._write_queue.put(result)
+
+    async def _write_behind_worker(self):
+        """Drain queued writes in batches"""
+        queue = self._write_queue
+        while True:
+            batch = [await queue.get()]
+            while len(batch) < self.write_batch_size and not queue.empty():
+                batch.append(queue.get_nowait())
+            try:
+                await self.acache_urls(batch)
+            except Exception as e:
+                # Keep draining, or aflush_writes would wait on the queue forever
+                self.logger.error(
+                    message="Error writing cached URLs: {error}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"error": str(e)},
+                )
+            finally:
+                for result in batch:
+                    if self._pending.get(result.url) is result:
+                        del self._pending[result.url]
+                    queue.task_done()
+
+    async def aflush_writes(self):
+        """Wait until every queued cache write has reached the database"""
+        writer = self._writer_task
+        if (
+            writer is not None
+            and not writer.done()
+            and writer.get_loop() is asyncio.get_running_loop()
+        ):
+            await self._write_queue.join()
+        elif self._pending:
+            pending = list(self._pending.values())
+            self._pending.clear()
+            await self.acache_urls(pending)
+
     async def aget_total_count(self) -> int:
         """Get total number of cached URLs"""
 
@@ -524,40 +673,52 @@ class AsyncDatabaseManager:
                 params={"error": str(e)},
             )
 
-    async def _store_content(self, content: str, content_type: str) -> str:
-        """Store content in filesystem and return hash"""
-        if not content:
-            return ""
-
-        content_hash = generate_content_hash(content)
-        file_path = os.path.join(self.content_paths[content_type], content_hash)
-
-        # Only write if file doesn't exist
-        if not os.path.exists(file_path):
-            async with aiofiles.open(file_path, "w", encoding="utf-8") as f:
-                await f.write(content)
-
-        return content_hash
-
-    async def _load_content(
-        self, content_hash: str, content_type: str
-    ) -> Optional[str]:
-        """Load content from filesystem by hash"""
-        if not content_hash:
-            return None
-
-        file_path = os.path.join(self.content_paths[content_type], content_hash)
-        try:
-            async with aiofiles.open(file_path, "r", encoding="utf-8") as f:
-                return await f.read()
-        except:
-            self.logger.error(
-                message="Failed to load content: {file_path}",
-                tag="ERROR",
-                force_verbose=True,
-                params={"file_path": file_path},
-            )
-            return None
+    @property
+    def content_store(self) -> ContentStore:
+        """Backend holding page content, files under the base directory by default"""
+        if self._content_store is None:
+            self._content_store = FileContentStore(self.content_paths, self.logger)
+        return self._content_store
+
+    @content_store.setter
+    def content_store(self, store: ContentStore):
+        self._content_store = store
+
+    async def acompact_content(self) -> int:
+        """Drop content no cached URL refers to anymore. Returns the bytes reclaimed."""
+        await self.aflush_writes()
+        store = self.content_store
+        # Content stored while live hashes are collected is kept
+        mark = await asyncio.to_thread(store.mark)
+
+        async def _hashes(db):
+            async with db.execute(
+                f"SELECT {', '.join(CONTENT_FIELDS)} FROM crawled_data"
+            ) as cursor:
+                return {h for row in await cursor.fetchall() for h in row if h}
+
+        live = await self.execute_with_retry(_hashes)
+        return await asyncio.to_thread(store.compact, live, mark)
+
+    async def amigrate_content_store(
+        self, store: PackedContentStore, remove_files: bool = False
+    ) -> int:
+        """
+        Copy cached content from the current FileContentStore into a
+        PackedContentStore and switch to it. Returns the records migrated.
+
+        The file store stays as the new store's fallback, so content written
+        during the migration is still found.
+        """
+        current = self.content_store
+        if not isinstance(current, FileContentStore):
+            raise ValueError("Only a FileContentStore can be migrated")
+        await self.aflush_writes()
+        migrated = await asyncio.to_thread(store.migrate_from, current, remove_files)
+        if store.fallback is None:
+            store.fallback = current
+        self.content_store = store
+        return migrated
 
 
 # Create a singleton instance
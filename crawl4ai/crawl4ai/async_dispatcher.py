@@ -1,4 +1,4 @@
-from typing import Dict, Optional, List, Tuple, Union
+from typing import AsyncIterable, Dict, Iterable, Optional, List, Tuple, Union
 from .async_configs import CrawlerRunConfig
 from .models import (
     CrawlResult,
@@ -17,6 +17,8 @@ import time
 import psutil
 import asyncio
 import uuid
+import heapq
+import itertools
 
 from urllib.parse import urlparse
 import random
@@ -24,6 +26,19 @@ from abc import ABC, abstractmethod
 
 from .utils import get_true_memory_usage_percent
 
+# Anything arun_many accepts as its URL input
+UrlSource = Union[List[str], Iterable[str], AsyncIterable[str]]
+
+
+async def aiter_urls(urls: UrlSource) -> AsyncGenerator[str, None]:
+    """Yield URLs from a list, a plain iterable or an async iterable"""
+    if hasattr(urls, "__aiter__"):
+        async for url in urls:
+            yield url
+    else:
+        for url in urls:
+            yield url
+
 
 class RateLimiter:
     def __init__(
@@ -42,6 +57,12 @@ class RateLimiter:
     def get_domain(self, url: str) -> str:
         return urlparse(url).netloc
 
+    def set_crawl_delay(self, url: str, delay: float) -> None:
+        """Never request the URL's domain more often than every ``delay`` seconds"""
+        domain = self.get_domain(url)
+        state = self.domains.setdefault(domain, DomainState())
+        state.min_delay = min(delay, self.max_delay)
+
     async def wait_if_needed(self, url: str) -> None:
         domain = self.get_domain(url)
         state = self.domains.get(domain)
@@ -51,10 +72,17 @@ class RateLimiter:
             state = self.domains[domain]
 
         now = time.time()
+        wait_time = 0.0
         if state.last_request_time:
             wait_time = max(0, state.current_delay - (now - state.last_request_time))
-            if wait_time > 0:
-                await asyncio.sleep(wait_time)
+        if state.min_delay:
+            # Crawl-delay is a hard floor: reserve the slot before sleeping so
+            # concurrent requests queue up behind it instead of firing together
+            slot = max(now + wait_time, state.next_slot)
+            state.next_slot = slot + state.min_delay
+            wait_time = slot - now
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
 
         # Random delay within base range if no current delay
         if state.current_delay == 0:
@@ -86,6 +114,141 @@ class RateLimiter:
 
 
 
+class FairTaskQueue:
+    """
+    Dispatch queue with priorities derived lazily at pop time.
+
+    Tasks come out by fewest retries (FIFO within a retry count), except that
+    once the oldest task has waited longer than ``fairness_timeout`` the
+    longest-waiting task goes first. Every task sits in two heaps, one keyed
+    by retry count and one by enqueue time; an entry taken from one heap is
+    dropped from the other when it reaches the top. Push and pop are
+    O(log n) amortized and queued tasks never need re-prioritising.
+    """
+
+    def __init__(self, fairness_timeout: float = 600.0):
+        self.fairness_timeout = fairness_timeout
+        self._by_retry: List[tuple] = []
+        self._by_age: List[tuple] = []
+        self._seq = itertools.count()
+        self._size = 0
+        self._enqueue_time_sum = 0.0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def empty(self) -> bool:
+        return self._size == 0
+
+    def qsize(self) -> int:
+        return self._size
+
+    def put_nowait(
+        self, url: str, task_id: str, retry_count: int = 0, enqueue_time: Optional[float] = None
+    ) -> None:
+        enqueue_time = time.time() if enqueue_time is None else enqueue_time
+        # Last slot marks the entry as taken
+        entry = [url, task_id, retry_count, enqueue_time, False]
+        seq = next(self._seq)
+        heapq.heappush(self._by_retry, (retry_count, seq, entry))
+        heapq.heappush(self._by_age, (enqueue_time, seq, entry))
+        self._size += 1
+        self._enqueue_time_sum += enqueue_time
+
+    def get_nowait(self) -> Tuple[str, str, int, float]:
+        """Pop the next task as (url, task_id, retry_count, enqueue_time)"""
+        if not self._size:
+            raise asyncio.QueueEmpty()
+
+        self._prune(self._by_age)
+        oldest = self._by_age[0][2]
+        if time.time() - oldest[3] > self.fairness_timeout:
+            heapq.heappop(self._by_age)
+            entry = oldest
+        else:
+            self._prune(self._by_retry)
+            entry = heapq.heappop(self._by_retry)[2]
+
+        entry[4] = True
+        self._size -= 1
+        self._enqueue_time_sum -= entry[3]
+        return entry[0], entry[1], entry[2], entry[3]
+
+    def wait_stats(self, now: Optional[float] = None) -> Tuple[float, float]:
+        """Highest and average wait time of queued tasks"""
+        if not self._size:
+            return 0.0, 0.0
+        now = time.time() if now is None else now
+        self._prune(self._by_age)
+        highest = now - self._by_age[0][2][3]
+        average = now - self._enqueue_time_sum / self._size
+        return highest, average
+
+    @staticmethod
+    def _prune(heap: List[tuple]) -> None:
+        while heap and heap[0][2][4]:
+            heapq.heappop(heap)
+
+
+class UrlFeed:
+    """
+    Bounded prefetch buffer in front of a URL source.
+
+    A background task pulls from the source into a queue of at most
+    ``prefetch`` URLs and blocks once it is full, so a lazy source (sitemap
+    stream, DB cursor, seeder output) is only consumed as fast as the
+    dispatcher drains it.
+    """
+
+    def __init__(self, urls: UrlSource, prefetch: int):
+        self._incoming: asyncio.Queue = asyncio.Queue(maxsize=max(1, prefetch))
+        self._head: Optional[str] = None  # URL taken off the queue by wait()
+        self._pump_task = asyncio.create_task(self._pump(urls))
+
+    async def _pump(self, urls: UrlSource):
+        async for url in aiter_urls(urls):
+            await self._incoming.put(url)
+
+    @property
+    def exhausted(self) -> bool:
+        """True once the source has ended and every URL was handed out"""
+        if self._head is not None or not self._incoming.empty():
+            return False
+        if not self._pump_task.done():
+            return False
+        self._raise_source_error()
+        return True
+
+    def get_nowait(self) -> Optional[str]:
+        """Next buffered URL, or None if nothing is ready"""
+        if self._head is not None:
+            url, self._head = self._head, None
+            return url
+        if not self._incoming.empty():
+            return self._incoming.get_nowait()
+        if self._pump_task.done():
+            self._raise_source_error()
+        return None
+
+    def _raise_source_error(self):
+        if not self._pump_task.cancelled() and self._pump_task.exception():
+            raise self._pump_task.exception()
+
+    async def wait(self):
+        """Block until a URL is buffered or the source ends"""
+        if self._head is not None or not self._incoming.empty() or self._pump_task.done():
+            return
+        getter = asyncio.ensure_future(self._incoming.get())
+        await asyncio.wait({getter, self._pump_task}, return_when=asyncio.FIRST_COMPLETED)
+        if getter.done():
+            self._head = getter.result()
+        else:
+            getter.cancel()
+
+    def close(self):
+        self._pump_task.cancel()
+
+
 class BaseDispatcher(ABC):
     def __init__(
         self,
@@ -124,6 +287,17 @@ class BaseDispatcher(ABC):
         # No match found - return None to indicate URL should be skipped
         return None
 
+    async def apply_crawl_delay(self, url: str, config: CrawlerRunConfig) -> None:
+        """Pass the domain's robots.txt Crawl-delay on to the rate limiter"""
+        if not (self.rate_limiter and config.check_robots_txt):
+            return
+        # The rules are cached, so arun's robots.txt check won't fetch them again
+        delay = await self.crawler.robots_parser.crawl_delay(
+            url, self.crawler.browser_config.user_agent
+        )
+        if delay:
+            self.rate_limiter.set_crawl_delay(url, delay)
+
     @abstractmethod
     async def crawl_url(
         self,
@@ -137,7 +311,7 @@ class BaseDispatcher(ABC):
     @abstractmethod
     async def run_urls(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: AsyncWebCrawler,  # noqa: F821
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
         monitor: Optional[CrawlerMonitor] = None,
@@ -157,6 +331,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         memory_wait_timeout: Optional[float] = 600.0,
         rate_limiter: Optional[RateLimiter] = None,
         monitor: Optional[CrawlerMonitor] = None,
+        prefetch: Optional[int] = None,  # URLs pulled ahead of dispatch, defaults to 2x max_session_permit
     ):
         super().__init__(rate_limiter, monitor)
         self.memory_threshold_percent = memory_threshold_percent
@@ -165,9 +340,10 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         self.check_interval = check_interval
         self.max_session_permit = max_session_permit
         self.fairness_timeout = fairness_timeout
+        self.prefetch = prefetch or 2 * max_session_permit
         self.memory_wait_timeout = memory_wait_timeout
         self.result_queue = asyncio.Queue()
-        self.task_queue = asyncio.PriorityQueue()  # Priority queue for better management
+        self.task_queue = FairTaskQueue(fairness_timeout)  # Aging priorities computed at pop time
         self.memory_pressure_mode = False  # Flag to indicate when we're in memory pressure mode
         self.current_memory_percent = 0.0  # Track current memory usage
         self._high_memory_start_time: Optional[float] = None
@@ -214,17 +390,6 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                 
             await asyncio.sleep(self.check_interval)
     
-    def _get_priority_score(self, wait_time: float, retry_count: int) -> float:
-        """Calculate priority score (lower is higher priority)
-        - URLs waiting longer than fairness_timeout get higher priority
-        - More retry attempts decreases priority
-        """
-        if wait_time > self.fairness_timeout:
-            # High priority for long-waiting URLs
-            return -wait_time
-        # Standard priority based on retries
-        return retry_count
-    
     async def crawl_url(
         self,
         url: str,
@@ -283,14 +448,13 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             self.concurrent_sessions += 1
             
             if self.rate_limiter:
+                await self.apply_crawl_delay(url, selected_config)
                 await self.rate_limiter.wait_if_needed(url)
                 
             # Check if we're in critical memory state
             if self.current_memory_percent >= self.critical_threshold_percent:
-                # Requeue this task with increased priority and retry count
-                enqueue_time = time.time()
-                priority = self._get_priority_score(enqueue_time - start_time, retry_count + 1)
-                await self.task_queue.put((priority, (url, task_id, retry_count + 1, enqueue_time)))
+                # Requeue this task with increased retry count
+                self.task_queue.put_nowait(url, task_id, retry_count + 1)
                 
                 # Update monitoring
                 if self.monitor:
@@ -373,7 +537,7 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         
     async def run_urls(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: AsyncWebCrawler,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> List[CrawlerTaskResult]:
@@ -386,20 +550,13 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
             self.monitor.start()
             
         results = []
+        feed = UrlFeed(urls, self.prefetch)
 
         try:
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
-
             active_tasks = []
 
-            # Process until both queues are empty
-            while not self.task_queue.empty() or active_tasks:
+            # Process until the source and both queues are empty
+            while not feed.exhausted or not self.task_queue.empty() or active_tasks:
                 if memory_monitor.done():
                     exc = memory_monitor.exception()
                     if exc:
@@ -407,13 +564,15 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                             t.cancel()
                         raise exc
 
+                self._admit_urls(feed)
+
                 # If memory pressure is low, greedily fill all available slots
                 if not self.memory_pressure_mode:
                     slots = self.max_session_permit - len(active_tasks)
                     while slots > 0:
                         try:
                             # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
+                            url, task_id, retry_count, enqueue_time = self.task_queue.get_nowait()
                             
                             # Create and start the task
                             task = asyncio.create_task(
@@ -449,12 +608,15 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                         
                     # Update active tasks list
                     active_tasks = list(pending)
+                elif self.task_queue.empty():
+                    # Starved, wait for the source rather than polling it
+                    await feed.wait()
                 else:
                     # If no active tasks but still waiting, sleep briefly
                     await asyncio.sleep(self.check_interval / 2)
                     
-                # Update priorities for waiting tasks if needed
-                await self._update_queue_priorities()
+                # Report queue depth and wait times
+                self._update_queue_statistics()
 
         except Exception as e:
             if self.monitor:
@@ -462,73 +624,38 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         
         finally:
             # Clean up
+            feed.close()
             memory_monitor.cancel()
             if self.monitor:
                 self.monitor.stop()
             return results
                 
-    async def _update_queue_priorities(self):
-        """Periodically update priorities of items in the queue to prevent starvation"""
-        # Skip if queue is empty
-        if self.task_queue.empty():
+    def _admit_urls(self, feed: UrlFeed):
+        """Move prefetched URLs into the task queue, up to the prefetch limit"""
+        while len(self.task_queue) < self.prefetch:
+            url = feed.get_nowait()
+            if url is None:
+                return
+            task_id = str(uuid.uuid4())
+            if self.monitor:
+                self.monitor.add_task(task_id, url)
+            # Add to queue with retry count 0 and current time
+            self.task_queue.put_nowait(url, task_id, 0)
+
+    def _update_queue_statistics(self):
+        """Push queue depth and wait times to the monitor"""
+        if not self.monitor:
             return
-            
-        # Use a drain-and-refill approach to update all priorities
-        temp_items = []
-        
-        # Drain the queue (with a safety timeout to prevent blocking)
-        try:
-            drain_start = time.time()
-            while not self.task_queue.empty() and time.time() - drain_start < 5.0:  # 5 second safety timeout
-                try:
-                    # Get item from queue with timeout
-                    priority, (url, task_id, retry_count, enqueue_time) = await asyncio.wait_for(
-                        self.task_queue.get(), timeout=0.1
-                    )
-                    
-                    # Calculate new priority based on current wait time
-                    current_time = time.time()
-                    wait_time = current_time - enqueue_time
-                    new_priority = self._get_priority_score(wait_time, retry_count)
-                    
-                    # Store with updated priority
-                    temp_items.append((new_priority, (url, task_id, retry_count, enqueue_time)))
-                    
-                    # Update monitoring stats for this task
-                    if self.monitor and task_id in self.monitor.stats:
-                        self.monitor.update_task(task_id, wait_time=wait_time)
-                        
-                except asyncio.TimeoutError:
-                    # Queue might be empty or very slow
-                    break
-        except Exception as e:
-            # If anything goes wrong, make sure we refill the queue with what we've got
-            self.monitor.update_memory_status(f"QUEUE_ERROR: {str(e)}")
-        
-        # Calculate queue statistics
-        if temp_items and self.monitor:
-            total_queued = len(temp_items)
-            wait_times = [item[1][3] for item in temp_items]
-            highest_wait_time = time.time() - min(wait_times) if wait_times else 0
-            avg_wait_time = sum(time.time() - t for t in wait_times) / len(wait_times) if wait_times else 0
-            
-            # Update queue statistics in monitor
-            self.monitor.update_queue_statistics(
-                total_queued=total_queued,
-                highest_wait_time=highest_wait_time,
-                avg_wait_time=avg_wait_time
-            )
-        
-        # Sort by priority (lowest number = highest priority)
-        temp_items.sort(key=lambda x: x[0])
-        
-        # Refill the queue with updated priorities
-        for item in temp_items:
-            await self.task_queue.put(item)
-                
+        highest_wait_time, avg_wait_time = self.task_queue.wait_stats()
+        self.monitor.update_queue_statistics(
+            total_queued=len(self.task_queue),
+            highest_wait_time=highest_wait_time,
+            avg_wait_time=avg_wait_time
+        )
+
     async def run_urls_stream(
         self,
-        urls: List[str],
+        urls: UrlSource,
         crawler: AsyncWebCrawler,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> AsyncGenerator[CrawlerTaskResult, None]:
@@ -540,33 +667,29 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
         if self.monitor:
             self.monitor.start()
             
+        feed = UrlFeed(urls, self.prefetch)
+
         try:
-            # Initialize task queue
-            for url in urls:
-                task_id = str(uuid.uuid4())
-                if self.monitor:
-                    self.monitor.add_task(task_id, url)
-                # Add to queue with initial priority 0, retry count 0, and current time
-                await self.task_queue.put((0, (url, task_id, 0, time.time())))
-                
             active_tasks = []
-            completed_count = 0
-            total_urls = len(urls)
 
-            while completed_count < total_urls:
+            # Requeued tasks go back into the task queue, so this also waits for them
+            while not feed.exhausted or not self.task_queue.empty() or active_tasks:
                 if memory_monitor.done():
                     exc = memory_monitor.exception()
                     if exc:
                         for t in active_tasks:
                             t.cancel()
                         raise exc
+
+                self._admit_urls(feed)
+
                 # If memory pressure is low, greedily fill all available slots
                 if not self.memory_pressure_mode:
                     slots = self.max_session_permit - len(active_tasks)
                     while slots > 0:
                         try:
                             # Use get_nowait() to immediately get tasks without blocking
-                            priority, (url, task_id, retry_count, enqueue_time) = self.task_queue.get_nowait()
+                            url, task_id, retry_count, enqueue_time = self.task_queue.get_nowait()
                             
                             # Create and start the task
                             task = asyncio.create_task(
@@ -598,22 +721,25 @@ class MemoryAdaptiveDispatcher(BaseDispatcher):
                     for completed_task in done:
                         result = await completed_task
                         
-                        # Only count as completed if it wasn't requeued
+                        # Requeued tasks will come around again
                         if "requeued" not in result.error_message:
-                            completed_count += 1
                             yield result
                         
                     # Update active tasks list
                     active_tasks = list(pending)
+                elif self.task_queue.empty():
+                    # Starved, wait for the source rather than polling it
+                    await feed.wait()
                 else:
                     # If no active tasks but still waiting, sleep briefly
                     await asyncio.sleep(self.check_interval / 2)
                 
-                # Update priorities for waiting tasks if needed
-                await self._update_queue_priorities()
+                # Report queue depth and wait times
+                self._update_queue_statistics()
                 
         finally:
             # Clean up
+            feed.close()
             memory_monitor.cancel()
             if self.monitor:
                 self.monitor.stop()
@@ -679,6 +805,7 @@ class SemaphoreDispatcher(BaseDispatcher):
                 )
 
             if self.rate_limiter:
+                await self.apply_crawl_delay(url, selected_config)
                 await self.rate_limiter.wait_if_needed(url)
 
             async with semaphore:
@@ -745,7 +872,7 @@ class SemaphoreDispatcher(BaseDispatcher):
     async def run_urls(
         self,
         crawler: AsyncWebCrawler,  # noqa: F821
-        urls: List[str],
+        urls: UrlSource,
         config: Union[CrawlerRunConfig, List[CrawlerRunConfig]],
     ) -> List[CrawlerTaskResult]:
         self.crawler = crawler
@@ -754,18 +881,34 @@ class SemaphoreDispatcher(BaseDispatcher):
 
         try:
             semaphore = asyncio.Semaphore(self.semaphore_count)
-            tasks = []
+            # Only pull from the source while a session slot is free
+            in_flight = asyncio.Semaphore(self.max_session_permit)
+            # Finished tasks are dropped as soon as their result is stored
+            active_tasks = set()
+            results = []
+
+            def finish(task, index):
+                in_flight.release()
+                active_tasks.discard(task)
+                if task.cancelled():
+                    results[index] = asyncio.CancelledError()
+                else:
+                    results[index] = task.exception() or task.result()
 
-            for url in urls:
+            async for url in aiter_urls(urls):
+                await in_flight.acquire()
                 task_id = str(uuid.uuid4())
                 if self.monitor:
                     self.monitor.add_task(task_id, url)
                 task = asyncio.create_task(
                     self.crawl_url(url, config, task_id, semaphore)
                 )
-                tasks.append(task)
+                task.add_done_callback(lambda t, i=len(results): finish(t, i))
+                results.append(None)
+                active_tasks.add(task)
 
-            return await asyncio.gather(*tasks, return_exceptions=True)
+            await asyncio.gather(*active_tasks, return_exceptions=True)
+            return results
         finally:
             if self.monitor:
                 self.monitor.stop()
\ No newline at end of file
@@ -6,7 +6,8 @@ Features
 --------
 * Common-Crawl streaming via httpx.AsyncClient (HTTP/2, keep-alive)
 * robots.txt → sitemap chain (.gz + nested indexes) via async httpx
-* Per-domain CDX result cache on disk (~/.crawl4ai/<index>_<domain>_<hash>.jsonl)
+* One SQLite cache (~/.cache/url_seeder/seeder.db) for CDX/sitemap URL lists
+  and per-URL live/head results
 * Optional HEAD-only liveness check
 * Optional partial <head> download + meta parsing
 * Global hits-per-second rate-limit via asyncio.Semaphore
@@ -14,16 +15,16 @@ Features
 """
 
 from __future__ import annotations
-import aiofiles
 import asyncio
 import gzip
-import hashlib
 import io
 import json
 import os
 import pathlib
 import re
+import sqlite3
 import time
+import zlib
 from datetime import timedelta
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Sequence, Union
@@ -42,17 +43,14 @@ try:
     HAS_BROTLI = True
 except ImportError:
     HAS_BROTLI = False
-try:
-    import rank_bm25
-    HAS_BM25 = True
-except ImportError:
-    HAS_BM25 = False
 
 # Import AsyncLoggerBase from crawl4ai's logger module
 # Assuming crawl4ai/async_logger.py defines AsyncLoggerBase
 # You might need to adjust this import based on your exact file structure
 # Import AsyncLogger for default if needed
 from .async_logger import AsyncLoggerBase, AsyncLogger
+from .bm25 import BM25Index, TokenCache
+from .seeder_cache import SeederCache
 
 # Import SeedingConfig for type hints
 from typing import TYPE_CHECKING
@@ -66,6 +64,9 @@ COLLINFO_URL = "https://index.commoncrawl.org/collinfo.json"
 # CACHE_DIR.mkdir(exist_ok=True) # REMOVED: now managed by __init__
 # INDEX_CACHE = CACHE_DIR / "latest_cc_index.txt" # REMOVED: now managed by __init__
 TTL = timedelta(days=7)  # Keeping this constant as it's a seeder-specific TTL
+SITEMAP_CONCURRENCY = 8  # child sitemaps of an index fetched at once
+SITEMAP_QUEUE_SIZE = 10000  # parsed URLs buffered ahead of the consumer
+LIST_WRITE_BATCH = 1000  # discovered URLs written to the cache at once
 
 _meta_rx = re.compile(
     r'<meta\s+(?:[^>]*?(?:name|property|http-equiv)\s*=\s*["\']?([^"\' >]+)[^>]*?content\s*=\s*["\']?([^"\' >]+)[^>]*?)\/?>',
@@ -86,6 +87,10 @@ def _match(url: str, pattern: str) -> bool:
             or (canon.startswith("www.") and fnmatch.fnmatch(canon[4:], pattern)))
 
 
+def _bm25_tokens(text: str) -> List[str]:
+    return text.lower().split()
+
+
 def _parse_head(src: str) -> Dict[str, Any]:
     if LXML:
         try:
@@ -222,11 +227,14 @@ class AsyncUrlSeeder:
         self.index_id: Optional[str] = None
         self._rate_sem: Optional[asyncio.Semaphore] = None
 
-        # ───────── cache dirs ─────────
+        # ───────── cache ─────────
         self.cache_root = Path(os.path.expanduser(
             cache_root or "~/.cache/url_seeder"))
-        (self.cache_root / "live").mkdir(parents=True, exist_ok=True)
-        (self.cache_root / "head").mkdir(exist_ok=True)
+        self.cache_root.mkdir(parents=True, exist_ok=True)
+        # Opened on first use, so seeders that never touch the cache hold no connection
+        self._cache: Optional[SeederCache] = None
+        # Head text contexts are often re-scored across runs and queries
+        self._bm25_tokens = TokenCache(_bm25_tokens)
 
     def _log(self, level: str, message: str, tag: str = "URL_SEED", **kwargs: Any):
         """Helper to log messages using the provided logger, if available."""
@@ -239,29 +247,55 @@ class AsyncUrlSeeder:
             #     print(f"[{tag}] {level.upper()}: {message.format(**kwargs)}")
 
     # ───────── cache helpers ─────────
-    def _cache_path(self, kind: str, url: str) -> Path:
-        h = hashlib.sha1(url.encode()).hexdigest()
-        return self.cache_root / kind / f"{h}.json"
+    @property
+    def cache(self) -> SeederCache:
+        if self._cache is None:
+            self._cache = SeederCache(self.cache_root / "seeder.db", self.ttl.total_seconds())
+        return self._cache
 
     async def _cache_get(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
-        p = self._cache_path(kind, url)
-        if not p.exists():
-            return None
-        if time.time()-p.stat().st_mtime > self.ttl.total_seconds():
-            return None
         try:
-            async with aiofiles.open(p, "r") as f:
-                return json.loads(await f.read())
-        except Exception:
+            return await self.cache.get(kind, url)
+        except sqlite3.Error:
             return None
 
     async def _cache_set(self, kind: str, url: str, data: Dict[str, Any]) -> None:
         try:
-            async with aiofiles.open(self._cache_path(kind, url), "w") as f:
-                await f.write(json.dumps(data, separators=(",", ":")))
-        except Exception:
+            self.cache.put(kind, url, data)
+        except sqlite3.Error:
             pass
 
+    def _flush_cache(self) -> None:
+        if self._cache is None:
+            return
+        try:
+            self._cache.flush()
+        except sqlite3.Error as e:
+            self._log("warning", "Failed to write seeder cache: {error}",
+                      params={"error": str(e)}, tag="URL_SEED")
+
+    async def _cache_list(self, name: str, urls, pattern: str):
+        """
+        Yield the URLs of ``urls`` that match ``pattern`` while storing all of
+        them as the cached list ``name``. The list only counts as cached once
+        ``urls`` is exhausted.
+        """
+        self.cache.start_list(name)
+        batch: List[str] = []
+        try:
+            async for u in urls:
+                batch.append(u)
+                if len(batch) >= LIST_WRITE_BATCH:
+                    self.cache.extend_list(name, batch)
+                    batch = []
+                if _match(u, pattern):
+                    yield u
+        finally:
+            # Stop the source right away if the consumer stopped early
+            await urls.aclose()
+        self.cache.extend_list(name, batch)
+        self.cache.finish_list(name)
+
     # ─────────────────────────────── discovery entry
 
     async def urls(self,
@@ -420,6 +454,7 @@ class AsyncUrlSeeder:
         # Wait for all workers to finish
         await asyncio.gather(prod_task, *workers)
         await queue.join()  # Ensure all queued items are processed
+        self._flush_cache()
 
         self._log("info", "Finished URL seeding for {domain}. Total URLs: {count}",
                   params={"domain": domain, "count": len(results)}, tag="URL_SEED")
@@ -621,6 +656,7 @@ class AsyncUrlSeeder:
         
         # Wait for workers to finish canceling
         await asyncio.gather(*worker_tasks, return_exceptions=True)
+        self._flush_cache()
         
         # Apply BM25 scoring if query is provided
         if config.query and config.scoring_method == "bm25":
@@ -644,10 +680,6 @@ class AsyncUrlSeeder:
 
     async def _apply_bm25_scoring(self, results: List[Dict[str, Any]], config: "SeedingConfig") -> List[Dict[str, Any]]:
         """Apply BM25 scoring to results that have head_data."""
-        if not HAS_BM25:
-            self._log("warning", "BM25 scoring requested but rank_bm25 not available", tag="URL_SEED")
-            return results
-        
         # Extract text contexts from head data
         text_contexts = []
         valid_results = []
@@ -708,24 +740,18 @@ class AsyncUrlSeeder:
     # ─────────────────────────────── CC
     async def _from_cc(self, domain: str, pattern: str, force: bool):
         import re
-        digest = hashlib.md5(pattern.encode()).hexdigest()[:8]
 
         # ── normalise for CC   (strip scheme, query, fragment)
         raw = re.sub(r'^https?://', '', domain).split('#',
                                                       1)[0].split('?', 1)[0].lstrip('.')
-
-        # ── sanitize only for cache-file name
-        safe = re.sub('[/?#]+', '_', raw)
-        path = self.cache_dir / f"{self.index_id}_{safe}_{digest}.jsonl"
-
-        if path.exists() and not force:
-            self._log("info", "Loading CC URLs for {domain} from cache: {path}",
-                      params={"domain": domain, "path": path}, tag="URL_SEED")
-            async with aiofiles.open(path, "r") as fp:
-                async for line in fp:
-                    url = line.strip()
-                    if _match(url, pattern):
-                        yield url
+        # The whole CDX listing is cached, the pattern is applied on read
+        name = f"cc:{self.index_id}:{raw}"
+
+        if not force and self.cache.has_list(name):
+            self._log("info", "Loading CC URLs for {domain} from cache",
+                      params={"domain": domain}, tag="URL_SEED")
+            for url in self.cache.iter_list(name, pattern):
+                yield url
             return
 
         # build CC glob – if a path is present keep it, else add trailing /*
@@ -739,13 +765,9 @@ class AsyncUrlSeeder:
             try:
                 async with self.client.stream("GET", url) as r:
                     r.raise_for_status()
-                    async with aiofiles.open(path, "w") as fp:
-                        async for line in r.aiter_lines():
-                            rec = json.loads(line)
-                            u = rec["url"]
-                            await fp.write(u+"\n")
-                            if _match(u, pattern):
-                                yield u
+                    records = (json.loads(line)["url"] async for line in r.aiter_lines())
+                    async for u in self._cache_list(name, records, pattern):
+                        yield u
                 return
             except httpx.HTTPStatusError as e:
                 if e.response.status_code == 503 and i < len(retries):
@@ -769,26 +791,19 @@ class AsyncUrlSeeder:
         3. Yield only URLs that match `pattern`.
         """
 
-       # ── cache file (same logic as _from_cc)
+        # strip any scheme so we can handle https → http fallback
         host = re.sub(r'^https?://', '', domain).rstrip('/')
-        host = re.sub('[/?#]+', '_', domain)
-        digest = hashlib.md5(pattern.encode()).hexdigest()[:8]
-        path = self.cache_dir / f"sitemap_{host}_{digest}.jsonl"
-
-        if path.exists() and not force:
-            self._log("info", "Loading sitemap URLs for {d} from cache: {p}",
-                      params={"d": host, "p": str(path)}, tag="URL_SEED")
-            async with aiofiles.open(path, "r") as fp:
-                async for line in fp:
-                    url = line.strip()
-                    if _match(url, pattern):
-                        yield url
+        # All sitemap URLs are cached, the pattern is applied on read
+        name = f"sitemap:{host}"
+
+        if not force and self.cache.has_list(name):
+            self._log("info", "Loading sitemap URLs for {d} from cache",
+                      params={"d": host}, tag="URL_SEED")
+            for url in self.cache.iter_list(name, pattern):
+                yield url
             return
 
         # 1️⃣ direct sitemap probe
-        # strip any scheme so we can handle https → http fallback
-        host = re.sub(r'^https?://', '', domain).rstrip('/')
-
         schemes = ('https', 'http')  # prefer TLS, downgrade if needed
         for scheme in schemes:
             for suffix in ("/sitemap.xml", "/sitemap_index.xml"):
@@ -797,11 +812,8 @@ class AsyncUrlSeeder:
                 if sm:
                     self._log("info", "Found sitemap at {url}", params={
                               "url": sm}, tag="URL_SEED")
-                    async with aiofiles.open(path, "w") as fp:
-                        async for u in self._iter_sitemap(sm):
-                            await fp.write(u + "\n")
-                            if _match(u, pattern):
-                                yield u
+                    async for u in self._cache_list(name, self._iter_sitemap(sm), pattern):
+                        yield u
                     return
 
         # 2️⃣ robots.txt fallback
@@ -819,187 +831,166 @@ class AsyncUrlSeeder:
                       "d": domain, "e": str(e)}, tag="URL_SEED")
             return
 
+        async def listed_sitemaps():
+            for sm in sitemap_lines:
+                async for u in self._iter_sitemap(sm):
+                    yield u
+
         if sitemap_lines:
-            async with aiofiles.open(path, "w") as fp:
-                for sm in sitemap_lines:
-                    async for u in self._iter_sitemap(sm):
-                        await fp.write(u + "\n")
-                        if _match(u, pattern):
-                            yield u
+            async for u in self._cache_list(name, listed_sitemaps(), pattern):
+                yield u
 
     async def _iter_sitemap(self, url: str):
-        try:
-            r = await self.client.get(url, timeout=15, follow_redirects=True)
-            r.raise_for_status()
-        except httpx.HTTPStatusError as e:
-            self._log("warning", "Failed to fetch sitemap {url}: HTTP {status_code}",
-                      params={"url": url, "status_code": e.response.status_code}, tag="URL_SEED")
-            return
-        except httpx.RequestError as e:
-            self._log("warning", "Network error fetching sitemap {url}: {error}",
-                      params={"url": url, "error": str(e)}, tag="URL_SEED")
-            return
-        except Exception as e:
-            self._log("error", "Unexpected error fetching sitemap {url}: {error}",
-                      params={"url": url, "error": str(e)}, tag="URL_SEED")
-            return
-
-        data = gzip.decompress(r.content) if url.endswith(".gz") else r.content
-        base_url = str(r.url)
+        """
+        Stream the page URLs of a sitemap, following nested sitemap indexes.
 
-        def _normalize_loc(raw: Optional[str]) -> Optional[str]:
-            if not raw:
-                return None
-            normalized = urljoin(base_url, raw.strip())
-            if not normalized:
-                return None
-            return normalized
+        Child sitemaps are fetched concurrently (at most SITEMAP_CONCURRENCY at
+        a time) as soon as the index lists them, and URLs are yielded as they
+        are parsed, so neither a large sitemap nor a large index is ever held
+        in memory. Every URL is yielded; callers filter them in _cache_list,
+        so the cached list holds the whole sitemap.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=SITEMAP_QUEUE_SIZE)
+        sem = asyncio.Semaphore(SITEMAP_CONCURRENCY)
+        seen = set()
+        tasks = set()
+        pending = 0
+
+        def spawn(sitemap_url: str):
+            nonlocal pending
+            if sitemap_url in seen:
+                return
+            seen.add(sitemap_url)
+            pending += 1
+            task = asyncio.create_task(self._pump_sitemap(sitemap_url, queue, sem, spawn))
+            tasks.add(task)
+            task.add_done_callback(tasks.discard)
 
-        # Detect if this is a sitemap index by checking for <sitemapindex> or presence of <sitemap> elements
-        is_sitemap_index = False
-        sub_sitemaps = []
-        regular_urls = []
+        spawn(url)
+        try:
+            while pending:
+                item = await queue.get()
+                if item is None:
+                    pending -= 1
+                else:
+                    yield item
+        finally:
+            # Consumer stopped early, don't leave fetches running
+            for task in list(tasks):
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
 
-        # Use lxml for XML parsing if available, as it's generally more robust
-        if LXML:
-            try:
-                # Use XML parser for sitemaps, not HTML parser
-                parser = etree.XMLParser(recover=True)
-                root = etree.fromstring(data, parser=parser)
-                # Namespace-agnostic lookups using local-name() so we honor custom or missing namespaces
-                sitemap_loc_nodes = root.xpath("//*[local-name()='sitemap']/*[local-name()='loc']")
-                url_loc_nodes = root.xpath("//*[local-name()='url']/*[local-name()='loc']")
+    async def _pump_sitemap(self, url: str, queue: asyncio.Queue,
+                            sem: asyncio.Semaphore, spawn) -> None:
+        """Feed one sitemap's URLs into ``queue``, handing child sitemaps to ``spawn``"""
+        try:
+            async with sem:
+                url_count = sitemap_count = 0
+                async for kind, loc in self._stream_sitemap_locs(url):
+                    if kind == "sitemap":
+                        sitemap_count += 1
+                        self._log("debug", "Processing sub-sitemap: {url}",
+                                  params={"url": loc}, tag="URL_SEED")
+                        spawn(loc)
+                    else:
+                        url_count += 1
+                        await queue.put(loc)  # Will block if queue is full
 
                 self._log(
                     "debug",
                     "Parsed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
-                    params={
-                        "url": url,
-                        "sitemap_count": len(sitemap_loc_nodes),
-                        "url_count": len(url_loc_nodes),
-                    },
+                    params={"url": url, "sitemap_count": sitemap_count, "url_count": url_count},
                     tag="URL_SEED",
                 )
-
-                # Check for sitemap index entries
-                if sitemap_loc_nodes:
-                    is_sitemap_index = True
-                    for sitemap_elem in sitemap_loc_nodes:
-                        loc = _normalize_loc(sitemap_elem.text)
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                # If not a sitemap index, get regular URLs
-                if not is_sitemap_index:
-                    for loc_elem in url_loc_nodes:
-                        loc = _normalize_loc(loc_elem.text)
-                        if loc:
-                            regular_urls.append(loc)
-                    if not regular_urls:
-                        self._log(
-                            "warning",
-                            "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
-                            params={"url": url},
-                            tag="URL_SEED",
-                        )
-            except Exception as e:
-                self._log("error", "LXML parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
-        else:  # Fallback to xml.etree.ElementTree
-            import xml.etree.ElementTree as ET
-            try:
-                # Parse the XML
-                root = ET.fromstring(data)
-                # Remove namespace from tags for easier processing
-                for elem in root.iter():
-                    if '}' in elem.tag:
-                        elem.tag = elem.tag.split('}')[1]
-
-                # Check for sitemap index entries
-                sitemaps = root.findall('.//sitemap')
-                url_entries = root.findall('.//url')
-                self._log(
-                    "debug",
-                    "ElementTree parsed sitemap {url}: {sitemap_count} sitemap entries, {url_count} url entries discovered",
-                    params={
-                        "url": url,
-                        "sitemap_count": len(sitemaps),
-                        "url_count": len(url_entries),
-                    },
-                    tag="URL_SEED",
-                )
-                if sitemaps:
-                    is_sitemap_index = True
-                    for sitemap in sitemaps:
-                        loc_elem = sitemap.find('loc')
-                        loc = _normalize_loc(loc_elem.text if loc_elem is not None else None)
-                        if loc:
-                            sub_sitemaps.append(loc)
-
-                # If not a sitemap index, get regular URLs
-                if not is_sitemap_index:
-                    for url_elem in url_entries:
-                        loc_elem = url_elem.find('loc')
-                        loc = _normalize_loc(loc_elem.text if loc_elem is not None else None)
-                        if loc:
-                            regular_urls.append(loc)
-                    if not regular_urls:
-                        self._log(
-                            "warning",
-                            "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
-                            params={"url": url},
-                            tag="URL_SEED",
-                        )
-            except Exception as e:
-                self._log("error", "ElementTree parsing error for sitemap {url}: {error}",
-                          params={"url": url, "error": str(e)}, tag="URL_SEED")
-                return
-
-        # Process based on type
-        if is_sitemap_index and sub_sitemaps:
-            self._log("info", "Processing sitemap index with {count} sub-sitemaps in parallel",
-                      params={"count": len(sub_sitemaps)}, tag="URL_SEED")
-
-            # Create a bounded queue for results to prevent RAM issues
-            # For sitemap indexes, use a larger queue as we expect many URLs
-            queue_size = min(50000, len(sub_sitemaps) * 1000)  # Estimate 1000 URLs per sitemap
-            result_queue = asyncio.Queue(maxsize=queue_size)
-            completed_count = 0
-            total_sitemaps = len(sub_sitemaps)
-
-            async def process_subsitemap(sitemap_url: str):
-                try:
+                if not url_count and not sitemap_count:
                     self._log(
-                        "debug", "Processing sub-sitemap: {url}", params={"url": sitemap_url}, tag="URL_SEED")
-                    # Recursively process sub-sitemap
-                    async for u in self._iter_sitemap(sitemap_url):
-                        await result_queue.put(u)  # Will block if queue is full
-                except Exception as e:
-                    self._log("error", "Error processing sub-sitemap {url}: {error}",
-                              params={"url": sitemap_url, "error": str(e)}, tag="URL_SEED")
-                finally:
-                    # Put sentinel to signal completion
-                    await result_queue.put(None)
-
-            # Start all tasks
-            tasks = [asyncio.create_task(process_subsitemap(sm))
-                     for sm in sub_sitemaps]
+                        "warning",
+                        "No <loc> entries found inside <url> tags for sitemap {url}. The sitemap might be empty or use an unexpected structure.",
+                        params={"url": url},
+                        tag="URL_SEED",
+                    )
+        except httpx.HTTPStatusError as e:
+            self._log("warning", "Failed to fetch sitemap {url}: HTTP {status_code}",
+                      params={"url": url, "status_code": e.response.status_code}, tag="URL_SEED")
+        except httpx.RequestError as e:
+            self._log("warning", "Network error fetching sitemap {url}: {error}",
+                      params={"url": url, "error": str(e)}, tag="URL_SEED")
+        except (SyntaxError, zlib.error) as e:
+            # ElementTree.ParseError and lxml's XMLSyntaxError are SyntaxErrors
+            self._log("error", "Parsing error for sitemap {url}: {error}",
+                      params={"url": url, "error": str(e)}, tag="URL_SEED")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._log("error", "Unexpected error processing sitemap {url}: {error}",
+                      params={"url": url, "error": str(e)}, tag="URL_SEED")
+        # Sentinel, one per sitemap. A cancelled pump skips it: the consumer
+        # has stopped reading, and a put into a full queue would never return.
+        await queue.put(None)
 
-            # Yield results as they come in
-            while completed_count < total_sitemaps:
-                item = await result_queue.get()
-                if item is None:
-                    completed_count += 1
-                else:
-                    yield item
+    async def _stream_sitemap_locs(self, url: str):
+        """
+        Yield ("url" | "sitemap", loc) pairs from a sitemap while it downloads.
 
-            # Ensure all tasks are done
-            await asyncio.gather(*tasks, return_exceptions=True)
-        else:
-            # Regular sitemap - yield URLs directly
-            for u in regular_urls:
-                yield u
+        Gzipped bodies are inflated chunk by chunk, and each <url>/<sitemap>
+        element is dropped from the tree once read, so memory stays flat
+        however large the sitemap is. Tags are matched by local name, so
+        custom or missing namespaces work.
+        """
+        async with self.client.stream("GET", url, timeout=15, follow_redirects=True) as r:
+            r.raise_for_status()
+            base_url = str(r.url)
+            if LXML:
+                parser = etree.XMLPullParser(events=("start", "end"), recover=True)
+            else:
+                import xml.etree.ElementTree as ET
+                parser = ET.XMLPullParser(events=("start", "end"))
+            stack: List[Any] = []
+            inflate = None
+            first = True
+
+            def entries():
+                for event, elem in parser.read_events():
+                    if event == "start":
+                        stack.append(elem)
+                        continue
+                    stack.pop()
+                    if not isinstance(elem.tag, str):
+                        continue
+                    kind = elem.tag.rpartition("}")[2]
+                    if kind not in ("url", "sitemap"):
+                        continue
+                    for child in elem:
+                        if isinstance(child.tag, str) and child.tag.rpartition("}")[2] == "loc":
+                            loc = urljoin(base_url, child.text.strip()) if child.text else None
+                            if loc:
+                                yield kind, loc
+                            break
+                    # Only earlier siblings are dropped, lxml still links
+                    # the next element to this one
+                    elem.clear()
+                    if stack:
+                        parent = stack[-1]
+                        while len(parent) > 1 and parent[0] is not elem:
+                            del parent[0]
+
+            async for chunk in r.aiter_bytes():
+                if first:
+                    first = False
+                    # .gz sitemaps are usually served without Content-Encoding
+                    if chunk[:2] == b"\x1f\x8b":
+                        inflate = zlib.decompressobj(16 + zlib.MAX_WBITS)
+                if inflate is not None:
+                    chunk = inflate.decompress(chunk)
+                parser.feed(chunk)
+                for entry in entries():
+                    yield entry
+
+            if inflate is not None:
+                parser.feed(inflate.flush())
+            parser.close()
+            for entry in entries():
+                yield entry
 
     # ─────────────────────────────── validate helpers
     async def _validate(self, url: str, res_list: List[Dict[str, Any]], live: bool,
@@ -1424,46 +1415,32 @@ class AsyncUrlSeeder:
         return False
     
     def _calculate_bm25_score(self, query: str, documents: List[str]) -> List[float]:
-        """Calculate BM25 scores for documents against a query."""
-        if not HAS_BM25:
-            self._log(
-                "warning", "rank_bm25 not installed. Returning zero scores.", tag="URL_SEED")
-            return [0.0] * len(documents)
-
+        """Calculate BM25 scores for documents against a query, normalized to 0-1."""
         if not query or not documents:
             return [0.0] * len(documents)
 
         # Tokenize query and documents (simple whitespace tokenization)
-        # For production, consider using a proper tokenizer
-        query_tokens = query.lower().split()
-        tokenized_docs = [doc.lower().split() for doc in documents]
+        tokenized_docs = [self._bm25_tokens(doc) for doc in documents]
 
         # Handle edge case where all documents are empty
         if all(len(doc) == 0 for doc in tokenized_docs):
             return [0.0] * len(documents)
 
-        # Create BM25 instance and calculate scores
         try:
-            from rank_bm25 import BM25Okapi
-            bm25 = BM25Okapi(tokenized_docs)
-            scores = bm25.get_scores(query_tokens)
+            bm25 = BM25Index()
+            bm25.add_documents(tokenized_docs)
+            scores = bm25.get_scores(_bm25_tokens(query))
 
             # Normalize scores to 0-1 range
-            # BM25 can return negative scores, so we need to handle the full range
-            if len(scores) == 0:
-                return []
-            
-            min_score = min(scores)
-            max_score = max(scores)
-            
+            min_score = scores.min()
+            max_score = scores.max()
+
             # If all scores are the same, return 0.5 for all
             if max_score == min_score:
                 return [0.5] * len(scores)
-            
-            # Normalize to 0-1 range using min-max normalization
-            normalized_scores = [(score - min_score) / (max_score - min_score) for score in scores]
 
-            return normalized_scores
+            # Normalize to 0-1 range using min-max normalization
+            return ((scores - min_score) / (max_score - min_score)).tolist()
         except Exception as e:
             self._log("error", "Error calculating BM25 scores: {error}",
                       params={"error": str(e)}, tag="URL_SEED")
@@ -1471,7 +1448,11 @@ class AsyncUrlSeeder:
 
     # ─────────────────────────────── cleanup methods
     async def close(self):
-        """Close the HTTP client if we own it."""
+        """Write pending cache entries, close the cache and the HTTP client if we own it."""
+        self._flush_cache()
+        if self._cache is not None:
+            self._cache.close()
+            self._cache = None
         if self._owns_client and self.client:
             await self.client.aclose()
             self._log("debug", "Closed HTTP client", tag="URL_SEED")
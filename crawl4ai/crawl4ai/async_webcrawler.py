@@ -37,8 +37,11 @@ from .deep_crawling import DeepCrawlDecorator
 from .async_logger import AsyncLogger, AsyncLoggerBase
 from .async_configs import BrowserConfig, CrawlerRunConfig, ProxyConfig, SeedingConfig
 from .async_dispatcher import *  # noqa: F403
-from .async_dispatcher import BaseDispatcher, MemoryAdaptiveDispatcher, RateLimiter
+from .async_dispatcher import BaseDispatcher, MemoryAdaptiveDispatcher, RateLimiter, UrlSource
 from .async_url_seeder import AsyncUrlSeeder
+from .parsed_document import ParsedDocument
+from .process_pool import HTMLProcessPool
+from .config import FIT_HTML_TEXT_THRESHOLD, FIT_HTML_MAX_SIZE
 
 from .utils import (
     sanitize_input_encode,
@@ -115,6 +118,7 @@ class AsyncWebCrawler:
             os.getenv("CRAWL4_AI_BASE_DIRECTORY", Path.home())),
         thread_safe: bool = False,
         logger: AsyncLoggerBase = None,
+        html_process_pool: Optional[HTMLProcessPool] = None,
         **kwargs,
     ):
         """
@@ -125,6 +129,8 @@ class AsyncWebCrawler:
             config: Configuration object for browser settings. Default BrowserConfig()
             base_directory: Base directory for storing cache
             thread_safe: Whether to use thread-safe operations
+            html_process_pool: Process pool to run HTML post-processing in. Default None (in-process).
+                The crawler shuts it down on close().
             **kwargs: Additional arguments for backwards compatibility
         """
         # Handle browser configuration
@@ -151,6 +157,8 @@ class AsyncWebCrawler:
         # Thread safety setup
         self._lock = asyncio.Lock() if thread_safe else None
 
+        self.html_process_pool = html_process_pool
+
         # Initialize directories
         self.crawl4ai_folder = os.path.join(base_directory, ".crawl4ai")
         os.makedirs(self.crawl4ai_folder, exist_ok=True)
@@ -187,8 +195,14 @@ class AsyncWebCrawler:
         This method will:
         1. Clean up browser resources
         2. Close any open pages and contexts
+        3. Write any cache entries still queued by the database write-behind
+        4. Close the robots.txt parser's HTTP session
         """
         await self.crawler_strategy.__aexit__(None, None, None)
+        await async_db_manager.aflush_writes()
+        await self.robots_parser.close()
+        if self.html_process_pool is not None:
+            self.html_process_pool.shutdown(wait=False)
 
     async def __aenter__(self):
         return await self.start()
@@ -355,7 +369,7 @@ class AsyncWebCrawler:
                     # Process the HTML content, Call CrawlerStrategy.process_html #
                     ###############################################################
                     from urllib.parse import urlparse
-                    crawl_result: CrawlResult = await self.aprocess_html(
+                    process_kwargs = dict(
                         url=url,
                         html=html,
                         extracted_content=extracted_content,
@@ -368,6 +382,10 @@ class AsyncWebCrawler:
                         original_scheme=urlparse(url).scheme,
                         **kwargs,
                     )
+                    if self.html_process_pool is not None:
+                        crawl_result: CrawlResult = await self.html_process_pool.process(self, **process_kwargs)
+                    else:
+                        crawl_result: CrawlResult = await self.aprocess_html(**process_kwargs)
 
                     crawl_result.status_code = async_response.status_code
                     crawl_result.redirected_url = async_response.redirected_url or url
@@ -476,6 +494,19 @@ class AsyncWebCrawler:
             params.update({k: v for k, v in kwargs.items()
                           if k not in params.keys()})
 
+            # Parse the page once and share it across scraping, schema
+            # preprocessing and extraction. Keeping a shared tree around only
+            # pays off when a read-only stage will use it.
+            extraction_strategy = config.extraction_strategy
+            document = ParsedDocument(
+                html,
+                share=bool(
+                    not extracted_content
+                    and getattr(extraction_strategy, "uses_shared_lxml", False)
+                ),
+            )
+            params["document"] = document
+
             ################################
             # Scraping Strategy Execution  #
             ################################
@@ -512,7 +543,20 @@ class AsyncWebCrawler:
             links = result.links.model_dump() if hasattr(result.links, 'model_dump') else result.links
             metadata = result.metadata
 
-        fit_html = preprocess_html_for_schema(html_content=html, text_threshold= 500, max_size= 300_000)
+        # fit_html is only built if markdown or extraction asks for it here,
+        # otherwise CrawlResult.fit_html builds it on first read
+        fit_html = None
+
+        def get_fit_html() -> str:
+            nonlocal fit_html
+            if fit_html is None:
+                fit_html = preprocess_html_for_schema(
+                    html_content=html,
+                    text_threshold=FIT_HTML_TEXT_THRESHOLD,
+                    max_size=FIT_HTML_MAX_SIZE,
+                    document=document,
+                )
+            return fit_html
 
         ################################
         # Generate Markdown            #
@@ -529,7 +573,7 @@ class AsyncWebCrawler:
         html_source_selector = {
             "raw_html": lambda: html,  # The original raw HTML
             "cleaned_html": lambda: cleaned_html,  # The HTML after scraping strategy
-            "fit_html": lambda: fit_html,  # The HTML after preprocessing for schema
+            "fit_html": get_fit_html,  # The HTML after preprocessing for schema
         }
 
         markdown_input_html = cleaned_html  # Default to cleaned_html
@@ -603,12 +647,12 @@ class AsyncWebCrawler:
                 content_format = "markdown"
 
             content = {
-                "markdown": markdown_result.raw_markdown,
-                "html": html,
-                "fit_html": fit_html,
-                "cleaned_html": cleaned_html,
-                "fit_markdown": markdown_result.fit_markdown,
-            }.get(content_format, markdown_result.raw_markdown)
+                "markdown": lambda: markdown_result.raw_markdown,
+                "html": lambda: html,
+                "fit_html": get_fit_html,
+                "cleaned_html": lambda: cleaned_html,
+                "fit_markdown": lambda: markdown_result.fit_markdown,
+            }.get(content_format, lambda: markdown_result.raw_markdown)()
 
             # Use IdentityChunking for HTML input, otherwise use provided chunking strategy
             chunking = (
@@ -619,13 +663,18 @@ class AsyncWebCrawler:
             sections = chunking.chunk(content)
             # extracted_content = config.extraction_strategy.run(url, sections)
 
+            # Schema-based strategies can reuse the page's parsed raw HTML
+            extraction_kwargs = {}
+            if content_format == "html" and isinstance(config.extraction_strategy, JsonElementExtractionStrategy):
+                extraction_kwargs["document"] = document
+
             # Use async version if available for better parallelism
             if hasattr(config.extraction_strategy, 'arun'):
-                extracted_content = await config.extraction_strategy.arun(url, sections)
+                extracted_content = await config.extraction_strategy.arun(url, sections, **extraction_kwargs)
             else:
                 # Fallback to sync version run in thread pool to avoid blocking
                 extracted_content = await asyncio.to_thread(
-                    config.extraction_strategy.run, url, sections
+                    config.extraction_strategy.run, url, sections, **extraction_kwargs
                 )
 
             extracted_content = json.dumps(
@@ -664,7 +713,7 @@ class AsyncWebCrawler:
 
     async def arun_many(
         self,
-        urls: List[str],
+        urls: UrlSource,
         config: Optional[Union[CrawlerRunConfig, List[CrawlerRunConfig]]] = None,
         dispatcher: Optional[BaseDispatcher] = None,
         # Legacy parameters maintained for backwards compatibility
@@ -685,7 +734,8 @@ class AsyncWebCrawler:
         Runs the crawler for multiple URLs concurrently using a configurable dispatcher strategy.
 
         Args:
-        urls: List of URLs to crawl
+        urls: URLs to crawl. A list, or any iterable / async iterable (sitemap stream,
+            DB cursor, seeder output), which is consumed lazily with bounded prefetch.
         config: Configuration object(s) controlling crawl behavior. Can be:
             - Single CrawlerRunConfig: Used for all URLs
             - List[CrawlerRunConfig]: Configs with url_matcher for URL-specific settings
@@ -712,6 +762,17 @@ class AsyncWebCrawler:
             config=CrawlerRunConfig(cache_mode=CacheMode.BYPASS, stream=True),
         ):
             print(f"Processed {result.url}: {len(result.markdown)} chars")
+
+        # Streaming input, results start before the source is exhausted
+        async def url_stream():
+            async for row in db_cursor:
+                yield row["url"]
+
+        async for result in await crawler.arun_many(
+            urls=url_stream(),
+            config=CrawlerRunConfig(stream=True),
+        ):
+            ...
         """
         config = config or CrawlerRunConfig()
         # if config is None:
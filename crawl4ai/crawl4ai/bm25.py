@@ -0,0 +1,171 @@
+"""
+Okapi BM25 scoring shared by the URL seeder and BM25ContentFilter.
+
+BM25Index keeps its corpus as a term-frequency matrix in compressed sparse
+column form (NumPy arrays: term pointers, document ids, frequencies). Scoring
+a query touches only the columns of the query terms and sums their
+contributions per document with one ``np.bincount``, instead of looping over
+every document in Python. Documents can be added at any time; the matrix is
+rebuilt lazily on the next query.
+
+Scores are the same as ``rank_bm25.BM25Okapi`` (ATIRE idf with an epsilon
+floor for terms found in more than half of the documents).
+
+TokenCache memoizes a tokenizer by a hash of the text, so chunks repeated
+across pages (navigation, footers) or re-scored documents are tokenized once.
+"""
+
+import threading
+from collections import Counter, OrderedDict
+from typing import Callable, Dict, Iterable, List, Sequence
+
+import numpy as np
+import xxhash
+
+
+class BM25Index:
+    """
+    Incremental BM25 index over pre-tokenized documents.
+
+        index = BM25Index()
+        index.add_documents([["fast", "crawler"], ["slow", "crawler"]])
+        scores = index.get_scores(["fast"])   # np.ndarray, one score per doc
+    """
+
+    def __init__(self, k1: float = 1.5, b: float = 0.75, epsilon: float = 0.25):
+        self.k1 = k1
+        self.b = b
+        self.epsilon = epsilon
+        self.vocab: Dict[str, int] = {}
+        self._df: List[int] = []
+        self._doc_len: List[int] = []
+        # Unsorted (doc, term, tf) triples added since the last compile
+        self._blocks: List[tuple] = []
+        self._compiled = None
+
+    def __len__(self) -> int:
+        return len(self._doc_len)
+
+    def add_document(self, tokens: Sequence[str]) -> int:
+        """Add one document, returning its id"""
+        return self.add_documents([tokens])[0]
+
+    def add_documents(self, corpus: Iterable[Sequence[str]]) -> range:
+        """Add documents, returning the range of their ids"""
+        start = len(self._doc_len)
+        vocab, df = self.vocab, self._df
+        docs: List[int] = []
+        terms: List[int] = []
+        tfs: List[int] = []
+
+        for tokens in corpus:
+            doc = len(self._doc_len)
+            counts = Counter(tokens)
+            for term, tf in counts.items():
+                term_id = vocab.get(term)
+                if term_id is None:
+                    term_id = vocab[term] = len(df)
+                    df.append(0)
+                df[term_id] += 1
+                terms.append(term_id)
+                tfs.append(tf)
+            docs.extend([doc] * len(counts))
+            self._doc_len.append(len(tokens))
+
+        if terms:
+            self._blocks.append((
+                np.array(docs, dtype=np.int64),
+                np.array(terms, dtype=np.int64),
+                np.array(tfs, dtype=np.float64),
+            ))
+        self._compiled = None
+        return range(start, len(self._doc_len))
+
+    def _compile(self) -> tuple:
+        """Column-sorted matrix, per-document length norms and term idf"""
+        if self._compiled is not None:
+            return self._compiled
+
+        if len(self._blocks) > 1:
+            self._blocks = [tuple(np.concatenate(parts) for parts in zip(*self._blocks))]
+        n_terms = len(self._df)
+        if self._blocks:
+            docs, terms, tfs = self._blocks[0]
+            order = np.argsort(terms, kind="stable")
+            docs, tfs = docs[order], tfs[order]
+            indptr = np.searchsorted(terms[order], np.arange(n_terms + 1))
+        else:
+            docs = np.zeros(0, dtype=np.int64)
+            tfs = np.zeros(0)
+            indptr = np.zeros(n_terms + 1, dtype=np.int64)
+
+        n_docs = len(self._doc_len)
+        doc_len = np.array(self._doc_len, dtype=np.float64)
+        avgdl = doc_len.mean() if n_docs else 0.0
+        norm = self.k1 * (1 - self.b + self.b * doc_len / avgdl) if avgdl else None
+
+        df = np.array(self._df, dtype=np.float64)
+        idf = np.log(n_docs - df + 0.5) - np.log(df + 0.5)
+        if n_terms:
+            # Terms in more than half of the documents get a small positive idf
+            idf[idf < 0] = self.epsilon * idf.mean()
+
+        self._compiled = (indptr, docs, tfs, norm, idf)
+        return self._compiled
+
+    def get_scores(self, query: Sequence[str]) -> np.ndarray:
+        """BM25 score of every document for ``query``, in document id order"""
+        n_docs = len(self._doc_len)
+        counts = Counter(term for term in query if term in self.vocab)
+        if not counts or not n_docs:
+            return np.zeros(n_docs)
+        indptr, docs, tfs, norm, idf = self._compile()
+        if norm is None:
+            # Every document is empty
+            return np.zeros(n_docs)
+
+        term_ids = np.fromiter((self.vocab[t] for t in counts), dtype=np.int64, count=len(counts))
+        # Repeated query terms count once per occurrence, as in rank_bm25
+        weights = np.fromiter(counts.values(), dtype=np.float64, count=len(counts)) * idf[term_ids]
+        starts, ends = indptr[term_ids], indptr[term_ids + 1]
+        positions = np.concatenate([np.arange(s, e) for s, e in zip(starts, ends)])
+
+        rows = docs[positions]
+        tf = tfs[positions]
+        contrib = np.repeat(weights, ends - starts) * tf * (self.k1 + 1) / (tf + norm[rows])
+        return np.bincount(rows, weights=contrib, minlength=n_docs)
+
+
+class TokenCache:
+    """
+    LRU memo of ``tokenizer(text)`` keyed by a 64-bit hash of the text.
+
+    Safe to share between threads. The cache is not pickled, so objects
+    holding one stay cheap to send to worker processes.
+    """
+
+    def __init__(self, tokenizer: Callable[[str], List[str]], max_size: int = 10000):
+        self.tokenizer = tokenizer
+        self.max_size = max_size
+        self._cache: "OrderedDict[int, List[str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __call__(self, text: str) -> List[str]:
+        key = xxhash.xxh64_intdigest(text)
+        with self._lock:
+            tokens = self._cache.get(key)
+            if tokens is not None:
+                self._cache.move_to_end(key)
+                return tokens
+        tokens = self.tokenizer(text)
+        with self._lock:
+            self._cache[key] = tokens
+            if len(self._cache) > self.max_size:
+                self._cache.popitem(last=False)
+        return tokens
+
+    def __getstate__(self):
+        return {"tokenizer": self.tokenizer, "max_size": self.max_size}
+
+    def __setstate__(self, state):
+        self.__init__(**state)
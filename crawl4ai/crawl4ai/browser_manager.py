@@ -1,6 +1,8 @@
 import asyncio
 import time
-from typing import List, Optional
+from collections import OrderedDict, deque
+from functools import lru_cache
+from typing import Awaitable, Callable, Deque, Dict, List, Optional, Set
 import os
 import sys
 import shutil
@@ -9,10 +11,10 @@ import psutil
 import signal
 import subprocess
 import shlex
-from playwright.async_api import BrowserContext
+from playwright.async_api import BrowserContext, Page
 import hashlib
 from .js_snippet import load_js_script
-from .config import DOWNLOAD_PAGE_TIMEOUT
+from .config import DOWNLOAD_PAGE_TIMEOUT, PAGE_RESET_TIMEOUT
 from .async_configs import BrowserConfig, CrawlerRunConfig
 from .utils import get_chromium_path
 import warnings
@@ -559,6 +561,338 @@ async def clone_runtime_state(
 
 
 
+# CrawlerRunConfig fields that create_browser_context and setup_context read.
+# Configs that agree on these can share a browser context.
+CONTEXT_CONFIG_FIELDS = (
+    "proxy_config",
+    "locale",
+    "timezone_id",
+    "geolocation",
+    "override_navigator",
+    "simulate_user",
+    "magic",
+)
+
+
+def _freeze(value):
+    """Hashable form of a config value"""
+    if hasattr(value, "to_dict"):
+        value = value.to_dict()
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+@lru_cache(maxsize=1024)
+def _signature_hash(values: tuple) -> str:
+    return hashlib.sha256(repr(values).encode("utf-8")).hexdigest()
+
+
+class PooledContext:
+    """A browser context held by ContextPool, with its usage counters and warm pages"""
+
+    __slots__ = (
+        "context", "signature", "last_used", "pages_served", "open_pages",
+        "retired", "idle", "out", "uses", "new_page", "refilling",
+    )
+
+    def __init__(self, context: BrowserContext, signature: str):
+        self.context = context
+        self.signature = signature
+        self.last_used = time.monotonic()
+        self.pages_served = 0
+        # Pages open on the context, idle ones included, plus pages being opened
+        self.open_pages = 0
+        self.retired = False
+        # Reset pages waiting to be handed out, pages handed out, and how
+        # often each page was used
+        self.idle: Deque[Page] = deque()
+        self.out: Set[Page] = set()
+        self.uses: Dict[Page, int] = {}
+        self.new_page: Optional[Callable[[BrowserContext], Awaitable[Page]]] = None
+        self.refilling = False
+
+    @property
+    def busy(self) -> bool:
+        return self.open_pages > len(self.idle)
+
+
+class ContextPool:
+    """
+    Browser contexts keyed by config signature, bounded in number and age.
+
+    A context leaves the pool when it is the least recently used one beyond
+    ``max_contexts``, has been idle for ``ttl`` seconds, or has served
+    ``max_pages`` pages (0 disables recycling). It is closed once its last
+    open page closes, so eviction never pulls a context out from under a
+    running crawl.
+
+    With ``page_pool_size`` each context also keeps that many warm pages:
+    pages are created ahead of demand in the background, and pages handed
+    back through recycle() are reset and reused, up to ``page_max_reuse``
+    crawls each, instead of being closed.
+    """
+
+    def __init__(
+        self,
+        max_contexts: int = 16,
+        ttl: float = 600,
+        max_pages: int = 0,
+        page_pool_size: int = 0,
+        page_max_reuse: int = 50,
+        logger=None,
+    ):
+        self.max_contexts = max_contexts
+        self.ttl = ttl
+        self.max_pages = max_pages
+        self.page_pool_size = page_pool_size
+        self.page_max_reuse = page_max_reuse
+        self.logger = logger
+        self.entries: "OrderedDict[str, PooledContext]" = OrderedDict()
+        self.stats = {
+            "hits": 0,
+            "misses": 0,
+            "evictions": 0,
+            "recycled": 0,
+            "warm_pages": 0,
+            "cold_pages": 0,
+        }
+        self._lock = asyncio.Lock()
+        self._retired: List[PooledContext] = []
+        self._page_entries: Dict[Page, PooledContext] = {}
+        self._tasks = set()
+
+    def __len__(self):
+        return len(self.entries)
+
+    def owns(self, context: BrowserContext) -> bool:
+        return any(e.context is context for e in (*self.entries.values(), *self._retired))
+
+    async def acquire(
+        self, signature: str, factory: Callable[[], Awaitable[BrowserContext]]
+    ) -> PooledContext:
+        """Context for a signature, created with factory on a miss. Pair with release()."""
+        async with self._lock:
+            now = time.monotonic()
+            for entry in list(self.entries.values()):
+                if self.ttl and now - entry.last_used > self.ttl and not entry.busy:
+                    self._retire(entry, "evictions")
+
+            entry = self.entries.get(signature)
+            if entry is not None and self.max_pages and entry.pages_served >= self.max_pages:
+                self._retire(entry, "recycled")
+                entry = None
+
+            if entry is None:
+                self.stats["misses"] += 1
+                entry = PooledContext(await factory(), signature)
+                entry.context.on("close", lambda _: self._forget(entry))
+                self.entries[signature] = entry
+                while len(self.entries) > max(self.max_contexts, 1):
+                    self._retire(next(iter(self.entries.values())), "evictions")
+            else:
+                self.stats["hits"] += 1
+                self.entries.move_to_end(signature)
+
+            entry.last_used = now
+            entry.pages_served += 1
+            entry.open_pages += 1
+            return entry
+
+    def release(self, entry: PooledContext):
+        """A page taken from entry has closed"""
+        entry.open_pages -= 1
+        entry.last_used = time.monotonic()
+        if entry.retired and entry.open_pages <= 0:
+            self._close(entry)
+
+    async def open_page(
+        self, entry: PooledContext, new_page: Callable[[BrowserContext], Awaitable[Page]]
+    ) -> Page:
+        """
+        Page on a context from acquire(): a warm idle page when there is one,
+        else a new page made by new_page. The page counts as open on the
+        context until it closes.
+        """
+        page = None
+        while entry.idle and page is None:
+            candidate = entry.idle.popleft()
+            if not candidate.is_closed():
+                page = candidate
+                # The page was already counted, drop the acquire() lease
+                entry.open_pages -= 1
+                self.stats["warm_pages"] += 1
+
+        if page is None:
+            try:
+                page = await new_page(entry.context)
+            except Exception:
+                self.release(entry)
+                raise
+            self._track(entry, page)
+            self.stats["cold_pages"] += 1
+
+        entry.uses[page] = entry.uses.get(page, 0) + 1
+        entry.out.add(page)
+        entry.new_page = new_page
+        self._refill(entry)
+        return page
+
+    def recycle(self, page: Page, reset: Callable[[Page], Awaitable[None]]) -> bool:
+        """
+        Reset a page handed back after a crawl in the background, then keep
+        it for reuse. Returns False, leaving the page alone, when it can't be
+        reused and should be closed instead.
+        """
+        entry = self._page_entries.get(page)
+        if (
+            entry is None
+            or entry.retired
+            or not self.page_pool_size
+            or entry.uses.get(page, 0) >= self.page_max_reuse
+            or page.is_closed()
+        ):
+            return False
+        self._spawn(self._recycle(entry, page, reset))
+        return True
+
+    async def _recycle(self, entry: PooledContext, page: Page, reset):
+        try:
+            await reset(page)
+        except Exception as e:
+            # Unhealthy page, the refill replaces it with a fresh one
+            if self.logger:
+                self.logger.debug(
+                    message="Closing page that failed its reset: {error}",
+                    tag="BROWSER",
+                    params={"error": str(e)},
+                )
+            await self._close_page(page)
+            return
+        if entry.retired or page.is_closed() or len(entry.idle) >= self.page_pool_size:
+            await self._close_page(page)
+        else:
+            entry.out.discard(page)
+            entry.idle.append(page)
+
+    def _stock(self, entry: PooledContext) -> int:
+        """Idle pages plus handed out pages expected to come back"""
+        returning = sum(1 for page in entry.out if entry.uses[page] < self.page_max_reuse)
+        return len(entry.idle) + returning
+
+    def _refill(self, entry: PooledContext):
+        """
+        Create pages in the background until the context has page_pool_size
+        pages idle or coming back, so returned pages are reused rather than
+        crowded out by fresh ones.
+        """
+        if (
+            self.page_pool_size
+            and entry.new_page is not None
+            and not entry.retired
+            and not entry.refilling
+            and self._stock(entry) < self.page_pool_size
+        ):
+            entry.refilling = True
+            self._spawn(self._fill(entry))
+
+    async def _fill(self, entry: PooledContext):
+        try:
+            while not entry.retired and self._stock(entry) < self.page_pool_size:
+                entry.open_pages += 1
+                try:
+                    page = await entry.new_page(entry.context)
+                except Exception as e:
+                    self.release(entry)
+                    if self.logger:
+                        self.logger.warning(
+                            message="Failed to pre-create page: {error}",
+                            tag="BROWSER",
+                            params={"error": str(e)},
+                        )
+                    return
+                self._track(entry, page)
+                if entry.retired:
+                    await self._close_page(page)
+                else:
+                    entry.idle.append(page)
+        finally:
+            entry.refilling = False
+
+    def _track(self, entry: PooledContext, page: Page):
+        self._page_entries[page] = entry
+        page.once("close", lambda _: self._page_closed(entry, page))
+
+    def _page_closed(self, entry: PooledContext, page: Page):
+        self._page_entries.pop(page, None)
+        entry.uses.pop(page, None)
+        entry.out.discard(page)
+        if page in entry.idle:
+            entry.idle.remove(page)
+        self.release(entry)
+        self._refill(entry)
+
+    async def _close_page(self, page: Page):
+        try:
+            await page.close()
+        except Exception:
+            pass
+
+    def _retire(self, entry: PooledContext, reason: str):
+        self.stats[reason] += 1
+        self.entries.pop(entry.signature, None)
+        entry.retired = True
+        if entry.open_pages <= 0:
+            self._close(entry)
+        else:
+            self._retired.append(entry)
+            # Idle pages would keep it open, the last close closes the context
+            for page in list(entry.idle):
+                self._spawn(self._close_page(page))
+
+    def _forget(self, entry: PooledContext):
+        """The context was closed from outside the pool"""
+        entry.retired = True
+        if self.entries.get(entry.signature) is entry:
+            del self.entries[entry.signature]
+        if entry in self._retired:
+            self._retired.remove(entry)
+
+    def _close(self, entry: PooledContext):
+        if entry in self._retired:
+            self._retired.remove(entry)
+        self._spawn(self._close_context(entry.context))
+
+    def _spawn(self, coro):
+        task = asyncio.ensure_future(coro)
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _close_context(self, context: BrowserContext):
+        try:
+            await context.close()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    message="Error closing context: {error}",
+                    tag="ERROR",
+                    params={"error": str(e)},
+                )
+
+    async def close(self):
+        """Close every context, in use or not"""
+        entries = [*self.entries.values(), *self._retired]
+        self.entries.clear()
+        self._retired.clear()
+        for entry in entries:
+            entry.retired = True
+            await self._close_context(entry.context)
+        if self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+
 class BrowserManager:
     """
     Manages the browser instance and context.
@@ -572,6 +906,7 @@ class BrowserManager:
         playwright (Playwright): The Playwright instance
         sessions (dict): Dictionary to store session information
         session_ttl (int): Session timeout in seconds
+        context_pool (ContextPool): Contexts shared by non-session pages, keyed by config signature
     """
 
     _playwright_instance = None
@@ -608,9 +943,15 @@ class BrowserManager:
         self.sessions = {}
         self.session_ttl = 1800  # 30 minutes
 
-        # Keep track of contexts by a "config signature," so each unique config reuses a single context
-        self.contexts_by_config = {}
-        self._contexts_lock = asyncio.Lock()
+        # Contexts by "config signature", so each unique config reuses a single context
+        self.context_pool = ContextPool(
+            max_contexts=self.config.max_contexts,
+            ttl=self.config.context_ttl,
+            max_pages=self.config.max_pages_per_context,
+            page_pool_size=self.config.page_pool_size,
+            page_max_reuse=self.config.page_max_reuse,
+            logger=self.logger,
+        )
         
         # Serialize context.new_page() across concurrent tasks to avoid races
         # when using a shared persistent context (context.pages may be empty
@@ -995,39 +1336,13 @@ class BrowserManager:
 
     def _make_config_signature(self, crawlerRunConfig: CrawlerRunConfig) -> str:
         """
-        Converts the crawlerRunConfig into a dict, excludes ephemeral fields,
-        then returns a hash of the sorted JSON. This yields a stable signature
-        that identifies configurations requiring a unique browser context.
+        Returns a hash of the config fields that shape a browser context
+        (CONTEXT_CONFIG_FIELDS), so configs that only differ in per-page
+        settings share one context. Hashes are memoized by field values.
         """
-        import json
-
-        config_dict = crawlerRunConfig.__dict__.copy()
-        # Exclude items that do not affect browser-level setup.
-        # Expand or adjust as needed, e.g. chunking_strategy is purely for data extraction, not for browser config.
-        ephemeral_keys = [
-            "session_id",
-            "js_code",
-            "scraping_strategy",
-            "extraction_strategy",
-            "chunking_strategy",
-            "cache_mode",
-            "content_filter",
-            "semaphore_count",
-            "url"
-        ]
-        
-        # Do NOT exclude locale, timezone_id, or geolocation as these DO affect browser context
-        # and should cause a new context to be created if they change
-        
-        for key in ephemeral_keys:
-            if key in config_dict:
-                del config_dict[key]
-        # Convert to canonical JSON string
-        signature_json = json.dumps(config_dict, sort_keys=True, default=str)
-
-        # Hash the JSON so we get a compact, unique string
-        signature_hash = hashlib.sha256(signature_json.encode("utf-8")).hexdigest()
-        return signature_hash
+        return _signature_hash(
+            tuple(_freeze(getattr(crawlerRunConfig, f, None)) for f in CONTEXT_CONFIG_FIELDS)
+        )
 
     async def _apply_stealth_to_page(self, page):
         """Apply stealth to a page if stealth mode is enabled"""
@@ -1093,18 +1408,16 @@ class BrowserManager:
             # Otherwise, check if we have an existing context for this config
             config_signature = self._make_config_signature(crawlerRunConfig)
 
-            async with self._contexts_lock:
-                if config_signature in self.contexts_by_config:
-                    context = self.contexts_by_config[config_signature]
-                else:
-                    # Create and setup a new context
-                    context = await self.create_browser_context(crawlerRunConfig)
-                    await self.setup_context(context, crawlerRunConfig)
-                    self.contexts_by_config[config_signature] = context
+            async def new_context():
+                context = await self.create_browser_context(crawlerRunConfig)
+                await self.setup_context(context, crawlerRunConfig)
+                return context
+
+            entry = await self.context_pool.acquire(config_signature, new_context)
+            context = entry.context
 
-            # Create a new page from the chosen context
-            page = await context.new_page()
-            await self._apply_stealth_to_page(page)
+            # A warm page from the chosen context, or a new one
+            page = await self.context_pool.open_page(entry, self._new_page)
 
         # If a session_id is specified, store this session so we can reuse later
         if crawlerRunConfig.session_id:
@@ -1112,6 +1425,28 @@ class BrowserManager:
 
         return page, context
 
+    async def _new_page(self, context: BrowserContext) -> Page:
+        page = await context.new_page()
+        await self._apply_stealth_to_page(page)
+        return page
+
+    async def _reset_page(self, page: Page):
+        """Bring a used page back to a blank state, raising if it is unhealthy"""
+        await page.goto("about:blank", timeout=PAGE_RESET_TIMEOUT)
+        viewport = {"width": self.config.viewport_width, "height": self.config.viewport_height}
+        if page.viewport_size != viewport:
+            await page.set_viewport_size(viewport)
+
+    async def release_page(self, page: Page, reusable: bool = True):
+        """
+        Hand back a non-session page after a crawl. With page_pool_size set
+        the page is reset and kept for the next crawl, otherwise it is
+        closed. Pass reusable=False when the crawl left state on the page
+        that a reset does not undo.
+        """
+        if not (reusable and self.context_pool.recycle(page, self._reset_page)):
+            await page.close()
+
     async def kill_session(self, session_id: str):
         """
         Kill a browser session and clean up resources.
@@ -1122,7 +1457,8 @@ class BrowserManager:
         if session_id in self.sessions:
             context, page, _ = self.sessions[session_id]
             await page.close()
-            if not self.config.use_managed_browser:
+            # Pooled contexts are shared and closed by the pool
+            if not self.config.use_managed_browser and not self.context_pool.owns(context):
                 await context.close()
             del self.sessions[session_id]
 
@@ -1150,16 +1486,7 @@ class BrowserManager:
             await self.kill_session(session_id)
 
         # Now close all contexts we created. This reclaims memory from ephemeral contexts.
-        for ctx in self.contexts_by_config.values():
-            try:
-                await ctx.close()
-            except Exception as e:
-                self.logger.error(
-                    message="Error closing context: {error}",
-                    tag="ERROR",
-                    params={"error": str(e)}
-                )
-        self.contexts_by_config.clear()
+        await self.context_pool.close()
 
         if self.browser:
             await self.browser.close()
@@ -47,6 +47,10 @@ WORD_TOKEN_RATE = 1.3
 MIN_WORD_THRESHOLD = 1
 IMAGE_DESCRIPTION_MIN_WORD_THRESHOLD = 1
 
+# preprocess_html_for_schema limits used to build CrawlResult.fit_html
+FIT_HTML_TEXT_THRESHOLD = 500
+FIT_HTML_MAX_SIZE = 300_000
+
 IMPORTANT_ATTRS = ["src", "href", "alt", "title", "width", "height"]
 ONLY_TEXT_ELIGIBLE_TAGS = [
     "b",
@@ -101,6 +105,7 @@ SHOW_DEPRECATION_WARNINGS = True
 SCREENSHOT_HEIGHT_TRESHOLD = 10000
 PAGE_TIMEOUT = 60000
 DOWNLOAD_PAGE_TIMEOUT = 60000
+PAGE_RESET_TIMEOUT = 5000  # Resetting a pooled page to about:blank
 
 # Global user settings with descriptions and default values
 USER_SETTINGS = {
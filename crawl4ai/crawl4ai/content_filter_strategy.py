@@ -3,7 +3,6 @@ import re
 import time
 from bs4 import BeautifulSoup, Tag
 from typing import List, Tuple, Dict, Optional
-from rank_bm25 import BM25Okapi
 from collections import deque
 from bs4 import NavigableString, Comment
 
@@ -28,6 +27,7 @@ import hashlib
 from pathlib import Path
 from concurrent.futures import ThreadPoolExecutor
 from .async_logger import AsyncLogger, LogLevel, LogColor
+from .bm25 import BM25Index, TokenCache
 
 
 class RelevantContentFilter(ABC):
@@ -436,6 +436,15 @@ class BM25ContentFilter(RelevantContentFilter):
             "th": 1.5,  # Table headers
         }
         self.stemmer = stemmer(language) if use_stemming else None
+        # Chunks repeated across pages (menus, footers) are tokenized once
+        self.tokenize = TokenCache(self._tokenize)
+
+    def _tokenize(self, text: str) -> List[str]:
+        """Lowercase, split, stem and drop stop words and noise"""
+        words = text.lower().split()
+        if self.use_stemming:
+            words = [self.stemmer.stemWord(word) for word in words]
+        return clean_tokens(words)
 
     def filter_content(self, html: str, min_word_threshold: int = None) -> List[str]:
         """
@@ -474,38 +483,9 @@ class BM25ContentFilter(RelevantContentFilter):
         if not candidates:
             return []
 
-        # Tokenize corpus
-        # tokenized_corpus = [chunk.lower().split() for _, chunk, _, _ in candidates]
-        # tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[ps.stem(word) for word in chunk.lower().split()]
-        #                 for _, chunk, _, _ in candidates]
-        # tokenized_query = [ps.stem(word) for word in query.lower().split()]
-
-        if self.use_stemming:
-            tokenized_corpus = [
-                [self.stemmer.stemWord(word) for word in chunk.lower().split()]
-                for _, chunk, _, _ in candidates
-            ]
-            tokenized_query = [
-                self.stemmer.stemWord(word) for word in query.lower().split()
-            ]
-        else:
-            tokenized_corpus = [
-                chunk.lower().split() for _, chunk, _, _ in candidates
-            ]
-            tokenized_query = query.lower().split()
-
-        # tokenized_corpus = [[self.stemmer.stemWord(word) for word in tokenize_text(chunk.lower())]
-        #            for _, chunk, _, _ in candidates]
-        # tokenized_query = [self.stemmer.stemWord(word) for word in tokenize_text(query.lower())]
-
-        # Clean from stop words and noise
-        tokenized_corpus = [clean_tokens(tokens) for tokens in tokenized_corpus]
-        tokenized_query = clean_tokens(tokenized_query)
-
-        bm25 = BM25Okapi(tokenized_corpus)
-        scores = bm25.get_scores(tokenized_query)
+        bm25 = BM25Index()
+        bm25.add_documents(self.tokenize(chunk) for _, chunk, _, _ in candidates)
+        scores = bm25.get_scores(self.tokenize(query))
 
         # Adjust scores with tag weights
         adjusted_candidates = []
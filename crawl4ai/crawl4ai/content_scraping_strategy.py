@@ -605,7 +605,12 @@ class LXMLWebScrapingStrategy(ContentScrapingStrategy):
 
         success = True
         try:
-            doc = lhtml.document_fromstring(html)
+            # Reuse the page's shared parse when aprocess_html provides one
+            document = kwargs.get("document")
+            if document is not None and document.matches(html):
+                doc = document.lxml_copy()
+            else:
+                doc = lhtml.document_fromstring(html)
             # Match BeautifulSoup's behavior of using body or full doc
             # body = doc.xpath('//body')[0] if doc.xpath('//body') else doc
             body = doc
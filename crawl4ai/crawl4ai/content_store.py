@@ -0,0 +1,547 @@
+"""
+Content backends for the crawl cache.
+
+AsyncDatabaseManager keeps page content (html, cleaned html, markdown,
+extracted content, screenshots) out of the crawled_data table; each row only
+holds a content hash. A ContentStore maps those hashes to content:
+
+- FileContentStore: one file per hash, the original ``~/.crawl4ai`` layout.
+- PackedContentStore: compressed records appended to a few large pack files,
+  located through an SQLite offset index. zstd is used when ``zstandard`` is
+  installed (``pip install crawl4ai[cache]``), zlib otherwise.
+
+Switching an existing cache to pack files:
+
+    from crawl4ai.async_database import async_db_manager, base_directory
+    from crawl4ai.content_store import PackedContentStore
+
+    store = PackedContentStore(os.path.join(base_directory, "packs"))
+    await async_db_manager.amigrate_content_store(store, remove_files=True)
+"""
+
+import mmap
+import os
+import sqlite3
+import threading
+import time
+import zlib
+from abc import ABC, abstractmethod
+from typing import Dict, Iterator, List, Optional, Sequence, Set, Tuple
+
+from .async_logger import AsyncLoggerBase
+from .utils import generate_content_hash
+
+try:
+    import zstandard
+    HAS_ZSTD = True
+except ImportError:
+    HAS_ZSTD = False
+
+# Hashes per index query, below SQLite's default limit of 999 bound parameters
+INDEX_BATCH_SIZE = 500
+# Domains collecting dictionary samples at once, bounds the memory samples take
+MAX_SAMPLED_GROUPS = 128
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS content (
+    hash TEXT PRIMARY KEY,
+    pack INTEGER NOT NULL,
+    offset INTEGER NOT NULL,
+    length INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    codec TEXT NOT NULL,
+    dict INTEGER,
+    gen INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS dictionaries (
+    id INTEGER PRIMARY KEY,
+    grp TEXT UNIQUE,
+    data BLOB NOT NULL
+);
+"""
+
+
+class ContentStore(ABC):
+    """
+    Maps content hashes to content.
+
+    Methods block; AsyncDatabaseManager calls them through asyncio.to_thread,
+    so implementations must be safe to call from several threads.
+    """
+
+    @abstractmethod
+    def put_many(self, items: Sequence[Tuple[str, str, Optional[str]]]) -> List[str]:
+        """
+        Store (content, content type, group) triples and return their hashes,
+        "" for empty content. group is the page's domain, stores may use it
+        to compress similar pages together.
+        """
+        pass
+
+    @abstractmethod
+    def get_many(self, items: Sequence[Tuple[str, str]]) -> List[Optional[str]]:
+        """Load (hash, content type) pairs, None where the content is missing"""
+        pass
+
+    @abstractmethod
+    def mark(self):
+        """Token for compact(): content stored or re-stored after it is kept"""
+        pass
+
+    @abstractmethod
+    def compact(self, live: Set[str], mark) -> int:
+        """
+        Drop content whose hash is not in ``live`` and that was not stored
+        since ``mark``, and reclaim its space. Returns the bytes reclaimed.
+        """
+        pass
+
+    def close(self):
+        pass
+
+
+class FileContentStore(ContentStore):
+    """One file per content hash, in a directory per content type"""
+
+    def __init__(
+        self, content_paths: Dict[str, str], logger: Optional[AsyncLoggerBase] = None
+    ):
+        self.content_paths = content_paths
+        self.logger = logger
+
+    def put_many(self, items: Sequence[Tuple[str, str, Optional[str]]]) -> List[str]:
+        hashes = []
+        for content, content_type, _ in items:
+            if not content:
+                hashes.append("")
+                continue
+
+            content_hash = generate_content_hash(content)
+            file_path = os.path.join(self.content_paths[content_type], content_hash)
+            # Content is addressed by hash, an existing file already holds it
+            try:
+                with open(file_path, "x", encoding="utf-8") as f:
+                    f.write(content)
+            except FileExistsError:
+                # Keep it out of a compaction that is under way
+                os.utime(file_path)
+            hashes.append(content_hash)
+        return hashes
+
+    def get_many(self, items: Sequence[Tuple[str, str]]) -> List[Optional[str]]:
+        contents = []
+        for content_hash, content_type in items:
+            if not content_hash:
+                contents.append(None)
+                continue
+
+            file_path = os.path.join(self.content_paths[content_type], content_hash)
+            try:
+                with open(file_path, "r", encoding="utf-8") as f:
+                    contents.append(f.read())
+            except OSError:
+                if self.logger:
+                    self.logger.error(
+                        message="Failed to load content: {file_path}",
+                        tag="ERROR",
+                        force_verbose=True,
+                        params={"file_path": file_path},
+                    )
+                contents.append(None)
+        return contents
+
+    def iter_files(self) -> Iterator[Tuple[str, str]]:
+        """Yield (hash, file path) for every stored file"""
+        for directory in dict.fromkeys(self.content_paths.values()):
+            if not os.path.isdir(directory):
+                continue
+            for entry in os.scandir(directory):
+                if entry.is_file():
+                    yield entry.name, entry.path
+
+    def mark(self) -> float:
+        return time.time()
+
+    def compact(self, live: Set[str], mark: float) -> int:
+        reclaimed = 0
+        for content_hash, file_path in list(self.iter_files()):
+            if content_hash in live:
+                continue
+            try:
+                stat = os.stat(file_path)
+                if stat.st_mtime < mark:
+                    os.remove(file_path)
+                    reclaimed += stat.st_size
+            except OSError:
+                pass
+        return reclaimed
+
+
+class PackedContentStore(ContentStore):
+    """
+    Compressed content in append-only pack files.
+
+    Records are appended to ``NNNNNN.pack`` files under ``path`` until a pack
+    reaches ``max_pack_size``, and ``index.db`` maps each hash to its pack,
+    offset and codec. Reads decompress straight out of a read-only mmap of
+    the pack. Content is deduplicated by hash across content types.
+
+    With ``train_dictionaries`` (zstd only) the first ``dictionary_samples``
+    payloads of each domain train a zstd dictionary that later payloads from
+    that domain are compressed with, which helps most on the many small,
+    near-identical pages a site crawl produces.
+
+    Dead records are only reclaimed by compact(). Lookups that miss the packs
+    fall through to ``fallback``, so a store can take over from a
+    FileContentStore before its files are migrated.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        fallback: Optional[ContentStore] = None,
+        level: int = 10,
+        max_pack_size: int = 256 * 1024 * 1024,
+        train_dictionaries: bool = False,
+        dictionary_samples: int = 64,
+        dictionary_size: int = 112 * 1024,
+        logger: Optional[AsyncLoggerBase] = None,
+    ):
+        os.makedirs(path, exist_ok=True)
+        self.path = path
+        self.fallback = fallback
+        self.level = level
+        self.max_pack_size = max_pack_size
+        self.codec = "zstd" if HAS_ZSTD else "zlib"
+        self.train_dictionaries = train_dictionaries and HAS_ZSTD
+        self.dictionary_samples = dictionary_samples
+        self.dictionary_size = dictionary_size
+        self.logger = logger
+
+        self._lock = threading.RLock()
+        self._db = sqlite3.connect(
+            os.path.join(path, "index.db"), check_same_thread=False
+        )
+        self._db.executescript(INDEX_SCHEMA)
+        self._generation = self._db.execute(
+            "SELECT COALESCE(MAX(gen), 0) FROM content"
+        ).fetchone()[0]
+
+        self._maps: Dict[int, mmap.mmap] = {}
+        self._compressors: Dict[Optional[int], object] = {}
+        self._decompressors: Dict[Optional[int], object] = {}
+        self._group_dicts: Dict[str, Optional[int]] = dict(
+            self._db.execute("SELECT grp, id FROM dictionaries")
+        )
+        self._samples: Dict[str, List[bytes]] = {}
+
+        packs = self._pack_ids()
+        self._pack_id = packs[-1] if packs else 1
+        self._writer = open(self._pack_path(self._pack_id), "ab")
+        self._pack_size = self._writer.tell()
+
+    # Pack files
+
+    def _pack_path(self, pack_id: int) -> str:
+        return os.path.join(self.path, f"{pack_id:06d}.pack")
+
+    def _pack_ids(self) -> List[int]:
+        return sorted(
+            int(name[:-5])
+            for name in os.listdir(self.path)
+            if name.endswith(".pack") and name[:-5].isdigit()
+        )
+
+    def _roll(self):
+        """Start a new pack file"""
+        self._writer.close()
+        self._pack_id += 1
+        self._writer = open(self._pack_path(self._pack_id), "ab")
+        self._pack_size = 0
+
+    def _write(self, blob) -> Tuple[int, int]:
+        if self._pack_size and self._pack_size + len(blob) > self.max_pack_size:
+            self._roll()
+        offset = self._pack_size
+        self._writer.write(blob)
+        self._pack_size += len(blob)
+        return self._pack_id, offset
+
+    def _view(self, pack_id: int, offset: int, length: int) -> memoryview:
+        """Record bytes as a view into the pack's mmap, release it after use"""
+        mm = self._maps.get(pack_id)
+        if mm is None or len(mm) < offset + length:
+            if pack_id == self._pack_id:
+                self._writer.flush()
+            if mm is not None:
+                mm.close()
+            with open(self._pack_path(pack_id), "rb") as f:
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[pack_id] = mm
+        return memoryview(mm)[offset : offset + length]
+
+    def _unmap(self, pack_id: int):
+        mm = self._maps.pop(pack_id, None)
+        if mm is not None:
+            mm.close()
+
+    # Compression
+
+    def _compress(self, raw: bytes, dict_id: Optional[int]) -> Tuple[str, bytes]:
+        if self.codec == "zstd":
+            compressor = self._compressors.get(dict_id)
+            if compressor is None:
+                compressor = self._compressors[dict_id] = zstandard.ZstdCompressor(
+                    level=self.level, dict_data=self._dictionary(dict_id)
+                )
+            return "zstd", compressor.compress(raw)
+        return "zlib", zlib.compress(raw, min(self.level, 9))
+
+    def _decompress(self, codec: str, dict_id: Optional[int], data, size: int) -> bytes:
+        if codec == "zlib":
+            return zlib.decompress(data)
+        if codec != "zstd":
+            raise ValueError(f"Unknown codec: {codec}")
+        if not HAS_ZSTD:
+            raise RuntimeError("This cache needs zstandard: pip install crawl4ai[cache]")
+        decompressor = self._decompressors.get(dict_id)
+        if decompressor is None:
+            decompressor = self._decompressors[dict_id] = zstandard.ZstdDecompressor(
+                dict_data=self._dictionary(dict_id)
+            )
+        return decompressor.decompress(data, max_output_size=size)
+
+    def _dictionary(self, dict_id: Optional[int]):
+        if dict_id is None:
+            return None
+        row = self._db.execute(
+            "SELECT data FROM dictionaries WHERE id = ?", (dict_id,)
+        ).fetchone()
+        return zstandard.ZstdCompressionDict(row[0])
+
+    def _dictionary_for(self, group: Optional[str], raw: bytes) -> Optional[int]:
+        """Dictionary to compress a group's payload with, training one when due"""
+        if not self.train_dictionaries or not group:
+            return None
+        if group in self._group_dicts:
+            return self._group_dicts[group]
+
+        if group not in self._samples and len(self._samples) >= MAX_SAMPLED_GROUPS:
+            return None
+        samples = self._samples.setdefault(group, [])
+        # Heads of pages carry most of the shared boilerplate
+        samples.append(raw[:32 * 1024])
+        if len(samples) < self.dictionary_samples:
+            return None
+        del self._samples[group]
+
+        try:
+            data = zstandard.train_dictionary(self.dictionary_size, samples).as_bytes()
+        except zstandard.ZstdError:
+            # Not enough distinct data, compress this group without one
+            self._group_dicts[group] = None
+            return None
+        dict_id = self._db.execute(
+            "INSERT INTO dictionaries (grp, data) VALUES (?, ?)", (group, data)
+        ).lastrowid
+        self._group_dicts[group] = dict_id
+        return dict_id
+
+    # Index
+
+    def _lookup(self, hashes: Sequence[str]) -> Dict[str, tuple]:
+        records = {}
+        for i in range(0, len(hashes), INDEX_BATCH_SIZE):
+            chunk = hashes[i : i + INDEX_BATCH_SIZE]
+            for row in self._db.execute(
+                "SELECT hash, pack, offset, length, size, codec, dict FROM content "
+                f"WHERE hash IN ({', '.join('?' * len(chunk))})",
+                chunk,
+            ):
+                records[row[0]] = row[1:]
+        return records
+
+    def _append(self, content_hash: str, raw: bytes, group: Optional[str]) -> tuple:
+        dict_id = self._dictionary_for(group, raw)
+        codec, blob = self._compress(raw, dict_id)
+        pack_id, offset = self._write(blob)
+        return (content_hash, pack_id, offset, len(blob), len(raw), codec, dict_id, self._generation)
+
+    def _commit(self, records: List[tuple], touched: Sequence[str] = ()):
+        self._writer.flush()
+        self._db.executemany(
+            "INSERT OR IGNORE INTO content "
+            "(hash, pack, offset, length, size, codec, dict, gen) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            records,
+        )
+        self._db.executemany(
+            "UPDATE content SET gen = ? WHERE hash = ? AND gen < ?",
+            [(self._generation, h, self._generation) for h in touched],
+        )
+        self._db.commit()
+
+    # ContentStore
+
+    def put_many(self, items: Sequence[Tuple[str, str, Optional[str]]]) -> List[str]:
+        hashes = [generate_content_hash(content) if content else "" for content, _, _ in items]
+        with self._lock:
+            stored = self._lookup([h for h in hashes if h])
+            records, seen = [], set()
+            for content_hash, (content, _, group) in zip(hashes, items):
+                if not content_hash or content_hash in stored or content_hash in seen:
+                    continue
+                seen.add(content_hash)
+                records.append(self._append(content_hash, content.encode("utf-8"), group))
+            self._commit(records, touched=list(stored))
+        return hashes
+
+    def get_many(self, items: Sequence[Tuple[str, str]]) -> List[Optional[str]]:
+        contents: List[Optional[str]] = []
+        missing = []
+        with self._lock:
+            records = self._lookup([h for h, _ in items if h])
+            for content_hash, _ in items:
+                record = records.get(content_hash)
+                if record is None:
+                    if content_hash:
+                        missing.append(len(contents))
+                    contents.append(None)
+                    continue
+                contents.append(self._read(content_hash, record))
+
+        if missing and self.fallback is not None:
+            found = self.fallback.get_many([items[i] for i in missing])
+            for i, content in zip(missing, found):
+                contents[i] = content
+        return contents
+
+    def _read(self, content_hash: str, record: tuple) -> Optional[str]:
+        pack_id, offset, length, size, codec, dict_id = record
+        try:
+            view = self._view(pack_id, offset, length)
+            try:
+                return self._decompress(codec, dict_id, view, size).decode("utf-8")
+            finally:
+                view.release()
+        except Exception as e:
+            if self.logger:
+                self.logger.error(
+                    message="Failed to load content {hash}: {error}",
+                    tag="ERROR",
+                    force_verbose=True,
+                    params={"hash": content_hash, "error": str(e)},
+                )
+            return None
+
+    def mark(self) -> int:
+        with self._lock:
+            self._generation += 1
+            return self._generation
+
+    def compact(self, live: Set[str], mark: int) -> int:
+        """
+        Drop dead records and rewrite the live ones into fresh packs.
+
+        Compressed bytes are copied as they are, nothing is recompressed. The
+        index only points at the new packs once they are flushed, so an
+        interrupted compaction leaves the old packs in use.
+        """
+        with self._lock:
+            db = self._db
+            db.execute("CREATE TEMP TABLE live (hash TEXT PRIMARY KEY)")
+            try:
+                db.executemany("INSERT OR IGNORE INTO live VALUES (?)", ((h,) for h in live))
+                db.execute(
+                    "DELETE FROM content WHERE gen < ? AND hash NOT IN (SELECT hash FROM live)",
+                    (mark,),
+                )
+            finally:
+                db.execute("DROP TABLE live")
+            db.commit()
+
+            old_packs = self._pack_ids()
+            before = sum(os.path.getsize(self._pack_path(p)) for p in old_packs)
+            self._roll()
+
+            rows = db.execute(
+                "SELECT hash, pack, offset, length FROM content ORDER BY pack, offset"
+            ).fetchall()
+            moved = []
+            for content_hash, pack_id, offset, length in rows:
+                view = self._view(pack_id, offset, length)
+                try:
+                    moved.append((*self._write(view), content_hash))
+                finally:
+                    view.release()
+            self._writer.flush()
+            db.executemany("UPDATE content SET pack = ?, offset = ? WHERE hash = ?", moved)
+            db.commit()
+
+            for pack_id in old_packs:
+                self._unmap(pack_id)
+                os.remove(self._pack_path(pack_id))
+            after = sum(os.path.getsize(self._pack_path(p)) for p in self._pack_ids())
+            return before - after
+
+    def migrate_from(self, store: FileContentStore, remove: bool = False) -> int:
+        """
+        Copy every file of a FileContentStore into the packs, keeping its
+        hash. With ``remove`` the files are deleted once their batch is
+        indexed. Returns the number of records added.
+        """
+        migrated = 0
+        batch: List[Tuple[str, str]] = []
+
+        def flush():
+            nonlocal migrated
+            with self._lock:
+                stored = self._lookup([h for h, _ in batch])
+                records, seen = [], set()
+                for content_hash, file_path in batch:
+                    if content_hash in stored or content_hash in seen:
+                        continue
+                    try:
+                        with open(file_path, "rb") as f:
+                            raw = f.read()
+                    except OSError:
+                        continue
+                    seen.add(content_hash)
+                    records.append(self._append(content_hash, raw, None))
+                self._commit(records)
+                migrated += len(records)
+            if remove:
+                for _, file_path in batch:
+                    try:
+                        os.remove(file_path)
+                    except OSError:
+                        pass
+            batch.clear()
+
+        for item in store.iter_files():
+            batch.append(item)
+            if len(batch) >= INDEX_BATCH_SIZE:
+                flush()
+        if batch:
+            flush()
+        return migrated
+
+    def stats(self) -> Dict[str, int]:
+        """Record count, stored (compressed) and raw bytes, and pack files"""
+        with self._lock:
+            records, stored, raw = self._db.execute(
+                "SELECT COUNT(*), COALESCE(SUM(length), 0), COALESCE(SUM(size), 0) FROM content"
+            ).fetchone()
+            return {
+                "records": records,
+                "stored_bytes": stored,
+                "raw_bytes": raw,
+                "packs": len(self._pack_ids()),
+            }
+
+    def close(self):
+        with self._lock:
+            for pack_id in list(self._maps):
+                self._unmap(pack_id)
+            self._writer.close()
+            self._db.close()
@@ -1,5 +1,7 @@
 # bfs_deep_crawl_strategy.py
 import asyncio
+import heapq
+import itertools
 import logging
 from datetime import datetime
 from typing import AsyncGenerator, Optional, Set, Dict, List, Tuple
@@ -21,6 +23,13 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
       - arun: Main entry point; splits execution into batch or stream modes.
       - link_discovery: Extracts, filters, and (if needed) scores the outgoing URLs.
       - can_process_url: Validates URL format and applies the filter chain.
+
+    By default each level is crawled with one arun_many call that finishes
+    before the next level starts. With continuous=True a single arun_many
+    call is fed from a depth-ordered frontier instead: links found on a page
+    are queued as soon as it finishes, so a slow page no longer holds up the
+    browsers. Pages are still crawled shallowest first, and max_depth and
+    max_pages hold exactly.
     """
     def __init__(
         self,
@@ -31,6 +40,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         score_threshold: float = -infinity,
         max_pages: int = infinity,
         logger: Optional[logging.Logger] = None,
+        continuous: bool = False,
     ):
         self.max_depth = max_depth
         self.filter_chain = filter_chain
@@ -38,6 +48,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         self.include_external = include_external
         self.score_threshold = score_threshold
         self.max_pages = max_pages
+        self.continuous = continuous
         # self.logger = logger or logging.getLogger(__name__)
         # Ensure logger is always a Logger instance, not a dict from serialization
         if isinstance(logger, logging.Logger):
@@ -155,6 +166,9 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Batch (non-streaming) mode:
         Processes one BFS level at a time, then yields all the results.
         """
+        if self.continuous:
+            return [r async for r in self._arun_continuous(start_url, crawler, config)]
+
         visited: Set[str] = set()
         # current_level holds tuples: (url, parent_url)
         current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
@@ -170,6 +184,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
             
             next_level: List[Tuple[str, Optional[str]]] = []
             urls = [url for url, _ in current_level]
+            parents = dict(current_level)
 
             # Clone the config to disable deep crawling recursion and enforce batch mode.
             batch_config = config.clone(deep_crawl_strategy=None, stream=False)
@@ -184,8 +199,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 depth = depths.get(url, 0)
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = parents.get(url)
                 results.append(result)
                 
                 # Only discover links from successful crawls
@@ -207,6 +221,11 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         Streaming mode:
         Processes one BFS level at a time and yields results immediately as they arrive.
         """
+        if self.continuous:
+            async for result in self._arun_continuous(start_url, crawler, config):
+                yield result
+            return
+
         visited: Set[str] = set()
         current_level: List[Tuple[str, Optional[str]]] = [(start_url, None)]
         depths: Dict[str, int] = {start_url: 0}
@@ -214,6 +233,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
         while current_level and not self._cancel_event.is_set():
             next_level: List[Tuple[str, Optional[str]]] = []
             urls = [url for url, _ in current_level]
+            parents = dict(current_level)
             visited.update(urls)
 
             stream_config = config.clone(deep_crawl_strategy=None, stream=True)
@@ -226,8 +246,7 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 depth = depths.get(url, 0)
                 result.metadata = result.metadata or {}
                 result.metadata["depth"] = depth
-                parent_url = next((parent for (u, parent) in current_level if u == url), None)
-                result.metadata["parent_url"] = parent_url
+                result.metadata["parent_url"] = parents.get(url)
                 
                 # Count only successful crawls
                 if result.success:
@@ -252,6 +271,66 @@ class BFSDeepCrawlStrategy(DeepCrawlStrategy):
                 
             current_level = next_level
 
+    async def _arun_continuous(
+        self,
+        start_url: str,
+        crawler: AsyncWebCrawler,
+        config: CrawlerRunConfig,
+    ) -> AsyncGenerator[CrawlResult, None]:
+        """
+        Continuous mode:
+        Runs one streaming arun_many over a frontier ordered by (depth,
+        discovery order) that link discovery keeps feeding while pages are
+        in flight. A URL is only handed out while successful plus in-flight
+        pages stay below max_pages, so the limit is never overshot, and a
+        failed page frees its slot for the next URL.
+        """
+        visited: Set[str] = {start_url}
+        depths: Dict[str, int] = {start_url: 0}
+        parents: Dict[str, Optional[str]] = {start_url: None}
+        # (depth, sequence, url)
+        frontier: List[Tuple[int, int, str]] = [(0, 0, start_url)]
+        sequence = itertools.count(1)
+        in_flight = 0
+        progress = asyncio.Event()
+
+        async def frontier_urls():
+            nonlocal in_flight
+            while not self._cancel_event.is_set():
+                if frontier and self._pages_crawled + in_flight < self.max_pages:
+                    _, _, url = heapq.heappop(frontier)
+                    in_flight += 1
+                    yield url
+                elif in_flight == 0:
+                    # Nothing left to crawl, or max_pages reached
+                    return
+                else:
+                    # Wait for a page to finish and maybe add links
+                    progress.clear()
+                    await progress.wait()
+
+        stream_config = config.clone(deep_crawl_strategy=None, stream=True)
+        stream_gen = await crawler.arun_many(urls=frontier_urls(), config=stream_config)
+
+        async for result in stream_gen:
+            in_flight -= 1
+            url = result.url
+            depth = depths.get(url, 0)
+            result.metadata = result.metadata or {}
+            result.metadata["depth"] = depth
+            result.metadata["parent_url"] = parents.get(url)
+
+            if result.success:
+                self._pages_crawled += 1
+                next_level: List[Tuple[str, Optional[str]]] = []
+                await self.link_discovery(result, url, depth, visited, next_level, depths)
+                for link, parent in next_level:
+                    parents[link] = parent
+                    heapq.heappush(frontier, (depths[link], next(sequence), link))
+
+            progress.set()
+            yield result
+
     async def shutdown(self) -> None:
         """
         Clean up resources and signal cancellation of the crawl.
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Pattern, Set, Union
+from typing import Callable, List, Optional, Pattern, Set, Tuple, Union
 from urllib.parse import urlparse
 from array import array
 import re
@@ -37,6 +37,64 @@ class FilterStats:
         return self._counters[2]
 
 
+class URLParts:
+    """
+    The pieces of a URL the built-in filters look at, split once per URL.
+
+    Each field is derived exactly the way the corresponding filter's own
+    ``apply`` derives it, so compiled and uncompiled checks agree.
+    """
+
+    __slots__ = ("url", "path", "domain", "extension")
+
+    def __init__(self, url: str):
+        self.url = url
+        # URLPatternFilter: the URL without its query string
+        self.path = url.partition("?")[0]
+        _, sep, rest = url.partition("://")
+        if not sep:
+            rest = url
+        # DomainFilter: the authority after the first "://"
+        host = rest.partition("/")[0] if sep else ""
+        self.domain = host.lower() if host else DomainFilter._extract_domain(url)
+        # ContentTypeFilter: the extension of the last path segment
+        tail = rest[rest.rfind("/") + 1:] if "/" in rest else ""
+        dot = tail.rfind(".")
+        self.extension = tail[dot + 1:].lower() if dot != -1 else ""
+
+
+class DomainSuffixTrie:
+    """
+    Reversed-label trie answering "is this domain, or a subdomain of, any
+    registered domain" in one walk over the domain's labels.
+    """
+
+    __slots__ = ("_root",)
+
+    _END = object()
+
+    def __init__(self, domains=()):
+        self._root = {}
+        for domain in domains:
+            self.add(domain)
+
+    def add(self, domain: str) -> None:
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.setdefault(label, {})
+        node[self._END] = True
+
+    def match(self, domain: str) -> bool:
+        node = self._root
+        for label in reversed(domain.split(".")):
+            node = node.get(label)
+            if node is None:
+                return False
+            if self._END in node:
+                return True
+        return False
+
+
 class URLFilter(ABC):
     """Optimized base filter class"""
 
@@ -59,6 +117,14 @@ class URLFilter(ABC):
     def apply(self, url: str) -> bool:
         pass
 
+    def compile(self) -> Optional[Callable[[URLParts], bool]]:
+        """
+        A pure, synchronous predicate equivalent to ``apply``, or None if the
+        filter can't be compiled (I/O, custom logic). Compiled predicates
+        don't update stats; the FilterChain running them does.
+        """
+        return None
+
     def _update_stats(self, passed: bool):
         # Use direct array index for speed
         self.stats._counters[0] += 1  # total
@@ -66,15 +132,80 @@ class URLFilter(ABC):
         self.stats._counters[2] += not passed  # rejected
 
 
+class CompiledFilterChain:
+    """
+    A FilterChain reduced to one synchronous pass plus the filters that
+    really need to await.
+
+    Compilable filters run as plain predicates over a single URLParts, in
+    chain order, stopping at the first rejection. Sync filters that can't be
+    compiled are called as before. Filters with a coroutine ``apply``
+    (ContentRelevanceFilter, SEOFilter) are only awaited for URLs that pass
+    everything else.
+    """
+
+    __slots__ = ("steps", "async_filters")
+
+    def __init__(self, filters: Tuple[URLFilter, ...]):
+        steps = []
+        async_filters = []
+        for f in filters:
+            if inspect.iscoroutinefunction(f.apply):
+                async_filters.append(f)
+                continue
+            steps.append((f, self._predicate(f), f.stats._counters))
+        self.steps = tuple(steps)
+        self.async_filters = tuple(async_filters)
+
+    @staticmethod
+    def _predicate(f: URLFilter) -> Optional[Callable[[URLParts], bool]]:
+        """
+        ``f.compile()``, unless ``apply`` was overridden below the class that
+        defines ``compile``: a subclass of URLPatternFilter with its own
+        ``apply`` must keep running that ``apply``.
+        """
+        cls = type(f)
+        owner = next(c for c in cls.__mro__ if "compile" in vars(c))
+        if cls.apply is not vars(owner).get("apply") or "apply" in getattr(f, "__dict__", {}):
+            return None
+        return f.compile()
+
+    def check(self, url: str, pending: list) -> bool:
+        """
+        Run the synchronous part. Awaitables returned by uncompiled filters
+        are appended to ``pending``.
+        """
+        parts = None
+        for f, predicate, counters in self.steps:
+            if predicate is None:
+                result = f.apply(url)
+                if inspect.isawaitable(result):
+                    pending.append(result)
+                elif not result:
+                    return False
+                continue
+
+            if parts is None:
+                parts = URLParts(url)
+            counters[0] += 1
+            if predicate(parts):
+                counters[1] += 1
+            else:
+                counters[2] += 1
+                return False
+        return True
+
+
 class FilterChain:
     """Optimized filter chain"""
 
-    __slots__ = ("filters", "stats", "_logger_ref")
+    __slots__ = ("filters", "stats", "_logger_ref", "_compiled")
 
     def __init__(self, filters: List[URLFilter] = None):
         self.filters = tuple(filters or [])  # Immutable tuple for speed
         self.stats = FilterStats()
         self._logger_ref = None
+        self._compiled = None
 
     @property
     def logger(self):
@@ -85,23 +216,42 @@ class FilterChain:
 
     def add_filter(self, filter_: URLFilter) -> "FilterChain":
         """Add a filter to the chain"""
-        self.filters.append(filter_)
+        self.filters = self.filters + (filter_,)
+        self._compiled = None
         return self  # Enable method chaining
 
+    def compile(self) -> CompiledFilterChain:
+        """Compile the chain; apply() does this on first use"""
+        self._compiled = CompiledFilterChain(self.filters)
+        return self._compiled
+
+    @property
+    def rejection_stats(self) -> Dict[str, int]:
+        """URLs rejected by each filter, keyed by filter name"""
+        stats: Dict[str, int] = {}
+        for f in self.filters:
+            name = f.name
+            n = 2
+            while name in stats:
+                name = f"{f.name}#{n}"
+                n += 1
+            stats[name] = f.stats.rejected_urls
+        return stats
+
     async def apply(self, url: str) -> bool:
-        """Apply all filters concurrently when possible"""
+        """Run the compiled sync filters, then await the I/O filters together"""
         self.stats._counters[0] += 1  # Total processed URLs
+        compiled = self._compiled or self.compile()
 
         tasks = []
-        for f in self.filters:
-            result = f.apply(url)
-
-            if inspect.isawaitable(result):
-                tasks.append(result)  # Collect async tasks
-            elif not result:  # Sync rejection
-                self.stats._counters[2] += 1  # Sync rejected
-                return False
+        if not compiled.check(url, tasks):  # Sync rejection
+            self.stats._counters[2] += 1
+            for task in tasks:
+                # Close coroutines that will never be awaited
+                getattr(task, "close", lambda: None)()
+            return False
 
+        tasks.extend(f.apply(url) for f in compiled.async_filters)
         if tasks:
             results = await asyncio.gather(*tasks)
 
@@ -214,6 +364,52 @@ class URLPatternFilter(URLFilter):
                 pattern if isinstance(pattern, Pattern) else re.compile(pattern)
             )
 
+    @staticmethod
+    def _combine(patterns: List[Pattern]) -> Tuple[Pattern, ...]:
+        """Merge regexes into one alternation when that can't change what they match"""
+        if len(patterns) < 2:
+            return tuple(patterns)
+        default_flags = re.compile("").flags
+        for p in patterns:
+            # Global flags and backreferences don't survive being merged
+            if (
+                not isinstance(p.pattern, str)
+                or p.flags != default_flags
+                or re.search(r"\\\d|\(\?P=", p.pattern)
+            ):
+                return tuple(patterns)
+        try:
+            return (re.compile("|".join(f"(?:{p.pattern})" for p in patterns)),)
+        except re.error:
+            # e.g. the same group name used in two patterns
+            return tuple(patterns)
+
+    def compile(self) -> Callable[[URLParts], bool]:
+        suffixes = frozenset(self._simple_suffixes)
+        domain_res = self._combine(self._domain_patterns)
+        path_res = self._combine(self._path_patterns)
+        # A prefix must end at a path boundary: /api/* matches /api/x, not /apiv2
+        prefix_re = (
+            re.compile(
+                "(?:{})(?=[/?#]|\\Z)".format("|".join(map(re.escape, self._simple_prefixes)))
+            )
+            if self._simple_prefixes
+            else None
+        )
+        reverse = self._reverse
+
+        def matches(parts: URLParts) -> bool:
+            if suffixes and parts.path.rpartition("/")[2].rpartition(".")[2] in suffixes:
+                return True
+            url = parts.url
+            if any(r.match(url) for r in domain_res):
+                return True
+            if prefix_re is not None and prefix_re.match(parts.path):
+                return True
+            return any(r.search(url) for r in path_res)
+
+        return lambda parts: matches(parts) != reverse
+
     @lru_cache(maxsize=10000)
     def apply(self, url: str) -> bool:
         # Quick suffix check (*.html)
@@ -428,6 +624,12 @@ class ContentTypeFilter(URLFilter):
         self._update_stats(result)
         return result
 
+    def compile(self) -> Callable[[URLParts], bool]:
+        if not self._check_extension:
+            return lambda parts: True
+        ext_map = self._ext_map
+        return lambda parts: not parts.extension or parts.extension in ext_map
+
 
 class DomainFilter(URLFilter):
     """Optimized domain filter with fast lookups and caching"""
@@ -505,6 +707,21 @@ class DomainFilter(URLFilter):
         self._update_stats(False)
         return False
 
+    def compile(self) -> Callable[[URLParts], bool]:
+        blocked = DomainSuffixTrie(self._blocked_domains) if self._blocked_domains else None
+        allowed = (
+            DomainSuffixTrie(self._allowed_domains)
+            if self._allowed_domains is not None
+            else None
+        )
+
+        def predicate(parts: URLParts) -> bool:
+            if blocked is not None and blocked.match(parts.domain):
+                return False
+            return allowed is None or allowed.match(parts.domain)
+
+        return predicate
+
 
 class ContentRelevanceFilter(URLFilter):
     """BM25-based relevance filter using head section content"""
@@ -1000,6 +1000,7 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         DEL (str): Delimiter used to combine HTML sections. Defaults to '\n'.
         schema (Dict[str, Any]): The schema defining the extraction rules.
         verbose (bool): Enables verbose logging for debugging purposes.
+        uses_shared_lxml (bool): Whether the strategy reads the lxml tree of a shared ParsedDocument.
 
     Methods:
         extract(url, html_content, *q, **kwargs): Extracts structured data from HTML content.
@@ -1019,6 +1020,7 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
     """
 
     DEL = "\n"
+    uses_shared_lxml = False
 
     def __init__(self, schema: Dict[str, Any], **kwargs):
         """
@@ -1052,7 +1054,11 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
             List[Dict[str, Any]]: A list of extracted items, each represented as a dictionary.
         """
 
-        parsed_html = self._parse_html(html_content)
+        document = kwargs.get("document")
+        if document is not None and document.matches(html_content):
+            parsed_html = self._parse_document(document)
+        else:
+            parsed_html = self._parse_html(html_content)
         base_elements = self._get_base_elements(
             parsed_html, self.schema["baseSelector"]
         )
@@ -1081,6 +1087,10 @@ class JsonElementExtractionStrategy(ExtractionStrategy):
         """Parse HTML content into appropriate format"""
         pass
 
+    def _parse_document(self, document):
+        """Get the parsed form of a shared ParsedDocument, parsing only if needed"""
+        return self._parse_html(document.html)
+
     @abstractmethod
     def _get_base_elements(self, parsed_html, selector: str):
         """Get all base elements using the selector"""
@@ -1409,6 +1419,9 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
         # return BeautifulSoup(html_content, "html.parser")
         return BeautifulSoup(html_content, "lxml")
 
+    def _parse_document(self, document):
+        return document.soup()
+
     def _get_base_elements(self, parsed_html, selector: str):
         return parsed_html.select(selector)
 
@@ -1427,6 +1440,8 @@ class JsonCssExtractionStrategy(JsonElementExtractionStrategy):
         return element.get(attribute)
 
 class JsonLxmlExtractionStrategy(JsonElementExtractionStrategy):
+    uses_shared_lxml = True
+
     def __init__(self, schema: Dict[str, Any], **kwargs):
         kwargs["input_format"] = "html"
         super().__init__(schema, **kwargs)
@@ -1460,6 +1475,9 @@ class JsonLxmlExtractionStrategy(JsonElementExtractionStrategy):
                     print(f"Critical error parsing HTML: {e2}")
                 # Create minimal document as fallback
                 return self.etree.Element("html")
+
+    def _parse_document(self, document):
+        return document.lxml_tree()
     
     def _optimize_selector(self, selector_str):
         """Optimize common selector patterns for better performance"""
@@ -1817,6 +1835,8 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
         _get_element_attribute(element, attribute): Retrieves an attribute value from an lxml element.
     """
 
+    uses_shared_lxml = True
+
     def __init__(self, schema: Dict[str, Any], **kwargs):
         kwargs["input_format"] = "html"  # Force HTML input
         super().__init__(schema, **kwargs)
@@ -1824,6 +1844,9 @@ class JsonXPathExtractionStrategy(JsonElementExtractionStrategy):
     def _parse_html(self, html_content: str):
         return html.fromstring(html_content)
 
+    def _parse_document(self, document):
+        return document.lxml_tree()
+
     def _get_base_elements(self, parsed_html, selector: str):
         return parsed_html.xpath(selector)
 
@@ -17,6 +17,10 @@ class DomainState:
     last_request_time: float = 0
     current_delay: float = 0
     fail_count: int = 0
+    # Floor set by the domain's robots.txt Crawl-delay
+    min_delay: float = 0
+    # Earliest time the next request may start under min_delay
+    next_slot: float = 0
 
 
 @dataclass
@@ -129,7 +133,6 @@ class MarkdownGenerationResult(BaseModel):
 class CrawlResult(BaseModel):
     url: str
     html: str
-    fit_html: Optional[str] = None
     success: bool
     cleaned_html: Optional[str] = None
     media: Dict[str, List[Dict]] = {}
@@ -140,6 +143,7 @@ class CrawlResult(BaseModel):
     pdf: Optional[bytes] = None
     mhtml: Optional[str] = None
     _markdown: Optional[MarkdownGenerationResult] = PrivateAttr(default=None)
+    _fit_html: Optional[str] = PrivateAttr(default=None)
     extracted_content: Optional[str] = None
     metadata: Optional[dict] = None
     error_message: Optional[str] = None
@@ -170,7 +174,9 @@ class CrawlResult(BaseModel):
     
     def __init__(self, **data):
         markdown_result = data.pop('markdown', None)
+        fit_html = data.pop('fit_html', None)
         super().__init__(**data)
+        self._fit_html = fit_html
         if markdown_result is not None:
             self._markdown = (
                 MarkdownGenerationResult(**markdown_result)
@@ -228,14 +234,26 @@ class CrawlResult(BaseModel):
         )
     
     @property
-    def fit_html(self):
+    def fit_html(self) -> Optional[str]:
         """
-        Deprecated property that raises an AttributeError when accessed.
+        HTML preprocessed for schema generation.
+
+        Built from ``html`` the first time it is read and kept afterwards, so
+        runs that never look at it don't pay for the extra parse.
         """
-        raise AttributeError(
-            "The 'fit_html' attribute is deprecated and has been removed. "
-            "Please use 'markdown.fit_html' instead."
-        )
+        if self._fit_html is None and self.html:
+            from .config import FIT_HTML_TEXT_THRESHOLD, FIT_HTML_MAX_SIZE
+            from .utils import preprocess_html_for_schema
+            self._fit_html = preprocess_html_for_schema(
+                html_content=self.html,
+                text_threshold=FIT_HTML_TEXT_THRESHOLD,
+                max_size=FIT_HTML_MAX_SIZE,
+            )
+        return self._fit_html
+
+    @fit_html.setter
+    def fit_html(self, value):
+        self._fit_html = value
 
     def model_dump(self, *args, **kwargs):
         """
@@ -256,7 +274,7 @@ class CrawlResult(BaseModel):
         
         # Remove any property descriptors that might have been included
         # These deprecated properties should not be in the serialized output
-        for key in ['fit_html', 'fit_markdown', 'markdown_v2']:
+        for key in ['fit_markdown', 'markdown_v2']:
             if key in result and isinstance(result[key], property):
                 # del result[key]
                 # Nasrin: I decided to convert it to string instead of removing it.
@@ -265,6 +283,14 @@ class CrawlResult(BaseModel):
         # Add the markdown field properly
         if self._markdown is not None:
             result["markdown"] = self._markdown.model_dump() 
+
+        # fit_html is built lazily; only pay for it here when asked via include
+        exclude = kwargs.get("exclude") or ()
+        include = kwargs.get("include") or ()
+        if "fit_html" in include:
+            result["fit_html"] = self.fit_html
+        elif "fit_html" not in exclude and not include:
+            result["fit_html"] = self._fit_html
         return result
 
 class StringCompatibleMarkdown(str):
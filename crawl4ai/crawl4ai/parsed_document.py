@@ -0,0 +1,65 @@
+"""
+Per-page parsed HTML shared across the processing stages of a crawl.
+
+aprocess_html builds one ParsedDocument for the raw HTML of a page and hands
+it to the scraping strategy, schema preprocessing and structured extraction,
+so the page is parsed once instead of once per stage.
+"""
+
+import copy
+from typing import Optional
+
+from bs4 import BeautifulSoup
+from lxml import html as lhtml
+
+
+class ParsedDocument:
+    """
+    HTML string with lazily built, cached parse trees.
+
+    Read-only stages share the cached trees returned by ``lxml_tree()`` and
+    ``soup()``. Stages that mutate the tree call ``lxml_copy()`` instead:
+    when the tree is shared (``share=True`` or a reader already parsed it)
+    they get a deep copy of the cached parse, which is cheaper than parsing
+    again; otherwise they get a private parse that is never cached, so a
+    page with a single consumer still costs exactly one parse.
+    """
+
+    def __init__(self, html: str, share: bool = False):
+        self.html = html
+        self.share = share
+        self.parse_count = 0
+        self._lxml = None
+        self._soup: Optional[BeautifulSoup] = None
+
+    def matches(self, html: str) -> bool:
+        """True if this document was built from the given HTML"""
+        return html is self.html or html == self.html
+
+    @property
+    def copies_are_cheap(self) -> bool:
+        """True if lxml_copy() copies a cached parse instead of parsing"""
+        return self.share or self._lxml is not None
+
+    def lxml_tree(self):
+        """Shared lxml document. Callers must not modify it."""
+        if self._lxml is None:
+            self._lxml = self._parse_lxml()
+        return self._lxml
+
+    def lxml_copy(self):
+        """lxml document the caller is free to modify"""
+        if not self.copies_are_cheap:
+            return self._parse_lxml()
+        return copy.deepcopy(self.lxml_tree())
+
+    def soup(self) -> BeautifulSoup:
+        """Shared BeautifulSoup tree. Callers must not modify it."""
+        if self._soup is None:
+            self.parse_count += 1
+            self._soup = BeautifulSoup(self.html, "lxml")
+        return self._soup
+
+    def _parse_lxml(self):
+        self.parse_count += 1
+        return lhtml.document_fromstring(self.html)
@@ -0,0 +1,151 @@
+"""
+Optional process pool for the CPU-bound part of a crawl.
+
+Once a page is fetched, aprocess_html (scraping, markdown generation and
+extraction) is pure CPU work on the event loop. With many browsers feeding one
+loop that single core becomes the bottleneck and stalls page I/O, so
+AsyncWebCrawler can hand the work to worker processes instead:
+
+    pool = HTMLProcessPool(max_workers=4)
+    async with AsyncWebCrawler(html_process_pool=pool) as crawler:
+        results = await crawler.arun_many(urls, config=config)
+
+Workers are started with the "spawn" method by default, so scripts using the
+pool need the usual ``if __name__ == "__main__":`` guard.
+"""
+
+import asyncio
+import copy
+import multiprocessing
+import os
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Optional
+
+from .async_configs import CrawlerRunConfig
+from .content_filter_strategy import LLMContentFilter
+from .extraction_strategy import LLMExtractionStrategy
+from .models import CrawlResult
+
+# Config fields only used while fetching, dropped before shipping to a worker
+FETCH_ONLY_FIELDS = (
+    "proxy_rotation_strategy",
+    "deep_crawl_strategy",
+    "url_matcher",
+    "shared_data",
+)
+
+# Per-worker-process state, created on first use
+_worker_crawler = None
+_worker_loop = None
+
+
+def _process_in_worker(payload: bytes) -> CrawlResult:
+    """Run aprocess_html in a worker process on pickled arguments"""
+    global _worker_crawler, _worker_loop
+    if _worker_crawler is None:
+        from .async_logger import AsyncLogger
+        from .async_webcrawler import AsyncWebCrawler
+
+        _worker_crawler = AsyncWebCrawler(logger=AsyncLogger(verbose=False))
+        _worker_loop = asyncio.new_event_loop()
+
+    kwargs = pickle.loads(payload)
+    return _worker_loop.run_until_complete(_worker_crawler.aprocess_html(**kwargs))
+
+
+class HTMLProcessPool:
+    """
+    Runs AsyncWebCrawler.aprocess_html in a ProcessPoolExecutor.
+
+    At most ``max_in_flight`` pages are queued or running in the pool at a
+    time; further pages wait for a slot, which keeps fetched HTML from piling
+    up in memory. Pages whose config can't be pickled, or whose post-processing
+    is I/O rather than CPU (LLM extraction or filtering, link previews), are
+    processed in-process as before.
+
+    Stateful strategies run on a copy in the worker, so state they accumulate
+    there (caches, counters) is not reflected back in the parent.
+    """
+
+    def __init__(
+        self,
+        max_workers: Optional[int] = None,
+        max_in_flight: Optional[int] = None,
+        mp_context: str = "spawn",
+    ):
+        self.max_workers = max_workers or os.cpu_count() or 1
+        self.max_in_flight = max_in_flight or 2 * self.max_workers
+        self.mp_context = mp_context
+        self.stats = {"offloaded": 0, "in_process": 0}
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def _get_executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=multiprocessing.get_context(self.mp_context),
+            )
+        return self._executor
+
+    @staticmethod
+    def should_offload(config: CrawlerRunConfig) -> bool:
+        """False for configs whose post-processing is I/O-bound"""
+        if isinstance(config.extraction_strategy, LLMExtractionStrategy):
+            return False
+        if isinstance(getattr(config.markdown_generator, "content_filter", None), LLMContentFilter):
+            return False
+        return config.link_preview_config is None
+
+    def payload(self, config: CrawlerRunConfig, **kwargs) -> Optional[bytes]:
+        """Pickled aprocess_html arguments, or None if they must stay in-process"""
+        if not self.should_offload(config):
+            return None
+
+        worker_config = copy.copy(config)
+        for field in FETCH_ONLY_FIELDS:
+            setattr(worker_config, field, None)
+        # Loggers hold console and file handles, the worker uses its own
+        for name in ("scraping_strategy", "table_extraction"):
+            strategy = getattr(worker_config, name, None)
+            if getattr(strategy, "logger", None) is not None:
+                strategy = copy.copy(strategy)
+                strategy.logger = None
+                setattr(worker_config, name, strategy)
+
+        try:
+            return pickle.dumps(dict(kwargs, config=worker_config))
+        except Exception:
+            # PicklingError, TypeError or AttributeError depending on the object
+            return None
+
+    async def process(self, crawler, config: CrawlerRunConfig, **kwargs) -> CrawlResult:
+        """Process a page in the pool, or in-process when it can't be shipped"""
+        payload = self.payload(config, **kwargs)
+        if payload is not None:
+            if self._slots is None:
+                self._slots = asyncio.Semaphore(self.max_in_flight)
+            async with self._slots:
+                try:
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        self._get_executor(), _process_in_worker, payload
+                    )
+                    self.stats["offloaded"] += 1
+                    return result
+                except BrokenProcessPool:
+                    # A worker died, start a fresh pool next time
+                    self._executor = None
+                    crawler.logger.warning(
+                        "HTML process pool broke, processing in-process", tag="POOL"
+                    )
+
+        self.stats["in_process"] += 1
+        return await crawler.aprocess_html(config=config, **kwargs)
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker processes"""
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
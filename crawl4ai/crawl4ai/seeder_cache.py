@@ -0,0 +1,248 @@
+"""
+Cache for AsyncUrlSeeder, kept in a single SQLite database.
+
+Two kinds of data are stored:
+
+- Per-URL results of live checks and head extraction, keyed by (kind, url).
+  Concurrent lookups made in the same event-loop iteration are answered by
+  one query, and writes are buffered and flushed in batches.
+- URL lists discovered from Common Crawl or sitemaps, one named list per
+  source and domain. A list is only served from cache once it was written
+  completely, and reads filter it with the seeding pattern inside SQLite.
+
+Every row carries the time it was stored; entries older than ``ttl`` are
+treated as missing and removed by ``purge_expired``.
+"""
+
+import asyncio
+import json
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence
+
+# Keys per lookup query, below SQLite's default limit of 999 bound parameters
+LOOKUP_BATCH_SIZE = 500
+# Buffered entry writes before a flush
+WRITE_BATCH_SIZE = 256
+# Rows fetched at a time when streaming a URL list
+LIST_FETCH_SIZE = 1000
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    url TEXT NOT NULL,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (kind, url)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS url_lists (
+    name TEXT PRIMARY KEY,
+    stored_at REAL NOT NULL,
+    complete INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS list_urls (
+    name TEXT NOT NULL,
+    url TEXT NOT NULL,
+    canon TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_list_urls_name ON list_urls(name);
+"""
+
+
+def _glob(pattern: str) -> str:
+    """fnmatch pattern in SQLite GLOB syntax"""
+    return pattern.replace("[!", "[^")
+
+
+class SeederCache:
+    """
+    SQLite-backed cache shared by the seeding coroutines of one process.
+
+    The connection is opened once and guarded by a lock; all calls are short
+    index lookups or batched writes, so they run directly on the event loop.
+    """
+
+    def __init__(self, path: str, ttl: float):
+        self.path = str(path)
+        self.ttl = ttl
+        self._conn = sqlite3.connect(self.path, check_same_thread=False)
+        self._lock = threading.RLock()
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(SCHEMA)
+        self._writes: Dict[tuple, Dict[str, Any]] = {}
+        self._lookups: Dict[str, Dict[str, List[asyncio.Future]]] = {}
+        self._lookup_scheduled = False
+
+    def _cutoff(self) -> float:
+        return time.time() - self.ttl
+
+    # ───────── per-URL entries ─────────
+    def get_many(self, kind: str, urls: Sequence[str]) -> Dict[str, Dict[str, Any]]:
+        """Fresh entries for ``urls``; missing or expired ones are left out"""
+        found: Dict[str, Dict[str, Any]] = {}
+        wanted = []
+        for url in urls:
+            pending = self._writes.get((kind, url))
+            if pending is not None:
+                found[url] = pending
+            else:
+                wanted.append(url)
+
+        cutoff = self._cutoff()
+        with self._lock:
+            for i in range(0, len(wanted), LOOKUP_BATCH_SIZE):
+                chunk = wanted[i:i + LOOKUP_BATCH_SIZE]
+                rows = self._conn.execute(
+                    f"SELECT url, data FROM entries WHERE kind = ? AND stored_at >= ? "
+                    f"AND url IN ({','.join('?' * len(chunk))})",
+                    (kind, cutoff, *chunk),
+                ).fetchall()
+                for url, data in rows:
+                    try:
+                        found[url] = json.loads(data)
+                    except ValueError:
+                        continue
+        return found
+
+    async def get(self, kind: str, url: str) -> Optional[Dict[str, Any]]:
+        """
+        Fresh entry for ``url`` or None.
+
+        Lookups made before the event loop next runs its callbacks are
+        collected and resolved with one get_many call per kind.
+        """
+        pending = self._writes.get((kind, url))
+        if pending is not None:
+            return pending
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._lookups.setdefault(kind, {}).setdefault(url, []).append(future)
+        if not self._lookup_scheduled:
+            self._lookup_scheduled = True
+            loop.call_soon(self._run_lookups)
+        return await future
+
+    def _run_lookups(self):
+        lookups, self._lookups = self._lookups, {}
+        self._lookup_scheduled = False
+        for kind, waiters in lookups.items():
+            try:
+                found = self.get_many(kind, list(waiters))
+            except sqlite3.Error:
+                found = {}
+            for url, futures in waiters.items():
+                for future in futures:
+                    if not future.done():
+                        future.set_result(found.get(url))
+
+    def put(self, kind: str, url: str, data: Dict[str, Any]) -> None:
+        """Buffer an entry, flushing once WRITE_BATCH_SIZE are waiting"""
+        self._writes[(kind, url)] = data
+        if len(self._writes) >= WRITE_BATCH_SIZE:
+            self.flush()
+
+    def set_many(self, kind: str, items: Iterable[tuple]) -> None:
+        """Store (url, data) pairs right away"""
+        now = time.time()
+        rows = [(kind, url, json.dumps(data, separators=(",", ":")), now) for url, data in items]
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO entries (kind, url, data, stored_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def flush(self) -> None:
+        """Write buffered entries"""
+        if not self._writes:
+            return
+        writes, self._writes = self._writes, {}
+        by_kind: Dict[str, List[tuple]] = {}
+        for (kind, url), data in writes.items():
+            by_kind.setdefault(kind, []).append((url, data))
+        for kind, items in by_kind.items():
+            self.set_many(kind, items)
+
+    # ───────── URL lists ─────────
+    def has_list(self, name: str) -> bool:
+        """True if a complete, fresh copy of the list is cached"""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM url_lists WHERE name = ? AND complete = 1 AND stored_at >= ?",
+                (name, self._cutoff()),
+            ).fetchone()
+        return row is not None
+
+    def iter_list(self, name: str, pattern: str = "*") -> Iterator[str]:
+        """
+        Stream a cached list in discovery order, keeping URLs that match
+        ``pattern`` the way the seeder's ``_match`` does: against the full
+        URL, without the scheme, or without the scheme and a leading "www.".
+        """
+        sql = "SELECT url FROM list_urls WHERE name = ?"
+        params: tuple = (name,)
+        if pattern != "*":
+            glob = _glob(pattern)
+            sql += (" AND (url GLOB ? OR canon GLOB ?"
+                    " OR (canon GLOB 'www.*' AND substr(canon, 5) GLOB ?))")
+            params += (glob, glob, glob)
+        sql += " ORDER BY rowid"
+
+        with self._lock:
+            cursor = self._conn.execute(sql, params)
+            rows = cursor.fetchmany(LIST_FETCH_SIZE)
+        while rows:
+            for (url,) in rows:
+                yield url
+            with self._lock:
+                rows = cursor.fetchmany(LIST_FETCH_SIZE)
+
+    def start_list(self, name: str) -> None:
+        """Drop any cached copy of a list that is about to be re-fetched"""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM list_urls WHERE name = ?", (name,))
+            self._conn.execute(
+                "INSERT OR REPLACE INTO url_lists (name, stored_at, complete) VALUES (?, ?, 0)",
+                (name, time.time()),
+            )
+
+    def extend_list(self, name: str, urls: Sequence[str]) -> None:
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT INTO list_urls (name, url, canon) VALUES (?, ?, ?)",
+                ((name, url, url.split("://", 1)[-1]) for url in urls),
+            )
+
+    def finish_list(self, name: str) -> None:
+        """Mark a list as completely written, so later runs read it from cache"""
+        with self._lock, self._conn:
+            self._conn.execute(
+                "UPDATE url_lists SET complete = 1, stored_at = ? WHERE name = ?",
+                (time.time(), name),
+            )
+
+    # ───────── maintenance ─────────
+    def purge_expired(self) -> int:
+        """Delete expired entries and lists, returning the number of entries removed"""
+        self.flush()
+        cutoff = self._cutoff()
+        with self._lock, self._conn:
+            removed = self._conn.execute(
+                "DELETE FROM entries WHERE stored_at < ?", (cutoff,)
+            ).rowcount
+            self._conn.execute(
+                "DELETE FROM list_urls WHERE name IN (SELECT name FROM url_lists WHERE stored_at < ?)",
+                (cutoff,),
+            )
+            self._conn.execute("DELETE FROM url_lists WHERE stored_at < ?", (cutoff,))
+        return removed
+
+    def close(self) -> None:
+        try:
+            self.flush()
+        finally:
+            with self._lock:
+                self._conn.close()
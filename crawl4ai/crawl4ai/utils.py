@@ -26,6 +26,7 @@ import cProfile
 import pstats
 from functools import wraps
 import asyncio
+import threading
 from lxml import etree, html as lhtml
 import sqlite3
 import hashlib
@@ -39,7 +40,7 @@ from . import __version__
 from typing import Sequence
 
 from itertools import chain
-from collections import deque
+from collections import deque, OrderedDict
 import psutil
 import numpy as np
 
@@ -250,19 +251,48 @@ class VersionManager:
 
 
 class RobotsParser:
+    """
+    robots.txt checks backed by a two-tier cache.
+
+    Compiled RobotFileParser objects for recently seen domains are kept in an
+    in-process LRU; behind it the raw rules live in a SQLite database that is
+    shared between runs and opened once per parser. Concurrent checks for a
+    domain whose rules are missing or stale share a single fetch, and all
+    fetches go through one aiohttp session. Call ``close()`` to release it.
+    """
+
     # Default 7 days cache TTL
     CACHE_TTL = 7 * 24 * 60 * 60
+    # How long a failed or non-200 fetch is remembered (in memory only)
+    FAILURE_TTL = 5 * 60
 
-    def __init__(self, cache_dir=None, cache_ttl=None):
+    def __init__(self, cache_dir=None, cache_ttl=None, max_cached_domains=1024, failure_ttl=None):
         self.cache_dir = cache_dir or os.path.join(get_home_folder(), ".crawl4ai", "robots")
         self.cache_ttl = cache_ttl or self.CACHE_TTL
+        self.failure_ttl = self.FAILURE_TTL if failure_ttl is None else failure_ttl
+        self.max_cached_domains = max_cached_domains
         os.makedirs(self.cache_dir, exist_ok=True)
         self.db_path = os.path.join(self.cache_dir, "robots_cache.db")
+        # domain -> (parser or None to allow everything, expires_at)
+        self._parsers = OrderedDict()
+        self._inflight: Dict[str, asyncio.Task] = {}
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._session_loop = None
+        self._conn: Optional[sqlite3.Connection] = None
+        self._db_lock = threading.Lock()
         self._init_db()
 
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._conn = sqlite3.connect(
+                self.db_path, check_same_thread=False, isolation_level=None
+            )
+        return self._conn
+
     def _init_db(self):
         # Use WAL mode for better concurrency and performance
-        with sqlite3.connect(self.db_path) as conn:
+        with self._db_lock:
+            conn = self._connection()
             conn.execute("PRAGMA journal_mode=WAL")
             conn.execute("""
                 CREATE TABLE IF NOT EXISTS robots_cache (
@@ -276,105 +306,188 @@ class RobotsParser:
 
     def _get_cached_rules(self, domain: str) -> tuple[str, bool]:
         """Get cached rules. Returns (rules, is_fresh)"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.execute(
-                "SELECT rules, fetch_time, hash FROM robots_cache WHERE domain = ?", 
+        with self._db_lock:
+            result = self._connection().execute(
+                "SELECT rules, fetch_time FROM robots_cache WHERE domain = ?",
                 (domain,)
-            )
-            result = cursor.fetchone()
-            
-            if not result:
-                return None, False
-                
-            rules, fetch_time, _ = result
-            # Check if cache is still fresh based on TTL
-            return rules, (time.time() - fetch_time) < self.cache_ttl
+            ).fetchone()
+
+        if not result:
+            return None, False
+
+        rules, fetch_time = result
+        # Check if cache is still fresh based on TTL
+        return rules, (time.time() - fetch_time) < self.cache_ttl
 
     def _cache_rules(self, domain: str, content: str):
         """Cache robots.txt content with hash for change detection"""
         hash_val = hashlib.md5(content.encode()).hexdigest()
-        with sqlite3.connect(self.db_path) as conn:
-            # Check if content actually changed
-            cursor = conn.execute(
-                "SELECT hash FROM robots_cache WHERE domain = ?", 
+        with self._db_lock:
+            conn = self._connection()
+            result = conn.execute(
+                "SELECT hash FROM robots_cache WHERE domain = ?",
                 (domain,)
-            )
-            result = cursor.fetchone()
-            
-            # Only update if hash changed or no previous entry
+            ).fetchone()
+
             if not result or result[0] != hash_val:
                 conn.execute(
-                    """INSERT OR REPLACE INTO robots_cache 
-                       (domain, rules, fetch_time, hash) 
+                    """INSERT OR REPLACE INTO robots_cache
+                       (domain, rules, fetch_time, hash)
                        VALUES (?, ?, ?, ?)""",
                     (domain, content, int(time.time()), hash_val)
                 )
+            else:
+                # Unchanged rules only need their freshness renewed
+                conn.execute(
+                    "UPDATE robots_cache SET fetch_time = ? WHERE domain = ?",
+                    (int(time.time()), domain)
+                )
 
-    async def can_fetch(self, url: str, user_agent: str = "*") -> bool:
+    @staticmethod
+    def _compile(rules: Optional[str]) -> Optional[RobotFileParser]:
+        """Parse rules once; None means everything is allowed"""
+        if not rules:
+            return None
+        parser = RobotFileParser()
+        parser.parse(rules.splitlines())
+        # If parser can't read rules, allow access
+        return parser if parser.mtime() else None
+
+    def _remember(self, domain: str, parser: Optional[RobotFileParser], ttl: float):
+        self._parsers[domain] = (parser, time.time() + ttl)
+        self._parsers.move_to_end(domain)
+        while len(self._parsers) > self.max_cached_domains:
+            self._parsers.popitem(last=False)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        loop = asyncio.get_running_loop()
+        if self._session is None or self._session.closed or self._session_loop is not loop:
+            # A session can't be used from another loop, so the old one is dropped
+            self._session = aiohttp.ClientSession(timeout=aiohttp.ClientTimeout(total=2))
+            self._session_loop = loop
+        return self._session
+
+    async def _fetch_rules(self, robots_url: str) -> Optional[str]:
+        """robots.txt body, or None if it could not be fetched"""
+        try:
+            async with self._get_session().get(robots_url, ssl=False) as response:
+                if response.status == 200:
+                    return await response.text()
+        except Exception as _ex:
+            # On any error (timeout, connection failed, etc), allow access
+            pass
+        return None
+
+    async def _load_parser(self, domain: str, scheme: str) -> Optional[RobotFileParser]:
+        rules, is_fresh = self._get_cached_rules(domain)
+        ttl = self.cache_ttl
+
+        # If rules not found or stale, fetch new ones
+        if not is_fresh:
+            rules = await self._fetch_rules(f"{scheme}://{domain}/robots.txt")
+            if rules is None:
+                ttl = self.failure_ttl
+            else:
+                self._cache_rules(domain, rules)
+
+        parser = self._compile(rules)
+        self._remember(domain, parser, ttl)
+        return parser
+
+    async def get_parser(self, url: str) -> Optional[RobotFileParser]:
         """
-        Check if URL can be fetched according to robots.txt rules.
-        
-        Args:
-            url: The URL to check
-            user_agent: User agent string to check against (default: "*")
-            
-        Returns:
-            bool: True if allowed, False if disallowed by robots.txt
+        Compiled robots.txt rules for the URL's domain.
+
+        Returns None when the domain has no usable rules, which means every
+        URL is allowed.
         """
         # Handle empty/invalid URLs
         try:
             parsed = urlparse(url)
             domain = parsed.netloc
             if not domain:
-                return True
+                return None
         except Exception as _ex:
-            return True
+            return None
 
-        # Fast path - check cache first
-        rules, is_fresh = self._get_cached_rules(domain)
-        
-        # If rules not found or stale, fetch new ones
-        if not is_fresh:
-            try:
-                # Ensure we use the same scheme as the input URL
-                scheme = parsed.scheme or 'http'
-                robots_url = f"{scheme}://{domain}/robots.txt"
-                
-                async with aiohttp.ClientSession() as session:
-                    async with session.get(robots_url, timeout=2, ssl=False) as response:
-                        if response.status == 200:
-                            rules = await response.text()
-                            self._cache_rules(domain, rules)
-                        else:
-                            return True
-            except Exception as _ex:
-                # On any error (timeout, connection failed, etc), allow access
-                return True
+        # Fast path - compiled parser in memory
+        cached = self._parsers.get(domain)
+        if cached is not None and cached[1] > time.time():
+            self._parsers.move_to_end(domain)
+            return cached[0]
+
+        # One lookup per domain, concurrent callers wait for it
+        task = self._inflight.get(domain)
+        if task is None:
+            # Ensure we use the same scheme as the input URL
+            task = asyncio.ensure_future(self._load_parser(domain, parsed.scheme or "http"))
+            self._inflight[domain] = task
+            task.add_done_callback(lambda _, domain=domain: self._inflight.pop(domain, None))
+        try:
+            # Shielded so a cancelled caller doesn't abort the fetch for the others
+            return await asyncio.shield(task)
+        except asyncio.CancelledError:
+            raise
+        except Exception as _ex:
+            return None
 
-        if not rules:
-            return True
+    async def can_fetch(self, url: str, user_agent: str = "*") -> bool:
+        """
+        Check if URL can be fetched according to robots.txt rules.
 
-        # Create parser for this check
-        parser = RobotFileParser() 
-        parser.parse(rules.splitlines())
-        
-        # If parser can't read rules, allow access
-        if not parser.mtime():
+        Args:
+            url: The URL to check
+            user_agent: User agent string to check against (default: "*")
+
+        Returns:
+            bool: True if allowed, False if disallowed by robots.txt
+        """
+        parser = await self.get_parser(url)
+        if parser is None:
             return True
-            
         return parser.can_fetch(user_agent, url)
 
+    async def crawl_delay(self, url: str, user_agent: str = "*") -> Optional[float]:
+        """
+        Seconds to wait between requests to the URL's domain, from the
+        Crawl-delay or Request-rate rules, or None if robots.txt sets neither.
+        """
+        parser = await self.get_parser(url)
+        if parser is None:
+            return None
+        delay = parser.crawl_delay(user_agent)
+        if delay is not None:
+            return float(delay)
+        rate = parser.request_rate(user_agent)
+        if rate is not None and rate.requests:
+            return rate.seconds / rate.requests
+        return None
+
     def clear_cache(self):
         """Clear all cached robots.txt entries"""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("DELETE FROM robots_cache")
+        self._parsers.clear()
+        with self._db_lock:
+            self._connection().execute("DELETE FROM robots_cache")
 
     def clear_expired(self):
         """Remove only expired entries from cache"""
-        with sqlite3.connect(self.db_path) as conn:
-            expire_time = int(time.time()) - self.cache_ttl
-            conn.execute("DELETE FROM robots_cache WHERE fetch_time < ?", (expire_time,))
-      
+        now = time.time()
+        for domain in [d for d, (_, expires) in self._parsers.items() if expires <= now]:
+            del self._parsers[domain]
+        with self._db_lock:
+            expire_time = int(now) - self.cache_ttl
+            self._connection().execute("DELETE FROM robots_cache WHERE fetch_time < ?", (expire_time,))
+
+    async def close(self):
+        """Close the shared HTTP session and the cache database"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
 
 class InvalidCSSSelectorError(Exception):
     pass
@@ -2998,7 +3111,7 @@ class HeadPeekr:
         title_match = re.search(r'<title>(.*?)</title>', head_content, re.IGNORECASE | re.DOTALL)
         return title_match.group(1) if title_match else None
 
-def preprocess_html_for_schema(html_content, text_threshold=100, attr_value_threshold=200, max_size=100000):
+def preprocess_html_for_schema(html_content, text_threshold=100, attr_value_threshold=200, max_size=100000, document=None):
     """
     Preprocess HTML to reduce size while preserving structure for schema generation.
     
@@ -3007,14 +3120,22 @@ def preprocess_html_for_schema(html_content, text_threshold=100, attr_value_thre
         text_threshold (int): Maximum length for text nodes before truncation
         attr_value_threshold (int): Maximum length for attribute values before truncation
         max_size (int): Target maximum size for output HTML
+        document (ParsedDocument): Shared parse of html_content to copy instead of
+            parsing again
         
     Returns:
         str: Preprocessed HTML content
     """
     try:
-        # Parse HTML with error recovery
-        parser = etree.HTMLParser(remove_comments=True, remove_blank_text=True)
-        tree = lhtml.fromstring(html_content, parser=parser)
+        if document is None or not document.copies_are_cheap or not document.matches(html_content):
+            # Parse HTML with error recovery
+            parser = etree.HTMLParser(remove_comments=True, remove_blank_text=True)
+            tree = lhtml.fromstring(html_content, parser=parser)
+        else:
+            tree = document.lxml_copy()
+            # Drop comments like remove_comments=True does, keeping the text after them.
+            # remove_blank_text keeps inline whitespace in HTML, so text is left alone.
+            etree.strip_elements(tree, etree.Comment, with_tail=False)
         
         # 1. Remove HEAD section (keep only BODY)
         head_elements = tree.xpath('//head')
@@ -0,0 +1,114 @@
+import asyncio
+import os
+
+import pytest
+
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.models import CrawlResult, MarkdownGenerationResult
+from crawl4ai.utils import ensure_content_dirs
+
+
+@pytest.fixture
+def db(tmp_path):
+    manager = AsyncDatabaseManager()
+    manager.db_path = str(tmp_path / "crawl4ai.db")
+    manager.content_paths = ensure_content_dirs(str(tmp_path))
+    return manager
+
+
+def _result(i):
+    return CrawlResult(
+        url=f"https://example.com/{i}",
+        html=f"<html><body>page {i}</body></html>",
+        cleaned_html=f"<p>page {i}</p>",
+        success=True,
+        links={"internal": [{"href": f"/{i + 1}"}]},
+        markdown=MarkdownGenerationResult(
+            raw_markdown=f"page {i}",
+            markdown_with_citations=f"page {i} [1]",
+            references_markdown="refs",
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_batch_round_trip(db):
+    await db.acache_urls([_result(i) for i in range(3)])
+
+    urls = [f"https://example.com/{i}" for i in range(4)]
+    cached = await db.aget_cached_urls(urls)
+
+    assert sorted(cached) == urls[:3]
+    result = cached["https://example.com/1"]
+    assert result.html == "<html><body>page 1</body></html>"
+    assert result.markdown == "page 1"
+    assert result.markdown.markdown_with_citations == "page 1 [1]"
+    assert result.links == {"internal": [{"href": "/2"}]}
+    assert (await db.aget_cached_url("https://example.com/2")).cleaned_html == "<p>page 2</p>"
+
+
+@pytest.mark.asyncio
+async def test_selected_fields_skip_other_content(db, monkeypatch):
+    await db.acache_urls([_result(0)])
+    loaded = []
+    original = db.content_store.get_many
+
+    def counting(items):
+        loaded.extend(content_type for _, content_type in items)
+        return original(items)
+
+    monkeypatch.setattr(db.content_store, "get_many", counting)
+    result = await db.aget_cached_url("https://example.com/0", fields=["links"])
+
+    assert loaded == []
+    assert result.success and result.links == {"internal": [{"href": "/1"}]}
+    assert result.html == "" and result.markdown is None
+
+    with pytest.raises(ValueError):
+        await db.aget_cached_url("https://example.com/0", fields=["nope"])
+
+
+@pytest.mark.asyncio
+async def test_write_behind_reads_queued_writes(db):
+    db.write_behind = True
+    await db.acache_url(_result(0))
+
+    # Visible before the writer has run
+    assert (await db.aget_cached_url("https://example.com/0")).html.startswith("<html>")
+
+    await db.aflush_writes()
+    assert db._pending == {}
+    assert await db.aget_total_count() == 1
+    assert len(os.listdir(db.content_paths["html"])) == 1
+
+
+@pytest.mark.asyncio
+async def test_write_behind_survives_store_errors(db, monkeypatch):
+    db.write_behind = True
+    db.write_batch_size = 1
+
+    def failing(items):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(db.content_store, "put_many", failing)
+    for i in range(3):
+        await db.acache_url(_result(i))
+    await asyncio.wait_for(db.aflush_writes(), timeout=2)
+
+    assert db._pending == {} and not db._writer_task.done()
+    monkeypatch.undo()
+    await db.acache_url(_result(3))
+    await db.aflush_writes()
+    assert await db.aget_total_count() == 1
+
+
+@pytest.mark.asyncio
+async def test_queued_writes_respect_field_selection(db):
+    db.write_behind = True
+    await db.acache_url(_result(0))
+
+    result = await db.aget_cached_url("https://example.com/0", fields=["links"])
+
+    assert result.success and result.links == {"internal": [{"href": "/1"}]}
+    assert result.html == "" and result.markdown is None and result.cleaned_html is None
+    await db.aflush_writes()
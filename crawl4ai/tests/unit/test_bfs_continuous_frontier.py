@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.deep_crawling import BFSDeepCrawlStrategy
+from crawl4ai.models import CrawlResult
+
+ROOT = "https://example.com/"
+GRAPH = {
+    ROOT: ["a", "b"],
+    "a": ["a1"],
+    "b": ["b1", "b2"],
+    "b1": ["c"],
+    "b2": [],
+    "a1": [],
+    "c": ["d"],
+}
+
+
+def _url(name):
+    return name if name.startswith("http") else ROOT + name
+
+
+class FakeCrawler:
+    """arun_many over a link graph, crawling each URL as soon as it is fed"""
+
+    def __init__(self, delays=None, failures=()):
+        self.delays = {_url(k): v for k, v in (delays or {}).items()}
+        self.failures = {_url(f) for f in failures}
+        self.finished = []
+
+    def _result(self, url):
+        name = url[len(ROOT):] or ROOT
+        links = [{"href": _url(link)} for link in GRAPH.get(name, [])]
+        return CrawlResult(
+            url=url, html="", success=url not in self.failures, links={"internal": links}
+        )
+
+    async def arun_many(self, urls, config):
+        assert config.stream and config.deep_crawl_strategy is None
+        results = asyncio.Queue()
+
+        async def crawl(url):
+            await asyncio.sleep(self.delays.get(url, 0.01))
+            self.finished.append(url)
+            await results.put(self._result(url))
+
+        async def feed():
+            tasks = [asyncio.create_task(crawl(url)) async for url in urls]
+            await asyncio.gather(*tasks)
+            await results.put(None)
+
+        async def gen():
+            feeder = asyncio.create_task(feed())
+            while (result := await results.get()) is not None:
+                yield result
+            await feeder
+
+        return gen()
+
+
+@pytest.mark.asyncio
+async def test_slow_page_does_not_block_next_level():
+    crawler = FakeCrawler(delays={"a": 0.3})
+    strategy = BFSDeepCrawlStrategy(max_depth=3, continuous=True)
+
+    results = await strategy._arun_batch(ROOT, crawler, CrawlerRunConfig())
+
+    finished = [u[len(ROOT):] for u in crawler.finished]
+    assert finished.index("c") < finished.index("a")
+    by_url = {r.url: r.metadata for r in results}
+    assert by_url[_url("c")] == {"depth": 3, "parent_url": _url("b1")}
+    assert by_url[_url("a1")] == {"depth": 2, "parent_url": _url("a")}
+    assert _url("d") not in by_url
+
+
+@pytest.mark.asyncio
+async def test_max_pages_is_exact_and_failures_free_their_slot():
+    crawler = FakeCrawler(failures=["b"])
+    strategy = BFSDeepCrawlStrategy(max_depth=5, max_pages=3, continuous=True)
+
+    results = [r async for r in strategy._arun_stream(ROOT, crawler, CrawlerRunConfig())]
+
+    assert sum(r.success for r in results) == 3
+    assert [r.url for r in results if not r.success] == [_url("b")]
@@ -0,0 +1,77 @@
+import pickle
+import random
+
+import numpy as np
+import pytest
+from rank_bm25 import BM25Okapi
+
+from crawl4ai.bm25 import BM25Index, TokenCache
+from crawl4ai.content_filter_strategy import BM25ContentFilter
+
+
+@pytest.fixture
+def corpus():
+    rng = random.Random(7)
+    words = [f"w{i}" for i in range(300)]
+    return [[rng.choice(words[:rng.randint(3, 300)]) for _ in range(rng.randint(0, 30))]
+            for _ in range(500)]
+
+
+def test_scores_match_rank_bm25(corpus):
+    query = ["w1", "w2", "w2", "w150", "missing"]
+    index = BM25Index()
+    index.add_documents(corpus)
+
+    np.testing.assert_allclose(index.get_scores(query), BM25Okapi(corpus).get_scores(query))
+
+
+def test_incremental_adds_match_full_rebuild(corpus):
+    query = ["w3", "w40"]
+    index = BM25Index()
+    assert list(index.add_documents(corpus[:200])) == list(range(200))
+    index.get_scores(query)
+    assert index.add_document(corpus[200]) == 200
+    index.add_documents(corpus[201:])
+
+    assert len(index) == len(corpus)
+    np.testing.assert_allclose(index.get_scores(query), BM25Okapi(corpus).get_scores(query))
+
+
+def test_empty_inputs():
+    index = BM25Index()
+    assert index.get_scores(["a"]).shape == (0,)
+    index.add_documents([[], []])
+    assert index.get_scores(["a"]).tolist() == [0.0, 0.0]
+
+
+def test_token_cache_reuses_and_does_not_pickle_entries():
+    calls = []
+
+    def tokenizer(text):
+        calls.append(text)
+        return text.split()
+
+    cache = TokenCache(tokenizer, max_size=2)
+    assert cache("a b") == ["a", "b"]
+    assert cache("a b") == ["a", "b"]
+    cache("c")
+    cache("d")
+    cache("a b")
+    assert calls == ["a b", "c", "d", "a b"]
+
+    restored = pickle.loads(pickle.dumps(TokenCache(str.split)))
+    assert restored._cache == {} and restored("x y") == ["x", "y"]
+
+
+def test_content_filter_keeps_relevant_chunks():
+    html = """<html><head><title>Python crawler</title></head><body>
+    <h1>Python crawler guide</h1>
+    <p>This guide shows how to build a fast python crawler with asyncio and browsers.</p>
+    <p>Our cookie policy describes how we store preferences for returning visitors.</p>
+    </body></html>"""
+    content_filter = BM25ContentFilter(user_query="python crawler", bm25_threshold=0.1)
+    chunks = content_filter.filter_content(html)
+
+    assert any("fast python crawler" in chunk for chunk in chunks)
+    assert not any("cookie policy" in chunk for chunk in chunks)
+    assert pickle.loads(pickle.dumps(content_filter)).filter_content(html) == chunks
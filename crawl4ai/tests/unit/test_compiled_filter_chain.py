@@ -0,0 +1,117 @@
+import asyncio
+import re
+
+import pytest
+
+from crawl4ai.deep_crawling.filters import (
+    ContentTypeFilter,
+    DomainFilter,
+    DomainSuffixTrie,
+    FilterChain,
+    URLFilter,
+    URLParts,
+    URLPatternFilter,
+)
+
+URLS = [
+    "https://example.com/",
+    "https://docs.example.com/guide/intro.html",
+    "https://blog.example.com/2024/05/post?ref=home",
+    "http://EXAMPLE.com/api/v2/users",
+    "https://example.com/apiv2/users",
+    "https://example.com/api#top",
+    "https://cdn.example.com/assets/logo.png",
+    "https://example.com/report.pdf?download=1",
+    "https://evil.com/phish",
+    "https://notexample.com/page",
+    "https://example.com:8080/admin/",
+    "https://tracker.ads.example.com/pixel.gif",
+    "ftp://files.example.com/archive.tar.gz",
+    "https:///broken",
+    "relative/path/page.php",
+]
+
+PATTERN_FILTERS = [
+    ["*.html"],
+    ["*/api/*", "*guide*", "*/docs/*"],
+    ["*.example.com/*", "*blog*"],
+    [r"^https://example\.com/\d*", "*.pdf*"],
+    [re.compile(r"LOGO", re.I), "*{guide,post}*"],
+    ["https://example.com/api/*", "https://example.com/ap/*"],
+]
+
+
+def _filters():
+    for patterns in PATTERN_FILTERS:
+        yield URLPatternFilter(patterns)
+        yield URLPatternFilter(patterns, reverse=True)
+    yield ContentTypeFilter(["text/html", "application/x-httpd-php"])
+    yield ContentTypeFilter("image", check_extension=False)
+    yield DomainFilter(allowed_domains=["example.com"], blocked_domains=["ads.example.com"])
+    yield DomainFilter(blocked_domains="evil.com")
+    yield DomainFilter()
+
+
+@pytest.mark.parametrize("url_filter", list(_filters()), ids=lambda f: f.name)
+def test_compiled_predicate_matches_apply(url_filter):
+    predicate = url_filter.compile()
+    for url in URLS:
+        assert predicate(URLParts(url)) == url_filter.apply(url), url
+
+
+def test_domain_suffix_trie():
+    trie = DomainSuffixTrie(["example.com", "co.uk"])
+    assert trie.match("example.com") and trie.match("a.b.example.com")
+    assert trie.match("shop.co.uk")
+    assert not trie.match("notexample.com") and not trie.match("example.com:8080")
+
+
+class Recorder(URLFilter):
+    def __init__(self, verdict):
+        super().__init__()
+        self.verdict = verdict
+        self.seen = []
+
+    async def apply(self, url):
+        self.seen.append(url)
+        return self.verdict
+
+
+@pytest.mark.asyncio
+async def test_chain_awaits_io_filters_only_for_sync_survivors():
+    io_filter = Recorder(True)
+    chain = FilterChain([
+        DomainFilter(allowed_domains="example.com"),
+        io_filter,
+        URLPatternFilter(["*.html"]),
+    ])
+
+    results = [await chain.apply(url) for url in URLS[:3] + ["https://evil.com/x.html"]]
+
+    assert results == [False, True, False, False]
+    assert io_filter.seen == ["https://docs.example.com/guide/intro.html"]
+    assert chain.stats.total_urls == 4 and chain.stats.passed_urls == 1
+    assert chain.rejection_stats == {"DomainFilter": 1, "Recorder": 0, "URLPatternFilter": 2}
+
+
+@pytest.mark.asyncio
+async def test_add_filter_recompiles():
+    chain = FilterChain([URLPatternFilter(["*/docs/*"])])
+    chain.add_filter(URLPatternFilter(["*/docs/*"], reverse=True))
+
+    assert not await chain.apply("https://example.com/docs/a")
+    assert list(chain.rejection_stats) == ["URLPatternFilter", "URLPatternFilter#2"]
+    assert chain.rejection_stats["URLPatternFilter#2"] == 1
+
+
+@pytest.mark.asyncio
+async def test_subclass_overriding_apply_is_not_compiled():
+    class NoAdminPattern(URLPatternFilter):
+        def apply(self, url: str) -> bool:
+            return super().apply(url) and "/admin" not in url
+
+    chain = FilterChain([NoAdminPattern(["*docs*"])])
+
+    assert await chain.apply("https://example.com/docs/a")
+    assert not await chain.apply("https://example.com/docs/admin")
+    assert chain.compile().steps[0][1] is None
@@ -0,0 +1,91 @@
+import os
+
+import pytest
+
+from crawl4ai.async_database import AsyncDatabaseManager
+from crawl4ai.content_store import ContentStore, FileContentStore, PackedContentStore
+from crawl4ai.models import CrawlResult
+from crawl4ai.utils import ensure_content_dirs
+
+PAGE = "<html><body>" + "<div class='row'><a href='/x'>item</a></div>" * 200 + "</body></html>"
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = PackedContentStore(str(tmp_path / "packs"))
+    yield store
+    store.close()
+
+
+def test_round_trip_is_compressed_and_deduplicated(store):
+    hashes = store.put_many([(PAGE, "html", "example.com"), ("", "markdown", None), (PAGE, "cleaned", None)])
+
+    assert hashes[1] == "" and hashes[0] == hashes[2]
+    assert store.get_many([(hashes[0], "html"), ("", "html"), ("missing", "html")]) == [PAGE, None, None]
+    stats = store.stats()
+    assert stats["records"] == 1
+    assert stats["stored_bytes"] * 5 < stats["raw_bytes"]
+
+
+def test_incomplete_store_fails_on_creation():
+    class PutOnlyStore(ContentStore):
+        def put_many(self, items):
+            return []
+
+    with pytest.raises(TypeError):
+        PutOnlyStore()
+
+
+def test_reopened_store_reads_existing_packs(tmp_path):
+    path = str(tmp_path / "packs")
+    first = PackedContentStore(path, max_pack_size=1)
+    hashes = first.put_many([(f"page {i}", "html", None) for i in range(3)])
+    first.close()
+
+    second = PackedContentStore(path)
+    assert second.get_many([(h, "html") for h in hashes]) == [f"page {i}" for i in range(3)]
+    assert second.stats()["packs"] == 3
+    second.close()
+
+
+def test_compaction_keeps_live_and_recent_content(store):
+    dead, live = store.put_many([("dead " + PAGE, "html", None), ("live " + PAGE, "html", None)])
+    mark = store.mark()
+    # Stored again after the mark, e.g. by a crawl running during compaction
+    (late,) = store.put_many([("dead " + PAGE, "html", None)])
+
+    store.compact({live}, mark)
+    assert store.get_many([(live, "html"), (late, "html")]) == ["live " + PAGE, "dead " + PAGE]
+
+    store.compact({live}, store.mark())
+    assert store.get_many([(dead, "html")]) == [None]
+    assert store.stats()["records"] == 1
+
+
+def test_migration_from_files_keeps_hashes(tmp_path):
+    files = FileContentStore(ensure_content_dirs(str(tmp_path / "files")))
+    hashes = files.put_many([(PAGE, "html", None), ("# md", "markdown", None)])
+    packed = PackedContentStore(str(tmp_path / "packs"))
+
+    assert packed.migrate_from(files, remove=True) == 2
+    assert list(files.iter_files()) == []
+    assert packed.get_many([(hashes[0], "html"), (hashes[1], "markdown")]) == [PAGE, "# md"]
+    packed.close()
+
+
+@pytest.mark.asyncio
+async def test_database_on_packed_store(tmp_path):
+    db = AsyncDatabaseManager()
+    db.db_path = str(tmp_path / "crawl4ai.db")
+    db.content_paths = ensure_content_dirs(str(tmp_path))
+    await db.acache_url(CrawlResult(url="https://example.com/", html=PAGE, success=True))
+
+    packed = PackedContentStore(str(tmp_path / "packs"))
+    assert await db.amigrate_content_store(packed, remove_files=True) == 1
+    assert not os.listdir(db.content_paths["html"])
+    assert (await db.aget_cached_url("https://example.com/")).html == PAGE
+
+    await db.aclear_db()
+    assert await db.acompact_content() > 0
+    assert packed.stats()["records"] == 0
+    packed.close()
@@ -0,0 +1,210 @@
+import asyncio
+
+import pytest
+
+from crawl4ai.async_configs import BrowserConfig, CrawlerRunConfig
+from crawl4ai.async_crawler_strategy import AsyncPlaywrightCrawlerStrategy
+from crawl4ai.browser_adapter import UndetectedAdapter
+from crawl4ai.browser_manager import BrowserManager, ContextPool
+
+
+class FakePage:
+    def __init__(self, context):
+        self.context = context
+        self.closed = False
+        self.handlers = []
+
+    def once(self, event, handler):
+        self.handlers.append(handler)
+
+    def is_closed(self):
+        return self.closed
+
+    async def close(self):
+        if not self.closed:
+            self.closed = True
+            for handler in self.handlers:
+                handler(self)
+
+
+class FakeContext:
+    def __init__(self):
+        self.closed = False
+        self.handlers = []
+        self.pages = []
+
+    def on(self, event, handler):
+        self.handlers.append(handler)
+
+    async def new_page(self):
+        page = FakePage(self)
+        self.pages.append(page)
+        return page
+
+    async def close(self):
+        self.closed = True
+        for page in self.pages:
+            await page.close()
+        for handler in self.handlers:
+            handler(self)
+
+
+class RecordingLogger:
+    def __init__(self):
+        self.debug_messages = []
+
+    def debug(self, message, tag=None, params=None):
+        self.debug_messages.append(message.format(**(params or {})))
+
+    def warning(self, message, tag=None, params=None):
+        pass
+
+
+async def new_page(context):
+    return await context.new_page()
+
+
+async def reset(page):
+    if page.context.fail_reset:
+        raise RuntimeError("page crashed")
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+async def factory():
+    return FakeContext()
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_waits_for_open_pages():
+    pool = ContextPool(max_contexts=2, ttl=0)
+    a = await pool.acquire("a", factory)
+    b = await pool.acquire("b", factory)
+    pool.release(b)
+    assert (await pool.acquire("a", factory)) is a
+    pool.release(a)
+
+    await pool.acquire("c", factory)
+    await asyncio.sleep(0)
+    assert b.context.closed and not a.context.closed
+    assert list(pool.entries) == ["a", "c"]
+    assert (pool.stats["hits"], pool.stats["misses"], pool.stats["evictions"]) == (1, 3, 1)
+
+    # "a" still has a page open from its first acquire
+    await pool.acquire("d", factory)
+    await asyncio.sleep(0)
+    assert "a" not in pool.entries and not a.context.closed and pool.owns(a.context)
+    pool.release(a)
+    await asyncio.sleep(0)
+    assert a.context.closed and not pool.owns(a.context)
+
+
+@pytest.mark.asyncio
+async def test_recycling_and_idle_ttl(monkeypatch):
+    pool = ContextPool(max_contexts=4, ttl=60, max_pages=2)
+    first = await pool.acquire("a", factory)
+    pool.release(first)
+    assert (await pool.acquire("a", factory)) is first
+    pool.release(first)
+
+    recycled = await pool.acquire("a", factory)
+    assert recycled is not first and pool.stats["recycled"] == 1
+    pool.release(recycled)
+
+    recycled.last_used -= 61
+    await pool.acquire("b", factory)
+    await asyncio.sleep(0)
+    assert recycled.context.closed and list(pool.entries) == ["b"]
+
+
+@pytest.mark.asyncio
+async def test_context_closed_elsewhere_is_dropped():
+    pool = ContextPool()
+    entry = await pool.acquire("a", factory)
+    await entry.context.close()
+    assert len(pool) == 0 and (await pool.acquire("a", factory)) is not entry
+
+
+def test_signature_ignores_page_level_fields():
+    manager = BrowserManager(BrowserConfig(max_contexts=3))
+    sign = manager._make_config_signature
+
+    assert sign(CrawlerRunConfig(wait_for="css:p", page_timeout=5)) == sign(CrawlerRunConfig())
+    assert sign(CrawlerRunConfig(locale="de-DE")) != sign(CrawlerRunConfig())
+    assert sign(CrawlerRunConfig(proxy_config={"server": "http://a:1"})) == sign(
+        CrawlerRunConfig(proxy_config={"server": "http://a:1"})
+    )
+    assert manager.context_pool.max_contexts == 3
+
+
+@pytest.mark.asyncio
+async def test_pages_are_prewarmed_and_reused():
+    pool = ContextPool(page_pool_size=2, page_max_reuse=2)
+    entry = await pool.acquire("a", factory)
+    entry.context.fail_reset = False
+    first = await pool.open_page(entry, new_page)
+    await settle()
+    # One page out and expected back, one warm page waiting
+    assert len(entry.idle) == 1 and entry.open_pages == 2
+
+    entry = await pool.acquire("a", factory)
+    warm = await pool.open_page(entry, new_page)
+    assert warm is not first and not entry.idle
+    assert pool.stats["warm_pages"] == 1 and pool.stats["cold_pages"] == 1
+
+    # Returned pages are reset and handed out again instead of fresh ones
+    assert pool.recycle(first, reset)
+    await settle()
+    assert list(entry.idle) == [first] and entry.open_pages == 2
+    entry = await pool.acquire("a", factory)
+    assert (await pool.open_page(entry, new_page)) is first
+
+    # first is worn out now, so a replacement is pre-created
+    await settle()
+    assert not pool.recycle(first, reset)
+    assert len(entry.idle) == 1 and entry.idle[0] not in (first, warm)
+
+
+@pytest.mark.asyncio
+async def test_worn_out_or_unhealthy_pages_are_not_reused():
+    logger = RecordingLogger()
+    pool = ContextPool(page_pool_size=1, page_max_reuse=1, logger=logger)
+    entry = await pool.acquire("a", factory)
+    entry.context.fail_reset = True
+    page = await pool.open_page(entry, new_page)
+    assert not pool.recycle(page, reset)
+
+    pool.page_max_reuse = 5
+    assert pool.recycle(page, reset)
+    await settle()
+    assert page.closed and page not in entry.idle
+    assert "page crashed" in logger.debug_messages[0]
+
+
+@pytest.mark.asyncio
+async def test_evicted_context_closes_with_its_warm_pages():
+    pool = ContextPool(max_contexts=1, page_pool_size=2)
+    entry = await pool.acquire("a", factory)
+    entry.context.fail_reset = False
+    page = await pool.open_page(entry, new_page)
+    await settle()
+
+    await pool.acquire("b", factory)
+    await settle()
+    assert not entry.context.closed and not entry.idle
+
+    await page.close()
+    await settle()
+    assert entry.context.closed and entry.open_pages == 0
+
+
+def test_undetected_console_capture_keeps_pages_out_of_the_pool():
+    config = CrawlerRunConfig(capture_console_messages=True)
+
+    assert AsyncPlaywrightCrawlerStrategy()._page_reusable(config)
+    undetected = AsyncPlaywrightCrawlerStrategy(browser_adapter=UndetectedAdapter())
+    assert not undetected._page_reusable(config)
+    assert undetected._page_reusable(CrawlerRunConfig())
@@ -0,0 +1,107 @@
+import asyncio
+import gc
+import weakref
+from types import SimpleNamespace
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_dispatcher import MemoryAdaptiveDispatcher, SemaphoreDispatcher
+
+
+class DummyCrawler:
+    def __init__(self):
+        self.crawled = []
+
+    async def arun(self, url, config=None, session_id=None):
+        await asyncio.sleep(0.01)
+        self.crawled.append(url)
+        return SimpleNamespace(url=url, success=True, status_code=200, error_message="")
+
+
+def _dispatcher(**kwargs):
+    dispatcher = MemoryAdaptiveDispatcher(max_session_permit=2, **kwargs)
+    # Keep the host's real memory usage out of the test
+    dispatcher.memory_threshold_percent = dispatcher.critical_threshold_percent = 101
+    return dispatcher
+
+
+@pytest.mark.asyncio
+async def test_stream_consumes_async_source_lazily():
+    pulled = []
+
+    async def source():
+        for i in range(1000):
+            pulled.append(i)
+            yield f"https://example.com/{i}"
+
+    dispatcher = _dispatcher(prefetch=4)
+    stream = dispatcher.run_urls_stream(urls=source(), crawler=DummyCrawler(), config=CrawlerRunConfig())
+    first = await stream.__anext__()
+    await stream.aclose()
+
+    assert first.url.startswith("https://example.com/")
+    # Task queue, prefetch buffer, running tasks and the pump's pending put
+    assert len(pulled) <= 4 + 4 + 2 + 1
+
+
+@pytest.mark.asyncio
+async def test_run_urls_accepts_generators():
+    crawler = DummyCrawler()
+    urls = (f"https://example.com/{i}" for i in range(25))
+
+    results = await _dispatcher(prefetch=3).run_urls(urls=urls, crawler=crawler, config=CrawlerRunConfig())
+
+    assert sorted(r.url for r in results) == sorted(f"https://example.com/{i}" for i in range(25))
+
+
+@pytest.mark.asyncio
+async def test_stream_waits_for_slow_source():
+    async def source():
+        for i in range(3):
+            await asyncio.sleep(0.05)
+            yield f"https://example.com/{i}"
+
+    dispatcher = _dispatcher()
+    results = [r async for r in dispatcher.run_urls_stream(urls=source(), crawler=DummyCrawler(), config=CrawlerRunConfig())]
+
+    assert [r.url for r in results] == [f"https://example.com/{i}" for i in range(3)]
+
+
+@pytest.mark.asyncio
+async def test_semaphore_dispatcher_accepts_async_source():
+    async def source():
+        for i in range(10):
+            yield f"https://example.com/{i}"
+
+    dispatcher = SemaphoreDispatcher(semaphore_count=2, max_session_permit=3)
+    results = await dispatcher.run_urls(crawler=DummyCrawler(), urls=source(), config=CrawlerRunConfig())
+
+    assert [r.url for r in results] == [f"https://example.com/{i}" for i in range(10)]
+
+
+
+@pytest.mark.asyncio
+async def test_semaphore_dispatcher_drops_finished_tasks(monkeypatch):
+    refs = []
+    live_counts = []
+    create_task = asyncio.create_task
+
+    def tracking_create_task(coro, **kwargs):
+        task = create_task(coro, **kwargs)
+        refs.append(weakref.ref(task))
+        return task
+
+    async def source():
+        for i in range(30):
+            gc.collect()
+            live_counts.append(sum(ref() is not None for ref in refs))
+            yield f"https://example.com/{i}"
+
+    monkeypatch.setattr(asyncio, "create_task", tracking_create_task)
+    dispatcher = SemaphoreDispatcher(semaphore_count=2, max_session_permit=3)
+    results = await dispatcher.run_urls(crawler=DummyCrawler(), urls=source(), config=CrawlerRunConfig())
+
+    assert [r.url for r in results] == [f"https://example.com/{i}" for i in range(30)]
+    # Only running crawls are held, not every task the source produced
+    assert max(live_counts) <= 3
@@ -0,0 +1,60 @@
+import asyncio
+import time
+
+import pytest
+
+from crawl4ai.async_dispatcher import FairTaskQueue
+
+
+def _drain(queue):
+    urls = []
+    while not queue.empty():
+        urls.append(queue.get_nowait()[0])
+    return urls
+
+
+def test_fewest_retries_first_then_fifo():
+    queue = FairTaskQueue(fairness_timeout=600)
+    now = time.time()
+    queue.put_nowait("a", "1", retry_count=1, enqueue_time=now)
+    queue.put_nowait("b", "2", retry_count=0, enqueue_time=now)
+    queue.put_nowait("c", "3", retry_count=0, enqueue_time=now)
+    queue.put_nowait("d", "4", retry_count=2, enqueue_time=now)
+
+    assert _drain(queue) == ["b", "c", "a", "d"]
+
+
+def test_long_waiting_tasks_jump_the_queue():
+    queue = FairTaskQueue(fairness_timeout=10)
+    now = time.time()
+    queue.put_nowait("fresh", "1", retry_count=0, enqueue_time=now)
+    queue.put_nowait("stale", "2", retry_count=3, enqueue_time=now - 60)
+    queue.put_nowait("older", "3", retry_count=5, enqueue_time=now - 120)
+
+    # Oldest over-timeout task first, then the next one, then retry order
+    assert _drain(queue) == ["older", "stale", "fresh"]
+
+
+def test_entries_popped_from_one_heap_are_skipped_in_the_other():
+    queue = FairTaskQueue(fairness_timeout=10)
+    now = time.time()
+    queue.put_nowait("a", "1", retry_count=0, enqueue_time=now - 60)
+    queue.put_nowait("b", "2", retry_count=1, enqueue_time=now)
+
+    assert queue.get_nowait()[0] == "a"
+    assert len(queue) == 1
+    assert queue.get_nowait() == ("b", "2", 1, now)
+    with pytest.raises(asyncio.QueueEmpty):
+        queue.get_nowait()
+
+
+def test_wait_stats():
+    queue = FairTaskQueue()
+    assert queue.wait_stats() == (0.0, 0.0)
+
+    queue.put_nowait("a", "1", enqueue_time=100.0)
+    queue.put_nowait("b", "2", enqueue_time=110.0)
+    assert queue.wait_stats(now=120.0) == (20.0, 15.0)
+
+    queue.get_nowait()
+    assert queue.wait_stats(now=120.0) == (10.0, 10.0)
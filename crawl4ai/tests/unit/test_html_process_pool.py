@@ -0,0 +1,86 @@
+import asyncio
+import threading
+
+import pytest
+
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.extraction_strategy import JsonCssExtractionStrategy, LLMExtractionStrategy
+from crawl4ai.process_pool import HTMLProcessPool
+
+HTML = """<html><head><title>Shop</title></head><body>
+<h1>Products</h1>
+<div class="item"><h2>Alpha</h2><span class="price">10</span></div>
+<div class="item"><h2>Beta</h2><span class="price">20</span></div>
+</body></html>"""
+
+SCHEMA = {
+    "name": "items",
+    "baseSelector": "div.item",
+    "fields": [{"name": "title", "selector": "h2", "type": "text"}],
+}
+
+
+def _kwargs(config):
+    return dict(
+        url="https://example.com",
+        html=HTML,
+        extracted_content=None,
+        config=config,
+        screenshot_data=None,
+        pdf_data=None,
+        verbose=False,
+    )
+
+
+@pytest.fixture
+def crawler():
+    return AsyncWebCrawler()
+
+
+@pytest.mark.asyncio
+async def test_offloaded_result_matches_in_process(crawler):
+    config = CrawlerRunConfig(extraction_strategy=JsonCssExtractionStrategy(SCHEMA))
+    pool = HTMLProcessPool(max_workers=2, max_in_flight=1)
+    try:
+        results = await asyncio.gather(*(pool.process(crawler, **_kwargs(config)) for _ in range(3)))
+    finally:
+        pool.shutdown()
+    expected = await crawler.aprocess_html(**_kwargs(config))
+
+    assert pool.stats == {"offloaded": 3, "in_process": 0}
+    for result in results:
+        assert result.cleaned_html == expected.cleaned_html
+        assert result.markdown.raw_markdown == expected.markdown.raw_markdown
+        assert result.extracted_content == expected.extracted_content
+
+
+@pytest.mark.asyncio
+async def test_unpicklable_config_stays_in_process(crawler):
+    strategy = JsonCssExtractionStrategy(SCHEMA)
+    strategy.hook = lambda item: item
+    config = CrawlerRunConfig(extraction_strategy=strategy)
+    pool = HTMLProcessPool(max_workers=1)
+
+    assert pool.payload(**_kwargs(config)) is None
+    result = await pool.process(crawler, **_kwargs(config))
+
+    assert "Alpha" in result.extracted_content
+    assert pool.stats == {"offloaded": 0, "in_process": 1}
+    assert pool._executor is None
+
+
+def test_llm_stages_are_not_offloaded():
+    config = CrawlerRunConfig(extraction_strategy=LLMExtractionStrategy(instruction="x"))
+    assert not HTMLProcessPool.should_offload(config)
+    assert HTMLProcessPool.should_offload(CrawlerRunConfig())
+
+
+def test_payload_drops_loggers_and_fetch_only_fields(crawler):
+    config = CrawlerRunConfig(shared_data={"lock": threading.Lock()})
+    config.scraping_strategy.logger = crawler.logger
+
+    assert HTMLProcessPool().payload(**_kwargs(config)) is not None
+    # The caller's config is left alone
+    assert config.scraping_strategy.logger is crawler.logger
+    assert config.shared_data
@@ -0,0 +1,70 @@
+import pytest
+
+import crawl4ai.utils as utils
+from crawl4ai.async_configs import CrawlerRunConfig
+from crawl4ai.async_webcrawler import AsyncWebCrawler
+from crawl4ai.markdown_generation_strategy import DefaultMarkdownGenerator
+from crawl4ai.models import CrawlResult
+
+HTML = "<html><head><title>T</title></head><body><h1>Title</h1><p>Body text</p><script>x()</script></body></html>"
+
+
+@pytest.fixture
+def preprocess_calls(monkeypatch):
+    calls = []
+    original = utils.preprocess_html_for_schema
+
+    def counting(*args, **kwargs):
+        calls.append(1)
+        return original(*args, **kwargs)
+
+    monkeypatch.setattr(utils, "preprocess_html_for_schema", counting)
+    monkeypatch.setattr("crawl4ai.async_webcrawler.preprocess_html_for_schema", counting)
+    return calls
+
+
+async def _process(config):
+    crawler = AsyncWebCrawler()
+    return await crawler.aprocess_html(
+        url="https://example.com",
+        html=HTML,
+        extracted_content=None,
+        config=config,
+        screenshot_data=None,
+        pdf_data=None,
+        verbose=False,
+    )
+
+
+@pytest.mark.asyncio
+async def test_fit_html_is_built_on_first_read(preprocess_calls):
+    result = await _process(CrawlerRunConfig())
+    assert preprocess_calls == []
+
+    fit_html = result.fit_html
+    assert "Title" in fit_html and "<script" not in fit_html
+    assert result.fit_html is fit_html
+    assert preprocess_calls == [1]
+
+
+@pytest.mark.asyncio
+async def test_fit_html_built_once_when_markdown_uses_it(preprocess_calls):
+    config = CrawlerRunConfig(markdown_generator=DefaultMarkdownGenerator(content_source="fit_html"))
+    result = await _process(config)
+
+    assert "Title" in result.markdown
+    assert "Title" in result.fit_html
+    assert preprocess_calls == [1]
+
+
+def test_fit_html_serialization(preprocess_calls):
+    result = CrawlResult(url="https://example.com", html=HTML, success=True)
+
+    # Not built just to be serialized
+    assert result.model_dump()["fit_html"] is None
+    assert preprocess_calls == []
+    assert "Title" in result.model_dump(include={"url", "fit_html"})["fit_html"]
+    assert "Title" in result.model_dump()["fit_html"]
+    assert "fit_html" not in result.model_dump(exclude={"fit_html"})
+    assert CrawlResult(url="u", html=HTML, success=True, fit_html="given").fit_html == "given"
+    assert CrawlResult(url="u", html="", success=True).fit_html is None
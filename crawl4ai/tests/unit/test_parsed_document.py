@@ -0,0 +1,82 @@
+from crawl4ai.content_scraping_strategy import LXMLWebScrapingStrategy
+from crawl4ai.extraction_strategy import JsonCssExtractionStrategy, JsonLxmlExtractionStrategy
+from crawl4ai.parsed_document import ParsedDocument
+from crawl4ai.utils import preprocess_html_for_schema
+
+HTML = """<html><head><title>Shop</title></head><body>
+<!-- listing -->
+<div class="item"><h2>Alpha</h2><span class="price">10</span><script>x()</script></div>
+<div class="item"><h2>Beta</h2><span class="price">20</span></div>
+</body></html>"""
+
+SCHEMA = {
+    "name": "items",
+    "baseSelector": "div.item",
+    "fields": [
+        {"name": "title", "selector": "h2", "type": "text"},
+        {"name": "price", "selector": ".price", "type": "text"},
+    ],
+}
+
+
+def test_private_parse_when_not_shared():
+    document = ParsedDocument(HTML)
+    first, second = document.lxml_copy(), document.lxml_copy()
+
+    assert first is not second
+    assert document.parse_count == 2
+
+
+def test_shared_parse_is_copied_for_mutating_stages():
+    document = ParsedDocument(HTML, share=True)
+    copy = document.lxml_copy()
+    for script in copy.xpath("//script"):
+        script.getparent().remove(script)
+
+    assert document.lxml_tree().xpath("//script")
+    assert document.parse_count == 1
+
+
+def test_stages_share_one_parse():
+    document = ParsedDocument(HTML, share=True)
+
+    scraped = LXMLWebScrapingStrategy().scrap("https://example.com", HTML, document=document)
+    fit_html = preprocess_html_for_schema(HTML, document=document)
+    items = JsonLxmlExtractionStrategy(SCHEMA).run("https://example.com", [HTML], document=document)
+
+    assert document.parse_count == 1
+    assert "Alpha" in scraped.cleaned_html and "<script" not in scraped.cleaned_html
+    assert "<!--" not in fit_html and "<head" not in fit_html
+    assert items == [{"title": "Alpha", "price": "10"}, {"title": "Beta", "price": "20"}]
+    # Mutating stages worked on copies
+    assert document.lxml_tree().xpath("//script")
+
+
+def test_soup_is_parsed_once():
+    document = ParsedDocument(HTML)
+    strategy = JsonCssExtractionStrategy(SCHEMA)
+
+    first = strategy.run("https://example.com", [HTML], document=document)
+    second = strategy.run("https://example.com", [HTML], document=document)
+
+    assert first == second == [{"title": "Alpha", "price": "10"}, {"title": "Beta", "price": "20"}]
+    assert document.parse_count == 1
+
+
+def test_document_for_other_html_is_ignored():
+    document = ParsedDocument("<html><body><div class='item'><h2>Other</h2></div></body></html>")
+
+    items = JsonLxmlExtractionStrategy(SCHEMA).run("https://example.com", [HTML], document=document)
+
+    assert [item["title"] for item in items] == ["Alpha", "Beta"]
+    assert document.parse_count == 0
+
+
+def test_fit_html_from_shared_tree_matches_private_parse():
+    html = (
+        "<html><body><p>Hello <!-- c --> world and more</p>"
+        "<div>\n  <span>a</span> <span>b</span>\n</div></body></html>"
+    )
+    document = ParsedDocument(html, share=True)
+
+    assert preprocess_html_for_schema(html, document=document) == preprocess_html_for_schema(html)
@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from crawl4ai.async_dispatcher import RateLimiter
+from crawl4ai.utils import RobotsParser
+
+RULES = "User-agent: *\nDisallow: /private\nCrawl-delay: 4\n"
+
+
+@pytest.fixture
+def robots(tmp_path, monkeypatch):
+    parser = RobotsParser(cache_dir=str(tmp_path), max_cached_domains=2)
+    fetched = []
+
+    async def fake_fetch(robots_url):
+        fetched.append(robots_url)
+        await asyncio.sleep(0.01)
+        return RULES
+
+    monkeypatch.setattr(parser, "_fetch_rules", fake_fetch)
+    parser.fetched = fetched
+    yield parser
+    asyncio.run(parser.close())
+
+
+@pytest.mark.asyncio
+async def test_concurrent_checks_share_one_fetch(robots):
+    urls = [f"https://a.com/private/{i}" for i in range(5)] + ["https://a.com/public"]
+    allowed = await asyncio.gather(*(robots.can_fetch(url) for url in urls))
+
+    assert allowed == [False] * 5 + [True]
+    assert robots.fetched == ["https://a.com/robots.txt"]
+    assert await robots.can_fetch("https://a.com/private/x") is False
+    assert len(robots.fetched) == 1
+
+
+@pytest.mark.asyncio
+async def test_lru_falls_back_to_database(robots):
+    for domain in ("a.com", "b.com", "c.com"):
+        await robots.can_fetch(f"https://{domain}/")
+    assert list(robots._parsers) == ["b.com", "c.com"]
+
+    # Evicted from memory, still fresh on disk
+    assert await robots.can_fetch("https://a.com/private") is False
+    assert len(robots.fetched) == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_fetch_allows_and_is_not_persisted(robots, monkeypatch):
+    async def failing(robots_url):
+        return None
+
+    monkeypatch.setattr(robots, "_fetch_rules", failing)
+    assert await robots.can_fetch("https://down.com/private") is True
+    assert robots._get_cached_rules("down.com") == (None, False)
+
+
+@pytest.mark.asyncio
+async def test_crawl_delay_reaches_rate_limiter(robots):
+    assert await robots.crawl_delay("https://a.com/") == 4.0
+
+    limiter = RateLimiter(base_delay=(0, 0), max_delay=3)
+    limiter.set_crawl_delay("https://a.com/x", 4.0)
+    assert limiter.domains["a.com"].min_delay == 3
+
+    limiter = RateLimiter(base_delay=(0, 0))
+    limiter.set_crawl_delay("https://a.com/x", 0.05)
+    loop = asyncio.get_running_loop()
+    await limiter.wait_if_needed("https://a.com/1")
+    start = loop.time()
+    await limiter.wait_if_needed("https://a.com/2")
+    assert loop.time() - start >= 0.04
+
+
+@pytest.mark.asyncio
+async def test_crawl_delay_spaces_concurrent_requests():
+    limiter = RateLimiter(base_delay=(0, 0))
+    limiter.set_crawl_delay("https://a.com/", 0.05)
+    loop = asyncio.get_running_loop()
+    times = []
+
+    async def request(i):
+        await limiter.wait_if_needed(f"https://a.com/{i}")
+        times.append(loop.time())
+
+    await asyncio.gather(*(request(i) for i in range(4)))
+
+    gaps = [later - earlier for earlier, later in zip(times, times[1:])]
+    assert all(gap >= 0.04 for gap in gaps)
+
+
+@pytest.mark.asyncio
+async def test_base_delay_still_lets_concurrent_requests_through_together():
+    limiter = RateLimiter(base_delay=(0.05, 0.05))
+    loop = asyncio.get_running_loop()
+    await limiter.wait_if_needed("https://a.com/0")
+    start = loop.time()
+
+    await asyncio.gather(*(limiter.wait_if_needed(f"https://a.com/{i}") for i in range(1, 5)))
+
+    # One shared wait, not one per request
+    assert loop.time() - start < 0.15
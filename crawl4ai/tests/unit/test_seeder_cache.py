@@ -0,0 +1,147 @@
+import asyncio
+import sqlite3
+import time
+from contextlib import asynccontextmanager
+
+import pytest
+
+from crawl4ai import async_url_seeder
+from crawl4ai.async_url_seeder import AsyncUrlSeeder, _match
+from crawl4ai.seeder_cache import SeederCache
+
+URLS = [
+    "https://example.com/blog/a",
+    "https://www.example.com/blog/b",
+    "http://example.com/shop/c",
+    "https://example.com/blog/d?x=1",
+]
+
+
+@pytest.fixture
+def cache(tmp_path):
+    cache = SeederCache(tmp_path / "seeder.db", ttl=60)
+    yield cache
+    cache.close()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_gets_share_one_query(cache, monkeypatch):
+    cache.set_many("head", [(u, {"url": u, "status": "valid"}) for u in URLS[:2]])
+    calls = []
+    original = cache.get_many
+
+    def counting(kind, urls):
+        calls.append(sorted(urls))
+        return original(kind, urls)
+
+    monkeypatch.setattr(cache, "get_many", counting)
+    results = await asyncio.gather(*(cache.get("head", u) for u in URLS))
+
+    assert [r and r["url"] for r in results] == URLS[:2] + [None, None]
+    assert calls == [sorted(URLS)]
+
+
+def test_buffered_writes_are_visible_and_flushed(cache, tmp_path):
+    cache.put("live", URLS[0], {"status": "valid"})
+    assert cache.get_many("live", [URLS[0]]) == {URLS[0]: {"status": "valid"}}
+
+    cache.flush()
+    reopened = SeederCache(tmp_path / "seeder.db", ttl=60)
+    assert reopened.get_many("live", URLS) == {URLS[0]: {"status": "valid"}}
+    reopened.ttl = 0
+    time.sleep(0.01)
+    assert reopened.get_many("live", URLS) == {}
+    assert reopened.purge_expired() == 1
+    reopened.close()
+
+
+@pytest.mark.parametrize("pattern", ["*", "*/blog/*", "example.com/*", "*[!d]", "http://*"])
+def test_list_pattern_queries_match_seeder_matching(cache, pattern):
+    cache.start_list("sitemap:example.com")
+    cache.extend_list("sitemap:example.com", URLS)
+    assert not cache.has_list("sitemap:example.com")
+    cache.finish_list("sitemap:example.com")
+
+    assert cache.has_list("sitemap:example.com")
+    assert list(cache.iter_list("sitemap:example.com", pattern)) == [
+        u for u in URLS if _match(u, pattern)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sitemap_list_is_reused_across_patterns(tmp_path, monkeypatch):
+    seeder = AsyncUrlSeeder(cache_root=tmp_path)
+    fetched = []
+
+    async def resolve(url):
+        return url if url == "https://example.com/sitemap.xml" else None
+
+    async def iter_sitemap(url, pattern=None):
+        fetched.append(url)
+        for u in URLS:
+            yield u
+
+    monkeypatch.setattr(seeder, "_resolve_head", resolve)
+    monkeypatch.setattr(seeder, "_iter_sitemap", iter_sitemap)
+
+    first = [u async for u in seeder._from_sitemaps("example.com", "*/blog/*")]
+    second = [u async for u in seeder._from_sitemaps("example.com", "*/shop/*")]
+    await seeder.close()
+
+    assert first == [URLS[0], URLS[1], URLS[3]]
+    assert second == [URLS[2]]
+    assert fetched == ["https://example.com/sitemap.xml"]
+
+
+class _SitemapResponse:
+    url = "https://example.com/sitemap.xml"
+
+    def raise_for_status(self):
+        return None
+
+    async def aiter_bytes(self):
+        yield ("<urlset>" + "".join(
+            f"<url><loc>https://example.com/blog/{i}</loc></url>" for i in range(100)
+        ) + "</urlset>").encode()
+
+
+class _SitemapClient:
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        yield _SitemapResponse()
+
+
+@pytest.mark.asyncio
+async def test_cut_off_sitemap_listing_closes_and_is_not_cached(tmp_path, monkeypatch):
+    monkeypatch.setattr(async_url_seeder, "SITEMAP_QUEUE_SIZE", 5)
+    seeder = AsyncUrlSeeder(cache_root=tmp_path, client=_SitemapClient())
+
+    async def resolve(url):
+        return url if url == "https://example.com/sitemap.xml" else None
+
+    monkeypatch.setattr(seeder, "_resolve_head", resolve)
+
+    stream = seeder._from_sitemaps("example.com", "*")
+    first = await stream.__anext__()
+    await asyncio.sleep(0.05)
+    await asyncio.wait_for(stream.aclose(), timeout=2)
+
+    assert first == "https://example.com/blog/0"
+    assert not seeder.cache.has_list("sitemap:example.com")
+
+    cache = seeder.cache
+    await seeder.close()
+    with pytest.raises(sqlite3.ProgrammingError):
+        cache.has_list("sitemap:example.com")
+
+
+@pytest.mark.asyncio
+async def test_cache_is_opened_on_first_use(tmp_path):
+    seeder = AsyncUrlSeeder(cache_root=tmp_path)
+    await seeder.close()
+    assert not (tmp_path / "seeder.db").exists()
+
+    seeder = AsyncUrlSeeder(cache_root=tmp_path)
+    assert not seeder.cache.has_list("sitemap:example.com")
+    await seeder.close()
+    assert (tmp_path / "seeder.db").exists()
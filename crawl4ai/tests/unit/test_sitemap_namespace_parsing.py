@@ -1,4 +1,7 @@
+import asyncio
+import gzip
 import sys
+from contextlib import asynccontextmanager
 from types import SimpleNamespace
 
 import pytest
@@ -15,14 +18,16 @@ class _FakeBM25:
 
 sys.modules.setdefault("rank_bm25", SimpleNamespace(BM25Okapi=_FakeBM25))
 
+from crawl4ai import async_url_seeder
 from crawl4ai.async_url_seeder import AsyncUrlSeeder
 
 
 class DummyResponse:
-    def __init__(self, request_url: str, text: str):
+    def __init__(self, request_url: str, payload, chunk_size: int = 16):
         self.status_code = 200
-        self._content = text.encode("utf-8")
+        self._content = payload.encode("utf-8") if isinstance(payload, str) else payload
         self.url = request_url
+        self._chunk_size = chunk_size
 
     def raise_for_status(self):
         return None
@@ -35,17 +40,30 @@ class DummyResponse:
     def text(self):
         return self._content.decode("utf-8")
 
+    async def aiter_bytes(self):
+        for i in range(0, len(self._content), self._chunk_size):
+            yield self._content[i:i + self._chunk_size]
+
 
 class DummyAsyncClient:
     def __init__(self, response_map):
         self._responses = response_map
+        self.requested = []
 
-    async def get(self, url, **kwargs):
+    def _response(self, url):
+        self.requested.append(url)
         payload = self._responses[url]
         if callable(payload):
             payload = payload()
         return DummyResponse(url, payload)
 
+    async def get(self, url, **kwargs):
+        return self._response(url)
+
+    @asynccontextmanager
+    async def stream(self, method, url, **kwargs):
+        yield self._response(url)
+
 
 @pytest.mark.asyncio
 async def test_iter_sitemap_handles_namespace_less_sitemaps():
@@ -132,3 +150,64 @@ async def test_iter_sitemap_normalizes_relative_locations():
         "https://example.com/relative-path",
         "https://example.com/absolute",
     ]
+
+
+@pytest.mark.asyncio
+async def test_iter_sitemap_streams_gzip():
+    body = "<urlset>" + "".join(
+        f"<url><loc>https://example.com/{kind}/{i}</loc></url>"
+        for i in range(200) for kind in ("blog", "shop")
+    ) + "</urlset>"
+    index_xml = """<sitemapindex>
+        <sitemap><loc>https://example.com/pages.xml.gz</loc></sitemap>
+        <sitemap><loc>https://example.com/index.xml</loc></sitemap>
+    </sitemapindex>"""
+    client = DummyAsyncClient({
+        "https://example.com/index.xml": index_xml,
+        "https://example.com/pages.xml.gz": gzip.compress(body.encode()),
+    })
+    seeder = AsyncUrlSeeder(client=client)
+
+    urls = [u async for u in seeder._iter_sitemap("https://example.com/index.xml")]
+
+    assert len(urls) == 400
+    assert [u for u in urls if "/blog/" in u] == [f"https://example.com/blog/{i}" for i in range(200)]
+    # The index listing itself is not fetched twice
+    assert client.requested == ["https://example.com/index.xml", "https://example.com/pages.xml.gz"]
+
+
+@pytest.mark.asyncio
+async def test_iter_sitemap_stops_fetching_when_consumer_stops():
+    child = "<urlset>" + "".join(
+        f"<url><loc>https://example.com/p{i}</loc></url>" for i in range(50)
+    ) + "</urlset>"
+    responses = {"https://example.com/index.xml": "<sitemapindex>" + "".join(
+        f"<sitemap><loc>https://example.com/c{i}.xml</loc></sitemap>" for i in range(20)
+    ) + "</sitemapindex>"}
+    responses.update({f"https://example.com/c{i}.xml": child for i in range(20)})
+    seeder = AsyncUrlSeeder(client=DummyAsyncClient(responses))
+
+    gen = seeder._iter_sitemap("https://example.com/index.xml")
+    first = await gen.__anext__()
+    await gen.aclose()
+
+    assert first.startswith("https://example.com/p")
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
+
+
+@pytest.mark.asyncio
+async def test_iter_sitemap_closes_while_queue_is_full(monkeypatch):
+    monkeypatch.setattr(async_url_seeder, "SITEMAP_QUEUE_SIZE", 5)
+    xml = "<urlset>" + "".join(
+        f"<url><loc>https://example.com/p{i}</loc></url>" for i in range(100)
+    ) + "</urlset>"
+    seeder = AsyncUrlSeeder(client=DummyAsyncClient({"https://example.com/sitemap.xml": xml}))
+
+    gen = seeder._iter_sitemap("https://example.com/sitemap.xml")
+    first = await gen.__anext__()
+    # Let the pump fill the queue and block on put
+    await asyncio.sleep(0.05)
+    await asyncio.wait_for(gen.aclose(), timeout=2)
+
+    assert first == "https://example.com/p0"
+    assert all(task.done() for task in asyncio.all_tasks() if task is not asyncio.current_task())
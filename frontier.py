@@ -0,0 +1,190 @@
+import json
+import logging
+import sqlite3
+import time
+
+# Ad states
+DISCOVERED = "discovered"
+FETCHED = "fetched"
+PHONE_REVEALED = "phone_revealed"
+FAILED = "failed"
+
+# Listing changes between runs
+NEW = "new"
+PRICE_CHANGED = "price_changed"
+CHANGED = "changed"
+UNCHANGED = "unchanged"
+REMOVED = "removed"
+
+# Search-card fields compared between runs
+SUMMARY_FIELDS = ("url", "title", "price", "mileage", "updated")
+
+
+class CrawlFrontier:
+    """Durable per-ad crawl state in SQLite, keyed by ad ID"""
+
+    def __init__(self, path="frontier.db", freshness_hours=24, max_attempts=3):
+        self.path = path
+        self.freshness = freshness_hours * 3600
+        self.max_attempts = max_attempts
+
+        self._conn = sqlite3.connect(path)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS ads (
+                ad_id TEXT PRIMARY KEY,
+                url TEXT NOT NULL,
+                state TEXT NOT NULL,
+                attempts INTEGER NOT NULL DEFAULT 0,
+                error TEXT,
+                discovered_at REAL NOT NULL,
+                updated_at REAL NOT NULL
+            )
+        """)
+        self._conn.execute("CREATE INDEX IF NOT EXISTS idx_ads_state ON ads (state)")
+        # Last search-card summary per search, for incremental runs
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS listings (
+                search_key TEXT NOT NULL,
+                ad_id TEXT NOT NULL,
+                url TEXT,
+                title TEXT,
+                price TEXT,
+                mileage TEXT,
+                updated TEXT,
+                last_seen REAL NOT NULL,
+                PRIMARY KEY (search_key, ad_id)
+            )
+        """)
+        # Change found in the search, kept until the ad is scraped
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS changes (
+                ad_id TEXT PRIMARY KEY,
+                search_key TEXT NOT NULL,
+                change TEXT NOT NULL,
+                summary TEXT NOT NULL,
+                previous TEXT
+            )
+        """)
+        self._conn.commit()
+
+    def is_due(self, ad_id):
+        """True unless the ad was scraped (or gave up) within the freshness window"""
+        row = self._conn.execute(
+            "SELECT state, attempts, updated_at FROM ads WHERE ad_id = ?", (ad_id,)
+        ).fetchone()
+        if row is None:
+            return True
+
+        state, attempts, updated_at = row
+        if time.time() - updated_at >= self.freshness:
+            return True
+        if state in (FETCHED, PHONE_REVEALED):
+            return False
+        return not (state == FAILED and attempts >= self.max_attempts)
+
+    def discover(self, ad_id, url):
+        """Record an ad as queued for scraping"""
+        now = time.time()
+        self._conn.execute(
+            "INSERT INTO ads (ad_id, url, state, discovered_at, updated_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT (ad_id) DO UPDATE SET url = excluded.url, "
+            "state = CASE WHEN state = ? THEN state ELSE ? END",
+            (ad_id, url, DISCOVERED, now, now, FAILED, DISCOVERED),
+        )
+        self._conn.commit()
+
+    def mark(self, ad_id, state, error=None):
+        """Move an ad to a new state"""
+        attempts = 1 if state == FAILED else 0
+        self._conn.execute(
+            "UPDATE ads SET state = ?, error = ?, updated_at = ?, "
+            "attempts = CASE WHEN ? THEN attempts + 1 ELSE 0 END WHERE ad_id = ?",
+            (state, error, time.time(), attempts, ad_id),
+        )
+        self._conn.commit()
+
+    def pending(self):
+        """URLs left unfinished by earlier runs"""
+        rows = self._conn.execute(
+            "SELECT url FROM ads WHERE state = ? OR (state = ? AND attempts < ?) ORDER BY discovered_at",
+            (DISCOVERED, FAILED, self.max_attempts),
+        ).fetchall()
+        return [r[0] for r in rows]
+
+    def compare_listing(self, search_key, summary):
+        """Change type of a search card vs the stored one, and the stored one"""
+        row = self._conn.execute(
+            f"SELECT {', '.join(SUMMARY_FIELDS)} FROM listings WHERE search_key = ? AND ad_id = ?",
+            (search_key, summary["id"]),
+        ).fetchone()
+        if row is None:
+            return NEW, None
+
+        previous = dict(zip(SUMMARY_FIELDS, row))
+        current = {f: str(summary.get(f) or "") for f in SUMMARY_FIELDS}
+        if current["price"] != previous["price"]:
+            return PRICE_CHANGED, previous
+        if current["mileage"] != previous["mileage"] or current["updated"] != previous["updated"]:
+            return CHANGED, previous
+        return UNCHANGED, previous
+
+    def touch_listings(self, search_key, ad_ids):
+        """Mark stored listings as still present in the search"""
+        now = time.time()
+        self._conn.executemany(
+            "UPDATE listings SET last_seen = ? WHERE search_key = ? AND ad_id = ?",
+            [(now, search_key, ad_id) for ad_id in ad_ids],
+        )
+        self._conn.commit()
+
+    def record_change(self, search_key, change, summary, previous=None):
+        """Remember a listing's change until its ad is scraped"""
+        self._conn.execute(
+            "INSERT OR REPLACE INTO changes (ad_id, search_key, change, summary, previous) VALUES (?, ?, ?, ?, ?)",
+            (summary["id"], search_key, change, json.dumps(summary), json.dumps(previous) if previous else None),
+        )
+        self._conn.commit()
+
+    def pop_change(self, ad_id):
+        """Drop and return (search_key, change, summary, previous) for an ad, or None"""
+        row = self._conn.execute(
+            "SELECT search_key, change, summary, previous FROM changes WHERE ad_id = ?", (ad_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        self._conn.execute("DELETE FROM changes WHERE ad_id = ?", (ad_id,))
+        self._conn.commit()
+        search_key, change, summary, previous = row
+        return search_key, change, json.loads(summary), json.loads(previous) if previous else None
+
+    def save_listing(self, search_key, summary):
+        """Store a search card as the baseline for the next run"""
+        values = [str(summary.get(f) or "") for f in SUMMARY_FIELDS]
+        self._conn.execute(
+            f"INSERT OR REPLACE INTO listings (search_key, ad_id, {', '.join(SUMMARY_FIELDS)}, last_seen) "
+            f"VALUES (?, ?, {', '.join('?' * len(SUMMARY_FIELDS))}, ?)",
+            (search_key, summary["id"], *values, time.time()),
+        )
+        self._conn.commit()
+
+    def pop_removed(self, search_key, since):
+        """Drop and return listings of a search not seen since a timestamp"""
+        rows = self._conn.execute(
+            f"SELECT ad_id, {', '.join(SUMMARY_FIELDS)} FROM listings WHERE search_key = ? AND last_seen < ?",
+            (search_key, since),
+        ).fetchall()
+        self._conn.execute("DELETE FROM listings WHERE search_key = ? AND last_seen < ?", (search_key, since))
+        self._conn.commit()
+        return [dict(zip(("id",) + SUMMARY_FIELDS, row)) for row in rows]
+
+    def counts(self):
+        """Number of ads per state"""
+        return dict(self._conn.execute("SELECT state, COUNT(*) FROM ads GROUP BY state").fetchall())
+
+    def close(self):
+        """Close the database"""
+        if self._conn:
+            self._conn.close()
+            self._conn = None
+            logging.info(f"Frontier closed ({self.path})")
@@ -3,8 +3,11 @@ import time
 import logging
 import re
 import asyncio
+from urllib.parse import urlparse, urlsplit, urlunsplit, parse_qsl, urlencode
 from bs4 import BeautifulSoup
-from browser_client import BrowserClient
+from browser_client import BrowserClient, phone_from_payload
+from ad_writer import AdWriter, normalize_ad, order_fields
+from frontier import CrawlFrontier, PHONE_REVEALED, FETCHED, FAILED, NEW, PRICE_CHANGED, UNCHANGED, REMOVED
 
 logging.basicConfig(
     level=logging.INFO,
@@ -15,13 +18,92 @@ logging.basicConfig(
     ]
 )
 
+def extract_next_data(html):
+    """Slice and parse the __NEXT_DATA__ JSON from raw HTML"""
+    marker = html.find('id="__NEXT_DATA__"')
+    if marker == -1:
+        return None
+    start = html.find('>', marker) + 1
+    end = html.find('</script>', start)
+    if start == 0 or end == -1:
+        return None
+    try:
+        return json.loads(html[start:end])
+    except json.JSONDecodeError as e:
+        logging.error(f"Failed to parse __NEXT_DATA__: {e}")
+        return None
+
+
+def find_listings(payload):
+    """Listing dicts and paging info from a search JSON payload"""
+    if not isinstance(payload, dict):
+        return [], {}
+    for key in ('ads', 'listings', 'results'):
+        value = payload.get(key)
+        if isinstance(value, list) and value and isinstance(value[0], dict):
+            return value, payload.get('paging') or {}
+    # Search results are sometimes nested one level down
+    for key in ('searchResults', 'search', 'data'):
+        listings, paging = find_listings(payload.get(key))
+        if listings:
+            return listings, paging
+    return [], {}
+
+
+def with_start(url, start=None):
+    """Set (or drop, if start is None) the start= offset on a search URL"""
+    parts = urlsplit(url)
+    query = [(k, v) for k, v in parse_qsl(parts.query) if k != 'start']
+    if start is not None:
+        query.append(('start', str(start)))
+    return urlunsplit(parts._replace(query=urlencode(query)))
+
+
+class DomainThrottle:
+    """Per-domain politeness budget"""
+
+    def __init__(self, min_interval=1.0):
+        self.min_interval = min_interval
+        self._next_slot = {}
+
+    async def wait(self, url):
+        """Wait for the next request slot on the url's domain"""
+        domain = urlparse(url).netloc
+        now = time.monotonic()
+        slot = max(now, self._next_slot.get(domain, 0))
+        # Reserve slot before sleeping so concurrent workers queue up behind it
+        self._next_slot[domain] = slot + self.min_interval
+        if slot > now:
+            await asyncio.sleep(slot - now)
+
+
 class DoneDealScraper:
-    def __init__(self, cookies_path="latest_cookies.json", headless=True):
+    def __init__(self, cookies_path="latest_cookies.json", headless=True, concurrency=4, politeness_delay=1.0, search_mode="json",
+                 output_path="donedeal_cars.csv", parquet=False, frontier_path="frontier.db", freshness_hours=24,
+                 resume=True, incremental=False, delta_path="donedeal_delta.csv"):
         self.browser = None
         self.headless = headless
         self.cookies_path = cookies_path
         self.cookies = self._load_cookies(cookies_path)
         self.base_url = "https://www.donedeal.ie"
+        self.concurrency = concurrency
+        self.throttle = DomainThrottle(politeness_delay)
+        # "json" pages through the search payload, "html" renders every results page
+        self.search_mode = search_mode
+        self.output_path = output_path
+        self.parquet = parquet
+        self._writer = None
+        # Crawl state survives crashes; ads scraped within freshness_hours are skipped
+        self.frontier_path = frontier_path
+        self.freshness_hours = freshness_hours
+        self.resume = resume
+        self.frontier = None
+        self._queued_ids = set()
+        # Incremental runs only fetch new/changed listings and write a delta
+        self.incremental = incremental
+        self.delta_path = delta_path
+        self._search_key = None
+        self._search_complete = False
         self._loop = None
 
     def _load_cookies(self, path):
@@ -42,7 +124,7 @@ class DoneDealScraper:
     async def _ensure_browser(self):
         """Init browser"""
         if self.browser is None:
-            self.browser = BrowserClient(headless=self.headless)
+            self.browser = BrowserClient(headless=self.headless, cookies=self.cookies)
             await self.browser._ensure_browser()
     
     async def _close_browser(self):
@@ -51,6 +133,16 @@ class DoneDealScraper:
             await self.browser.close()
             self.browser = None
     
+    def _run_with_browser(self, coro):
+        """Run a coroutine on a fresh event loop, closing any browser it starts"""
+        async def run():
+            try:
+                return await coro
+            finally:
+                # Playwright objects are bound to this loop; the next call gets a new one
+                await self._close_browser()
+        return asyncio.run(run())
+    
     def get_ad_id_from_url(self, url):
         # Extract ID from URL
         match = re.search(r'/(\d+)$', url)
@@ -65,137 +157,323 @@ class DoneDealScraper:
     
     async def _scrape_search_results_async(self, start_url, max_pages=1, max_ads=None):
         all_ads = []
+        queue = asyncio.Queue(maxsize=self.concurrency * 2)
+        if self.incremental:
+            # Each incremental run writes a fresh delta
+            self._writer = AdWriter(self.delta_path, parquet=self.parquet, append=False)
+        else:
+            self._writer = AdWriter(self.output_path, parquet=self.parquet)
+        self.frontier = CrawlFrontier(self.frontier_path, self.freshness_hours)
+        self._queued_ids = set()
+        self._search_complete = False
+        run_start = time.time()
         
         try:
             await self._ensure_browser()
             
-            # Direct URLs mode
-            if isinstance(start_url, list):
-                 urls_to_process = start_url[:max_ads] if max_ads else start_url
-                 logging.info(f"Processing {len(urls_to_process)} direct URLs...")
-                 for i, ad_url in enumerate(urls_to_process):
-                     logging.info(f"[{i+1}/{len(urls_to_process)}] Processing: {ad_url}")
-                     ad_data = await self._scrape_ad_async(ad_url)
-                     if ad_data:
-                        all_ads.append(ad_data)
-                        self.save_to_csv([ad_data], "donedeal_cars.csv", append=True)
-                 return all_ads
-
-            current_url = start_url
+            # Ad pages share the one browser context
+            workers = [
+                asyncio.create_task(self._ad_worker(queue, all_ads))
+                for _ in range(self.concurrency)
+            ]
             
-            for page in range(1, max_pages + 1):
-                logging.info(f"Scraping search page {page}: {current_url}")
-                html_content = await self.browser.fetch_html(current_url)
+            try:
+                # Unfinished ads from an interrupted run go first
+                if self.resume:
+                    pending = self.frontier.pending()
+                    if pending:
+                        logging.info(f"Resuming {len(pending)} unfinished ads from {self.frontier_path}")
+                        await self._queue_ads(queue, pending, max_ads, default_limit=None)
                 
-                if not html_content:
-                    logging.error("Failed to retrieve search page content.")
+                # Direct URLs mode
+                if isinstance(start_url, list):
+                    logging.info(f"Processing {len(start_url)} direct URLs with {self.concurrency} workers...")
+                    await self._queue_ads(queue, start_url, max_ads, default_limit=None)
+                else:
+                    self._search_key = with_start(start_url)
+                    await self._feed_search_pages(start_url, queue, max_pages, max_ads)
+                
+                await queue.join()
+            finally:
+                for worker in workers:
+                    worker.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+            
+            if self.incremental and not isinstance(start_url, list):
+                self._emit_removed(run_start, all_ads)
+            
+            return all_ads
+            
+        finally:
+            try:
+                self._writer.close()
+            finally:
+                self._writer = None
+                logging.info(f"Frontier state: {self.frontier.counts()}")
+                self.frontier.close()
+                await self._close_browser()
+
+    async def _ad_worker(self, queue, all_ads):
+        """Scrape ads from the queue until cancelled"""
+        while True:
+            ad_url = await queue.get()
+            ad_id = self.get_ad_id_from_url(ad_url)
+            try:
+                await self.throttle.wait(ad_url)
+                ad_data = await self._scrape_ad_async(ad_url)
+                if ad_data:
+                    if self.incremental:
+                        ad_data = self._delta_row(ad_id, ad_data)
+                    all_ads.append(ad_data)
+                    self._writer.write(ad_data)
+                    revealed = ad_data.get("phone") not in ("Hidden", "Error", None)
+                    self.frontier.mark(ad_id, PHONE_REVEALED if revealed else FETCHED)
+                else:
+                    self.frontier.mark(ad_id, FAILED, "no html")
+            except Exception as e:
+                logging.error(f"Worker failed on {ad_url}: {e}")
+                self.frontier.mark(ad_id, FAILED, str(e))
+            finally:
+                queue.task_done()
+
+    def _changed_summaries(self, summaries):
+        """Search cards that are new or changed since the last run"""
+        # Every card on the page is still listed, whether or not its ad fetch succeeds
+        self.frontier.touch_listings(self._search_key, [s["id"] for s in summaries])
+        changed = []
+        for summary in summaries:
+            change, previous = self.frontier.compare_listing(self._search_key, summary)
+            if change == UNCHANGED:
+                continue
+            self.frontier.record_change(self._search_key, change, summary, previous)
+            changed.append(summary)
+        logging.info(f"{len(changed)} of {len(summaries)} listings new or changed.")
+        return changed
+
+    def _delta_row(self, ad_id, ad_data):
+        """Tag a scraped ad with its change and store its card as the new baseline"""
+        # Resumed ads get the change recorded when their card was seen
+        search_key, change, summary, previous = self.frontier.pop_change(ad_id) or (None, NEW, None, None)
+        if summary:
+            self.frontier.save_listing(search_key, summary)
+        row = {"change": change, **ad_data}
+        if change == PRICE_CHANGED:
+            row["old_price"] = previous["price"]
+        return row
+
+    def _emit_removed(self, run_start, all_ads):
+        """Add listings that dropped out of the search to the delta"""
+        if not self._search_complete:
+            logging.info("Search was not paged to the end. Skipping removed-listing detection.")
+            return
+        removed = self.frontier.pop_removed(self._search_key, run_start)
+        for listing in removed:
+            row = {"change": REMOVED, "phone": "", **listing}
+            all_ads.append(row)
+            self._writer.write(row)
+        logging.info(f"{len(removed)} listings removed since the last run.")
+
+    async def _feed_search_pages(self, start_url, queue, max_pages=1, max_ads=None):
+        """Queue ad URLs from search results for the workers"""
+        if self.search_mode == "json":
+            if await self._feed_search_json(start_url, queue, max_pages, max_ads):
+                return
+            logging.info("No JSON search payload. Falling back to rendered search pages.")
+        await self._feed_search_html(start_url, queue, max_pages, max_ads)
+
+    def _limit_ad_links(self, ad_links, max_ads, default_limit=20):
+        """Trim a page of ad links to the max_ads budget"""
+        if max_ads:
+            remaining = max_ads - len(self._queued_ids)
+            if remaining <= 0:
+                return []
+            if len(ad_links) > remaining:
+                logging.info(f"Limiting to {remaining} ads to reach max_ads={max_ads}.")
+                return ad_links[:remaining]
+        elif default_limit and len(ad_links) > default_limit:
+            # Default limit for testing
+            logging.info(f"Limiting to first {default_limit} ads (default testing limit).")
+            return ad_links[:default_limit]
+        return ad_links
+
+    async def _queue_ads(self, queue, ad_links, max_ads, default_limit=20, force=False):
+        """Queue ads the frontier says are due (all of them if force); True once max_ads is reached"""
+        due = []
+        for ad_url in ad_links:
+            ad_id = self.get_ad_id_from_url(ad_url)
+            if not ad_id or ad_id in self._queued_ids:
+                continue
+            if not force and not self.frontier.is_due(ad_id):
+                logging.info(f"Skipping ad {ad_id}: scraped within the last {self.freshness_hours}h")
+                continue
+            due.append((ad_id, ad_url))
+        
+        for ad_id, ad_url in self._limit_ad_links(due, max_ads, default_limit):
+            self._queued_ids.add(ad_id)
+            self.frontier.discover(ad_id, ad_url)
+            await queue.put(ad_url)
+        
+        if max_ads and len(self._queued_ids) >= max_ads:
+            logging.info(f"Reached max_ads limit ({max_ads}). Stopping.")
+            return True
+        return False
+
+    def listing_summary(self, listing):
+        """Summary fields from a search listing"""
+        ad_id = str(listing.get('id', ''))
+        url = listing.get('friendlyUrl') or listing.get('url') or f"{self.base_url}/cars-for-sale/ad/{ad_id}"
+        if not url.startswith('http'):
+            url = self.base_url + url
+        
+        mileage = listing.get('mileage')
+        for info in listing.get('keyInfo') or []:
+            if not mileage and isinstance(info, str) and re.search(r'[\d,]+\s*(km|mi)\b', info):
+                mileage = info
+        
+        return {
+            "id": ad_id,
+            "url": url,
+            "title": listing.get('header') or listing.get('title', ''),
+            "price": listing.get('price', ''),
+            "mileage": mileage or '',
+            "updated": listing.get('lastUpdated') or listing.get('publishDate') or '',
+        }
+
+    async def _iter_search_json(self, start_url, max_pages=1):
+        """Yield listing summaries page by page from the search JSON payload"""
+        match = re.search(r'start=(\d+)', start_url)
+        start = int(match.group(1)) if match else 0
+        
+        for page in range(1, max_pages + 1):
+            page_url = start_url if page == 1 else with_start(start_url, start)
+            logging.info(f"Fetching search payload {page}: {page_url}")
+            await self.throttle.wait(page_url)
+            
+            # Plain document request, nothing is rendered
+            html_content = await self.browser.fetch_text(page_url)
+            data = extract_next_data(html_content) if html_content else None
+            listings, paging = find_listings((data or {}).get('props', {}).get('pageProps', {}))
+            
+            if not listings:
+                if page == 1:
+                    raise LookupError(f"No listings in search payload for {page_url}")
+                self._search_complete = True
+                break
+            
+            yield [self.listing_summary(listing) for listing in listings if listing.get('id')]
+            
+            start += len(listings)
+            total = paging.get('totalResults') or paging.get('total')
+            if total and start >= int(total):
+                self._search_complete = True
+                break
+
+    async def _feed_search_json(self, start_url, queue, max_pages=1, max_ads=None):
+        """Queue ads from the search JSON payload, False if there is none"""
+        try:
+            async for summaries in self._iter_search_json(start_url, max_pages):
+                logging.info(f"Found {len(summaries)} ads in search payload.")
+                if self.incremental:
+                    summaries = self._changed_summaries(summaries)
+                    done = await self._queue_ads(queue, [s["url"] for s in summaries], max_ads, default_limit=None, force=True)
+                else:
+                    done = await self._queue_ads(queue, [s["url"] for s in summaries], max_ads)
+                if done:
                     break
+        except LookupError as e:
+            logging.warning(str(e))
+            return False
+        return True
 
-                soup = BeautifulSoup(html_content, 'html.parser')
-                
-                # Find ad links
-                ad_links = []
-                
-                # Look for card-list
-                card_list = soup.find('ul', attrs={"data-testid": "card-list"})
-                
-                if card_list:
-                    logging.info("Found card-list structure.")
-                    list_items = card_list.find_all('li', attrs={"data-testid": re.compile(r'listing-card-index-\d+')})
-                    
-                    for li in list_items:
-                        link_tag = li.find('a', href=True)
-                        if link_tag:
-                            href = link_tag['href']
-                            # Filter non-ads
-                            if ('/cars-for-sale/' in href or '/ad/' in href or '/view/' in href):
-                                full_url = href if href.startswith('http') else self.base_url + href
-                                if full_url not in ad_links:
-                                    ad_links.append(full_url)
+    async def _feed_search_html(self, start_url, queue, max_pages=1, max_ads=None):
+        """Render search pages and queue their ad links"""
+        if self.incremental:
+            logging.warning("Rendered search pages have no card summaries. Every due ad is fetched and reported as new.")
+        current_url = start_url
+        
+        for page in range(1, max_pages + 1):
+            logging.info(f"Scraping search page {page}: {current_url}")
+            await self.throttle.wait(current_url)
+            html_content = await self.browser.fetch_html(current_url, ready="card_list")
+            
+            if not html_content:
+                logging.error("Failed to retrieve search page content.")
+                break
+
+            soup = BeautifulSoup(html_content, 'html.parser')
+            
+            # Find ad links
+            ad_links = []
+            
+            # Look for card-list
+            card_list = soup.find('ul', attrs={"data-testid": "card-list"})
+            
+            if card_list:
+                logging.info("Found card-list structure.")
+                list_items = card_list.find_all('li', attrs={"data-testid": re.compile(r'listing-card-index-\d+')})
                 
-                # Fallback: generic parsing
-                if not ad_links:
-                    logging.info("Fallback: generic parsing")
-                    for a in soup.find_all('a', href=True):
-                        href = a['href']
-                        if ('/cars/' in href or '/ad/' in href) and re.search(r'\d{7,}', href):
+                for li in list_items:
+                    link_tag = li.find('a', href=True)
+                    if link_tag:
+                        href = link_tag['href']
+                        # Filter non-ads
+                        if ('/cars-for-sale/' in href or '/ad/' in href or '/view/' in href):
                             full_url = href if href.startswith('http') else self.base_url + href
                             if full_url not in ad_links:
                                 ad_links.append(full_url)
-                
-                logging.info(f"Found {len(ad_links)} ads on page {page}.")
-                
-                # Apply max ads limit
-                if max_ads:
-                    remaining = max_ads - len(all_ads)
-                    if remaining <= 0:
-                        logging.info(f"Reached max_ads limit ({max_ads}). Stopping.")
-                        break
-                    if len(ad_links) > remaining:
-                        logging.info(f"Limiting to {remaining} ads to reach max_ads={max_ads}.")
-                        ad_links = ad_links[:remaining]
-                else:
-                    # Default limit for testing
-                    if len(ad_links) > 20:
-                        logging.info("Limiting to first 20 ads (default testing limit).")
-                        ad_links = ad_links[:20]
-
-                for ad_url in ad_links:
-                    ad_data = await self._scrape_ad_async(ad_url)
-                    if ad_data:
-                        all_ads.append(ad_data)
-                        # Save incrementally
-                        self.save_to_csv([ad_data], "donedeal_cars.csv", append=True)
-                    
-                    if max_ads and len(all_ads) >= max_ads:
-                        logging.info(f"Reached max_ads limit ({max_ads}). Stopping.")
-                        return all_ads
-                    
-                    # Delay between ads
-                    await asyncio.sleep(1) 
-
-                # Next page
-                next_button = soup.find('a', attrs={"data-testid": "next-button"}) 
-                if not next_button:
-                    next_button = soup.find('a', string=re.compile(r'Next', re.I))
-                
-                if next_button and 'href' in next_button.attrs:
-                    next_href = next_button['href']
-                    if not next_href.startswith('http'):
-                        current_url = self.base_url + next_href
-                    else:
-                        current_url = next_href
+            
+            # Fallback: generic parsing
+            if not ad_links:
+                logging.info("Fallback: generic parsing")
+                for a in soup.find_all('a', href=True):
+                    href = a['href']
+                    if ('/cars/' in href or '/ad/' in href) and re.search(r'\d{7,}', href):
+                        full_url = href if href.startswith('http') else self.base_url + href
+                        if full_url not in ad_links:
+                            ad_links.append(full_url)
+            
+            logging.info(f"Found {len(ad_links)} ads on page {page}.")
+            
+            if await self._queue_ads(queue, ad_links, max_ads):
+                break
+
+            # Next page
+            next_button = soup.find('a', attrs={"data-testid": "next-button"}) 
+            if not next_button:
+                next_button = soup.find('a', string=re.compile(r'Next', re.I))
+            
+            if next_button and 'href' in next_button.attrs:
+                next_href = next_button['href']
+                if not next_href.startswith('http'):
+                    current_url = self.base_url + next_href
                 else:
-                    # Manual pagination
-                    if "start=" in current_url:
-                        try:
-                            match = re.search(r'start=(\d+)', current_url)
-                            if match:
-                                current_start = int(match.group(1))
-                                new_start = current_start + 28
-                                current_url = re.sub(r'start=\d+', f'start={new_start}', current_url)
-                            else:
-                                break
-                        except:
+                    current_url = next_href
+            else:
+                # Manual pagination
+                if "start=" in current_url:
+                    try:
+                        match = re.search(r'start=(\d+)', current_url)
+                        if match:
+                            current_start = int(match.group(1))
+                            new_start = current_start + 28
+                            current_url = re.sub(r'start=\d+', f'start={new_start}', current_url)
+                        else:
                             break
+                    except:
+                        break
+                else:
+                    if "?" in current_url:
+                        current_url += "&start=28"
                     else:
-                        if "?" in current_url:
-                            current_url += "&start=28"
-                        else:
-                            current_url += "?start=28"
-                    
-                        if not ad_links:
-                             logging.info("No ads found on this page and no explicit next button. Stopping.")
-                             break
-            
-            return all_ads
-            
-        finally:
-            await self._close_browser()
+                        current_url += "?start=28"
+                
+                    if not ad_links:
+                         logging.info("No ads found on this page and no explicit next button. Stopping.")
+                         break
 
     def scrape_ad(self, url):
         """Sync wrapper"""
-        return asyncio.run(self._scrape_ad_async(url))
+        return self._run_with_browser(self._scrape_ad_async(url))
     
     async def _scrape_ad_async(self, url):
         logging.info(f"Scraping ad: {url}")
@@ -218,9 +496,80 @@ class DoneDealScraper:
             logging.error(f"Failed to scrape ad after {max_retries+1} attempts: {url}")
             return None
 
-        soup = BeautifulSoup(html_content, 'html.parser')
         ad_id = self.get_ad_id_from_url(url)
         
+        # Fast path: read the ad straight from __NEXT_DATA__
+        next_data = extract_next_data(html_content)
+        ad_info = (next_data or {}).get('props', {}).get('pageProps', {}).get('ad')
+        
+        if ad_info:
+            title, price, ad_details = self._parse_ad_json(ad_info)
+            phone_from_next = self._phone_from_ad_info(ad_info)
+        else:
+            logging.info("No __NEXT_DATA__ ad found. Falling back to HTML parsing.")
+            title, price, ad_details = self._parse_ad_soup(html_content)
+            phone_from_next = None
+
+        if phone_from_next:
+            phone_number = phone_from_next
+            logging.info(f"Using phone from __NEXT_DATA__: {phone_number}")
+
+        result = {
+            "id": ad_id,
+            "url": url,
+            "title": title,
+            "price": price,
+            "phone": phone_number,
+        }
+        result.update(ad_details)
+        
+        return result
+
+    def _parse_ad_json(self, ad_info):
+        """Title, price and details from __NEXT_DATA__ ad"""
+        title = ad_info.get('header') or ad_info.get('title') or "N/A"
+        
+        price = ad_info.get('price')
+        if isinstance(price, (int, float)):
+            price = f"€{price:,.0f}"
+        elif not price:
+            price = "N/A"
+        
+        # Same labels as the rendered page so save_to_csv mapping applies
+        ad_details = {}
+        for section in ('keyInfo', 'displayAttributes'):
+            for item in ad_info.get(section) or []:
+                if not isinstance(item, dict):
+                    continue
+                key = item.get('displayName') or item.get('name')
+                val = item.get('value')
+                if key and val not in (None, ""):
+                    ad_details[key] = val
+        
+        if ad_info.get('county') and 'County' not in ad_details:
+            ad_details['County'] = ad_info['county']
+        
+        return title, price, ad_details
+
+    def _phone_from_ad_info(self, ad_info):
+        """Unmasked phone from __NEXT_DATA__ ad, if any"""
+        phone = None
+        if 'phone' in ad_info:
+            phone = ad_info['phone']
+        elif 'phone' in (ad_info.get('contact') or {}):
+            phone = ad_info['contact']['phone']
+        elif 'phone' in (ad_info.get('seller') or {}):
+            phone = ad_info['seller']['phone']
+        
+        if isinstance(phone, str) and phone and "Hidden" not in phone and "***" not in phone:
+            logging.info(f"Found phone in __NEXT_DATA__: {phone}")
+            return phone
+        return None
+
+    def _parse_ad_soup(self, html_content):
+        """Title, price and details from rendered HTML (slow fallback)"""
+        soup = BeautifulSoup(html_content, 'html.parser')
+        
         # Title
         title_elem = soup.find('h1')
         title = title_elem.get_text(strip=True) if title_elem else "N/A"
@@ -256,102 +605,31 @@ class DoneDealScraper:
                 val = divs[1].get_text(strip=True)
                 ad_details[key] = val
 
-        # Check __NEXT_DATA__ for phone
-        phone_from_next = None
-        script_data = soup.find('script', id='__NEXT_DATA__')
-        if script_data:
-             try:
-                 data = json.loads(script_data.string)
-                 ad_info = data.get('props', {}).get('pageProps', {}).get('ad', {})
-                 
-                 if 'phone' in ad_info:
-                     phone_from_next = ad_info['phone']
-                 elif 'contact' in ad_info and 'phone' in ad_info['contact']:
-                     phone_from_next = ad_info['contact']['phone']
-                 elif 'seller' in ad_info and 'phone' in ad_info['seller']:
-                     phone_from_next = ad_info['seller']['phone']
-                 
-                 if phone_from_next and "Hidden" not in phone_from_next and "***" not in phone_from_next:
-                     logging.info(f"Found phone in __NEXT_DATA__: {phone_from_next}")
-                 else:
-                     phone_from_next = None
-             except Exception as e:
-                 logging.error(f"Failed to parse __NEXT_DATA__: {e}")
-
-        if phone_from_next:
-            phone_number = phone_from_next
-            logging.info(f"Using phone from __NEXT_DATA__: {phone_number}")
-
-        result = {
-            "id": ad_id,
-            "url": url,
-            "title": title,
-            "price": price,
-            "phone": phone_number,
-        }
-        result.update(ad_details)
-        
-        return result
+        return title, price, ad_details
 
     def get_phone_number(self, ad_id, soup=None):
+        """Sync wrapper"""
+        return self._run_with_browser(self._get_phone_number_async(ad_id))
+
+    async def _get_phone_number_async(self, ad_id):
+        """Phone from the contact API, requested inside the warm browser session"""
         api_url = f"https://www.donedeal.ie/search/api/v4/view/ad/{ad_id}/contact"
         
         logging.info(f"Fetching phone for ID {ad_id}...")
         
-        # Try raw request
-        response_content = self.client.scrape(api_url, cookies=self.cookies, render=None)
+        await self._ensure_browser()
+        response_content = await self.browser.fetch_text(api_url)
         
-        is_blocked = False
-        if response_content and isinstance(response_content, str):
-            if "<!DOCTYPE" in response_content or "<html" in response_content:
-                is_blocked = True
-                logging.warning(f"Phone API blocked. Retrying with render='html'...")
-
-        # Try rendered request
-        if is_blocked or not response_content:
-             response_content = self.client.scrape(api_url, cookies=self.cookies, render="html")
-
-        # Try POST fallback
-        is_failed = False
         if not response_content:
-            is_failed = True
-        elif isinstance(response_content, str) and ("<!DOCTYPE" in response_content or "<html" in response_content):
-            is_failed = True
-            
-        if is_failed:
-            logging.warning(f"GET failed. Retrying with POST to /listing/contact/phone...")
-            post_url = "https://www.donedeal.ie/listing/contact/phone"
-            post_payload = {"adId": int(ad_id)}
-            response_content = self.client.scrape(post_url, method="POST", payload=post_payload, cookies=self.cookies, render=None)
-
-        if response_content:
-            try:
-                text = response_content
-                # Clean HTML wrapper
-                if isinstance(text, str):
-                    if "<body>" in text:
-                        s = BeautifulSoup(text, 'html.parser')
-                        pre = s.find('pre')
-                        if pre:
-                            text = pre.get_text(strip=True)
-                        else:
-                            text = s.get_text(strip=True)
-                
-                if isinstance(text, str):
-                    text = text.strip()
-                    data = json.loads(text)
-                else:
-                    data = text 
-                
-                if isinstance(data, dict):
-                    return data.get("phoneNumber", "Not Found")
-                
-            except Exception as e:
-                logging.error(f"Failed to parse phone API response: {e}")
-                if response_content and isinstance(response_content, str):
-                     logging.error(f"Response preview: {response_content[:200]}")
-                return "Error"
-        return "Failed"
+            return "Failed"
+        
+        try:
+            phone = phone_from_payload(json.loads(response_content))
+            return phone or "Not Found"
+        except json.JSONDecodeError as e:
+            logging.error(f"Failed to parse phone API response: {e}")
+            logging.error(f"Response preview: {response_content[:200]}")
+            return "Error"
 
 
     def save_to_csv(self, ads, filename, append=False):
@@ -360,79 +638,13 @@ class DoneDealScraper:
         if not ads:
             return
 
-        # Standard column order
-        standard_fields = [
-            "id",
-            "url",
-            "phone",
-            "title",
-            "price",
-            "year",
-            "make",
-            "model",
-            "mileage",
-            "fuel_type",
-            "transmission",
-            "engine_size",
-            "body_type",
-            "colour",
-            "nct_expiry",
-            "county",
-            "seller_type",
-            "doors",
-            "seats",
-            "horsepower",
-            "engine_description",
-            "trim",
-        ]
-        
-        # Field mapping
-        field_mapping = {
-            "Make": "make",
-            "Model": "model",
-            "Year": "year",
-            "Mileage": "mileage",
-            "Fuel Type": "fuel_type",
-            "Transmission": "transmission",
-            "Engine Size": "engine_size",
-            "Body Type": "body_type",
-            "Colour": "colour",
-            "Doors": "doors",
-            "Seats": "seats",
-            "NCT Expiry": "nct_expiry",
-            "County": "county",
-            "Seller Type": "seller_type",
-            "Power": "horsepower",
-            "Trim Level": "trim",
-        }
-        
-        normalized_ads = []
-        for ad in ads:
-            normalized = {
-                "id": ad.get("id", ""),
-                "url": ad.get("url", ""),
-                "phone": ad.get("phone", "Hidden"),
-                "title": ad.get("title", ""),
-                "price": ad.get("price", ""),
-            }
-            
-            for donedeal_key, standard_key in field_mapping.items():
-                if donedeal_key in ad:
-                    normalized[standard_key] = ad[donedeal_key]
-            
-            for key, value in ad.items():
-                if key not in ["id", "url", "phone", "title", "price"] and key not in field_mapping:
-                    clean_key = key.lower().replace(" ", "_").replace("/", "_")
-                    normalized[clean_key] = value
-            
-            normalized_ads.append(normalized)
+        normalized_ads = [normalize_ad(ad) for ad in ads]
         
         all_keys = set()
         for ad in normalized_ads:
             all_keys.update(ad.keys())
         
-        extra_fields = sorted([k for k in all_keys if k not in standard_fields])
-        fieldnames = [f for f in standard_fields if f in all_keys] + extra_fields
+        fieldnames = order_fields(all_keys)
         
         file_exists = os.path.exists(filename)
         mode = 'a' if append else 'w'